@@ -12,7 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import asyncpg
 
 from ..core.config.settings import get_settings
-from ..core.events.store import EventStore, EventPublisher
+from ..core.events.store import EventStore, EventPublisher, init_connection
 from ..core.events.projections import ProjectionManager, TaskProjection
 from ..core.auth.service import AuthService
 from ..core.memory.service import SemanticMemoryService, EmbeddingService
@@ -30,7 +30,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app_state.pool = await asyncpg.create_pool(
         settings.database_url,
         min_size=5,
-        max_size=settings.database_pool_size
+        max_size=settings.database_pool_size,
+        statement_cache_size=settings.database_statement_cache_size,
+        max_cached_statement_lifetime=settings.database_statement_cache_lifetime,
+        init=init_connection
     )
 
     # Initialize event store
@@ -126,8 +126,7 @@ async def create_task(
     )
 
     # Apply to projections
-    for e in events:
-        await state.projection_manager.apply_event(e)
+    await state.projection_manager.apply_events(events)
 
     return TaskResponse(
         id=str(task_id),
@@ -322,8 +321,7 @@ async def update_task(
         org_id=current_user.org_id
     )
 
-    for e in events:
-        await state.projection_manager.apply_event(e)
+    await state.projection_manager.apply_events(events)
 
     return await get_task(str(task_uuid), current_user)
 
@@ -398,8 +396,7 @@ async def assign_task(
         org_id=current_user.org_id
     )
 
-    for e in events:
-        await state.projection_manager.apply_event(e)
+    await state.projection_manager.apply_events(events)
 
     # Also update status to in_progress
     await _update_task_status(str(task_uuid), "in_progress", current_user)
@@ -455,8 +452,7 @@ async def delete_task(
         org_id=current_user.org_id
     )
 
-    for e in events:
-        await state.projection_manager.apply_event(e)
+    await state.projection_manager.apply_events(events)
 
 
 async def _update_task_status(
@@ -494,7 +490,6 @@ async def _update_task_status(
         org_id=current_user.org_id
     )
 
-    for e in events:
-        await state.projection_manager.apply_event(e)
+    await state.projection_manager.apply_events(events)
 
     return await get_task(task_id, current_user)
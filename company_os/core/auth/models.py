@@ -19,6 +19,17 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
+_ROLES_BY_VALUE: dict[str, UserRole] = {role.value: role for role in UserRole}
+
+
+def role_from_string(value: str) -> UserRole:
+    """Look up a UserRole by its string value (e.g. from a DB row or token)."""
+    try:
+        return _ROLES_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid UserRole") from None
+
+
 class Permission(str, Enum):
     """Granular permissions."""
     # Task permissions
@@ -47,33 +58,79 @@ class Permission(str, Enum):
     # Admin permissions
     ADMIN_FULL = "admin:full"
 
+    @property
+    def mask(self) -> int:
+        """Single-bit mask for this permission (see ROLE_PERMISSION_MASKS)."""
+        return _PERMISSION_BITS[self]
+
+
+# One bit per permission in declaration order; all 16 fit in a uint16
+_PERMISSION_BITS: dict[Permission, int] = {
+    perm: 1 << bit for bit, perm in enumerate(Permission)
+}
+
+
+# String values as carried in token claims, for plain-string membership checks
+PERMISSION_VALUES: frozenset[str] = frozenset(perm.value for perm in Permission)
+
+
+def permissions_mask(permissions) -> int:
+    """Fold an iterable of permissions into a bitmask."""
+    mask = 0
+    for perm in permissions:
+        mask |= _PERMISSION_BITS[perm]
+    return mask
+
+
+# Role permission mappings, built as a chain: viewer < member < admin < owner
+# (frozen: shared, read-only lookup tables)
+_VIEWER_PERMISSIONS = frozenset({
+    Permission.TASKS_READ,
+    Permission.AGENTS_VIEW,
+    Permission.PROJECTS_READ,
+})
+_MEMBER_PERMISSIONS = _VIEWER_PERMISSIONS | {
+    Permission.TASKS_CREATE, Permission.TASKS_UPDATE, Permission.TASKS_ASSIGN,
+    Permission.AGENTS_ACTIVATE,
+}
+_ADMIN_PERMISSIONS = _MEMBER_PERMISSIONS | {
+    Permission.TASKS_DELETE,
+    Permission.AGENTS_CONFIGURE,
+    Permission.PROJECTS_CREATE, Permission.PROJECTS_UPDATE, Permission.PROJECTS_DELETE,
+    Permission.ORG_MEMBERS,
+}
+_OWNER_PERMISSIONS = frozenset(Permission)  # All permissions
+
+ROLE_PERMISSIONS: dict[UserRole, frozenset[Permission]] = {
+    UserRole.OWNER: _OWNER_PERMISSIONS,
+    UserRole.ADMIN: _ADMIN_PERMISSIONS,
+    UserRole.MEMBER: _MEMBER_PERMISSIONS,
+    UserRole.VIEWER: _VIEWER_PERMISSIONS,
+}
 
-# Role permission mappings
-ROLE_PERMISSIONS: dict[UserRole, set[Permission]] = {
-    UserRole.OWNER: set(Permission),  # All permissions
-    UserRole.ADMIN: {
-        Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
-        Permission.TASKS_DELETE, Permission.TASKS_ASSIGN,
-        Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW, Permission.AGENTS_CONFIGURE,
-        Permission.PROJECTS_CREATE, Permission.PROJECTS_READ, Permission.PROJECTS_UPDATE,
-        Permission.PROJECTS_DELETE,
-        Permission.ORG_MEMBERS,
-    },
-    UserRole.MEMBER: {
-        Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
-        Permission.TASKS_ASSIGN,
-        Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW,
-        Permission.PROJECTS_READ,
-    },
-    UserRole.VIEWER: {
-        Permission.TASKS_READ,
-        Permission.AGENTS_VIEW,
-        Permission.PROJECTS_READ,
-    },
+# Bitmask form of ROLE_PERMISSIONS: subset checks become (a & b) == a
+ROLE_PERMISSION_MASKS: dict[UserRole, int] = {
+    role: permissions_mask(perms) for role, perms in ROLE_PERMISSIONS.items()
 }
 
 
-@dataclass
+def _epoch_or_none(value: Optional[datetime]) -> Optional[int]:
+    """Whole epoch seconds for an optional datetime."""
+    return int(value.timestamp()) if value is not None else None
+
+
+class _Expiring:
+    """Mixin for entities with an optional expiry cached as epoch seconds."""
+    __slots__ = ()
+
+    _expires_epoch: Optional[int]
+
+    def is_expired(self, now_epoch: int) -> bool:
+        """Check expiry against a caller-supplied int(time.time())."""
+        return self._expires_epoch is not None and now_epoch >= self._expires_epoch
+
+
+@dataclass(slots=True, frozen=True)
 class User:
     """User entity."""
     id: UUID
@@ -89,7 +146,7 @@ class User:
     preferences: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Organization:
     """Organization entity."""
     id: UUID
@@ -102,7 +159,7 @@ class Organization:
     limits: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrgMembership:
     """User membership in an organization."""
     user_id: UUID
@@ -112,8 +169,8 @@ class OrgMembership:
     invited_by: Optional[UUID] = None
 
 
-@dataclass
-class OAuthAccount:
+@dataclass(slots=True, frozen=True)
+class OAuthAccount(_Expiring):
     """Linked OAuth account."""
     id: UUID
     user_id: UUID
@@ -125,10 +182,14 @@ class OAuthAccount:
     token_expires_at: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    _expires_epoch: Optional[int] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        object.__setattr__(self, "_expires_epoch", _epoch_or_none(self.token_expires_at))
 
-@dataclass
-class APIKey:
+
+@dataclass(slots=True, frozen=True)
+class APIKey(_Expiring):
     """API key for programmatic access."""
     id: UUID
     org_id: UUID
@@ -141,10 +202,14 @@ class APIKey:
     expires_at: Optional[datetime]
     created_at: datetime
     is_active: bool = True
+    _expires_epoch: Optional[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_expires_epoch", _epoch_or_none(self.expires_at))
 
 
-@dataclass
-class RefreshToken:
+@dataclass(slots=True, frozen=True)
+class RefreshToken(_Expiring):
     """Refresh token for token rotation."""
     id: UUID
     user_id: UUID
@@ -154,9 +219,13 @@ class RefreshToken:
     expires_at: datetime
     created_at: datetime
     revoked_at: Optional[datetime] = None
+    _expires_epoch: Optional[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_expires_epoch", _epoch_or_none(self.expires_at))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenPair:
     """Access and refresh token pair."""
     access_token: str
@@ -165,7 +234,7 @@ class TokenPair:
     expires_in: int = 900  # 15 minutes in seconds
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TokenPayload:
     """JWT token payload."""
     sub: str  # User ID
@@ -175,3 +244,11 @@ class TokenPayload:
     exp: datetime
     iat: datetime
     jti: str  # Unique token ID
+    expires_in_seconds: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Whole seconds from epoch ints, computed once per decoded token
+        object.__setattr__(
+            self, "expires_in_seconds",
+            int(self.exp.timestamp()) - int(self.iat.timestamp())
+        )
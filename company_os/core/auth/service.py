@@ -18,7 +18,7 @@ from ..config.settings import Settings
 from .models import (
     User, Organization, OrgMembership, OAuthAccount, APIKey,
     RefreshToken, TokenPair, TokenPayload, UserRole, Permission,
-    ROLE_PERMISSIONS
+    ROLE_PERMISSIONS, role_from_string
 )
 
 
@@ -305,7 +305,7 @@ class AuthService:
         """
         # Get user role in organization
         role = await self._get_user_role(user.id, org.id)
-        permissions = [p.value for p in ROLE_PERMISSIONS.get(role, set())]
+        permissions = [p.value for p in ROLE_PERMISSIONS.get(role, frozenset())]
 
         now = datetime.now(timezone.utc)
         jti = str(uuid4())
@@ -476,7 +476,7 @@ class AuthService:
             if not role:
                 raise AuthorizationError("User not member of organization")
 
-            return UserRole(role)
+            return role_from_string(role)
 
     def check_permission(
         self,
@@ -26,6 +26,10 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    # asyncpg prepares and caches every query per connection; size the cache
+    # for all event store / service statements so hot queries skip re-parsing
+    database_statement_cache_size: int = 1024
+    database_statement_cache_lifetime: int = 300  # seconds
 
     # Redis
     redis_url: str = Field(
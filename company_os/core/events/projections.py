@@ -5,15 +5,17 @@ Transforms event streams into read models.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
 from typing import Any, Optional
 from uuid import UUID
-import json
+import asyncio
 
 import asyncpg
 
-from .store import Event, EventStore
+from .store import Event, EventStore, raise_first
 
 
 class Projection(ABC):
@@ -24,6 +26,11 @@ class Projection(ABC):
         """Apply an event to update the read model."""
         pass
 
+    async def apply_batch(self, events: list[Event]) -> None:
+        """Apply events in order; override to batch database writes."""
+        for event in events:
+            await self.apply(event)
+
     @abstractmethod
     async def rebuild(self, event_store: EventStore) -> None:
         """Rebuild the entire projection from event history."""
@@ -50,8 +57,45 @@ class TaskReadModel:
     metadata: dict[str, Any]
 
 
+# Column order for COPY into tasks_read_model
+_TASK_COLUMNS = [f.name for f in fields(TaskReadModel)]
+
+
+def _to_uuid(value: Any) -> UUID:
+    """Return value as a UUID, parsing only when it is not one already."""
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+# Fields a TaskUpdated event may change, in SET-list order
+_UPDATABLE_FIELDS = ("title", "description", "priority", "due_date", "tags")
+
+
+@lru_cache(maxsize=None)
+def _update_sql(columns: tuple[str, ...]) -> str:
+    """
+    UPDATE statement for one TaskUpdated field set.
+
+    Built once per shape so every event with the same fields sends identical
+    text and hits the connection's prepared statement cache.
+    """
+    updates = [f"{field} = ${i}" for i, field in enumerate(columns, 1)]
+    updates.append(f"updated_at = ${len(columns) + 1}")
+    return f"""
+        UPDATE tasks_read_model
+        SET {', '.join(updates)}
+        WHERE id = ${len(columns) + 2}
+    """
+
+
 class TaskProjection(Projection):
-    """Projects task events into read model."""
+    """
+    Projects task events into read model.
+
+    The pool must be created with ``init=init_connection`` from the event
+    store: task metadata is passed to jsonb parameters (and COPY) as dicts,
+    which asyncpg's default text jsonb codec rejects with "expected str,
+    got dict".
+    """
 
     EVENT_HANDLERS = {
         "TaskCreated": "_handle_created",
@@ -62,141 +106,287 @@ class TaskProjection(Projection):
         "TaskDeleted": "_handle_deleted",
     }
 
+    _SQL_INSERT = """
+        INSERT INTO tasks_read_model
+        (id, org_id, title, description, status, priority, project_id,
+         created_by, created_at, updated_at, due_date, tags, metadata)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $9, $10, $11, $12)
+    """
+
+    _SQL_ASSIGN = """
+        UPDATE tasks_read_model
+        SET assigned_agent = $1,
+            assigned_user_id = $2,
+            updated_at = $3
+        WHERE id = $4
+    """
+
+    _SQL_STATUS = """
+        UPDATE tasks_read_model
+        SET status = $1, updated_at = $2
+        WHERE id = $3
+    """
+
+    _SQL_COMPLETE = """
+        UPDATE tasks_read_model
+        SET status = 'completed',
+            updated_at = $1,
+            metadata = COALESCE(metadata, '{}'::jsonb) || $2
+        WHERE id = $3
+    """
+
+    _SQL_DELETE = "DELETE FROM tasks_read_model WHERE id = $1"
+
+    # Event types whose statement text is fixed, so a run of them can go
+    # out as one executemany: event_type -> (SQL attribute, args builder)
+    _BATCHABLE = {
+        "TaskCreated": ("_SQL_INSERT", "_created_args"),
+        "TaskAssigned": ("_SQL_ASSIGN", "_assigned_args"),
+        "TaskStatusChanged": ("_SQL_STATUS", "_status_changed_args"),
+        "TaskCompleted": ("_SQL_COMPLETE", "_completed_args"),
+        "TaskDeleted": ("_SQL_DELETE", "_deleted_args"),
+    }
+
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        # Bound handlers and batch statements, resolved once per projection
+        self._handlers = {
+            event_type: getattr(self, handler_name)
+            for event_type, handler_name in self.EVENT_HANDLERS.items()
+        }
+        self._batchers = {
+            event_type: (getattr(self, sql_name), getattr(self, args_name))
+            for event_type, (sql_name, args_name) in self._BATCHABLE.items()
+        }
 
     async def apply(self, event: Event) -> None:
         """Apply a task event."""
-        handler_name = self.EVENT_HANDLERS.get(event.event_type)
-        if handler_name:
-            handler = getattr(self, handler_name)
-            await handler(event)
-
-    async def rebuild(self, event_store: EventStore) -> None:
-        """Rebuild task read model from all events."""
+        handler = self._handlers.get(event.event_type)
+        if handler:
+            async with self.pool.acquire() as conn:
+                await handler(conn, event)
+
+    async def _apply_on_conn(self, conn: asyncpg.Connection, event: Event) -> None:
+        """Apply a task event on an already acquired connection."""
+        handler = self._handlers.get(event.event_type)
+        if handler:
+            await handler(conn, event)
+
+    async def apply_batch(self, events: list[Event]) -> None:
+        """
+        Apply task events in order on one connection.
+
+        Each run of consecutive same-type events with a fixed statement is
+        sent as a single executemany; TaskUpdated, whose SET list depends on
+        the event, is applied one event at a time.
+        """
         async with self.pool.acquire() as conn:
-            # Clear existing read model
-            await conn.execute("TRUNCATE TABLE tasks_read_model")
+            for event_type, run in groupby(events, key=lambda e: e.event_type):
+                handler = self._handlers.get(event_type)
+                if handler is None:
+                    continue
 
-            # Replay all task events
-            async for event in event_store.read_all(
-                event_types=list(self.EVENT_HANDLERS.keys())
-            ):
-                await self.apply(event)
+                batcher = self._batchers.get(event_type)
+                if batcher is None:
+                    for event in run:
+                        await handler(conn, event)
+                    continue
 
-    async def _handle_created(self, event: Event) -> None:
-        """Handle TaskCreated event."""
-        data = event.event_data
+                sql, build_args = batcher
+                await conn.executemany(sql, [build_args(event) for event in run])
+
+    async def rebuild(self, event_store: EventStore) -> None:
+        """
+        Rebuild task read model from all events.
+
+        The whole replay runs on one connection inside one transaction. The
+        TRUNCATE holds an ACCESS EXCLUSIVE lock on tasks_read_model until
+        commit, so every read of the table (task list/get included) blocks
+        for the duration of the rebuild.
+
+        Events are folded into in-memory read models and written with a
+        single binary COPY. If an event cannot be folded (it references a
+        task that does not exist, or re-creates one that does), the tasks
+        folded so far are copied and the rest of the stream is replayed
+        event by event, so the database reports the same outcome as before.
+        """
         async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO tasks_read_model
-                (id, org_id, title, description, status, priority, project_id,
-                 created_by, created_at, updated_at, due_date, tags, metadata)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $9, $10, $11, $12)
-                """,
-                UUID(data["id"]),
-                UUID(data["org_id"]),
-                data["title"],
-                data.get("description", ""),
-                "pending",
-                data.get("priority", "medium"),
-                UUID(data["project_id"]) if data.get("project_id") else None,
-                UUID(data["created_by"]),
-                event.created_at,
-                data.get("due_date"),
-                data.get("tags", []),
-                json.dumps(data.get("metadata", {}))
+            async with conn.transaction():
+                # Clear existing read model
+                await conn.execute("TRUNCATE TABLE tasks_read_model")
+
+                tasks: dict[UUID, TaskReadModel] = {}
+                folding = True
+                async for event in event_store.read_all(
+                    event_types=list(self.EVENT_HANDLERS.keys())
+                ):
+                    if folding:
+                        if self._fold(tasks, event):
+                            continue
+                        # Flush what folded cleanly, then replay per event
+                        await self._copy_tasks(conn, tasks)
+                        folding = False
+                    await self._apply_on_conn(conn, event)
+
+                if folding:
+                    await self._copy_tasks(conn, tasks)
+
+    @staticmethod
+    def _fold(tasks: dict[UUID, TaskReadModel], event: Event) -> bool:
+        """
+        Apply a task event to in-memory read models.
+
+        Mirrors the SQL handlers. Returns False, leaving tasks untouched,
+        when the event does not fold cleanly onto the current state.
+        """
+        data = event.event_data
+        task_id = _to_uuid(data["id"])
+        event_type = event.event_type
+
+        if event_type == "TaskCreated":
+            if task_id in tasks:
+                return False
+            tasks[task_id] = TaskReadModel(
+                id=task_id,
+                org_id=_to_uuid(data["org_id"]),
+                title=data["title"],
+                description=data.get("description", ""),
+                status="pending",
+                priority=data.get("priority", "medium"),
+                project_id=_to_uuid(data["project_id"]) if data.get("project_id") else None,
+                assigned_agent=None,
+                assigned_user_id=None,
+                created_by=_to_uuid(data["created_by"]),
+                created_at=event.created_at,
+                updated_at=event.created_at,
+                due_date=data.get("due_date"),
+                tags=data.get("tags", []),
+                metadata=dict(data.get("metadata") or {})
             )
-
-    async def _handle_updated(self, event: Event) -> None:
-        """Handle TaskUpdated event."""
+            return True
+
+        task = tasks.get(task_id)
+        if task is None:
+            return False
+
+        if event_type == "TaskUpdated":
+            changed = False
+            for field in _UPDATABLE_FIELDS:
+                if field in data:
+                    setattr(task, field, data[field])
+                    changed = True
+            if changed:
+                task.updated_at = event.created_at
+        elif event_type == "TaskAssigned":
+            task.assigned_agent = data.get("agent_type")
+            task.assigned_user_id = _to_uuid(data["user_id"]) if data.get("user_id") else None
+            task.updated_at = event.created_at
+        elif event_type == "TaskStatusChanged":
+            task.status = data["status"]
+            task.updated_at = event.created_at
+        elif event_type == "TaskCompleted":
+            task.status = "completed"
+            task.updated_at = event.created_at
+            task.metadata["completion_result"] = data.get("result", {})
+        elif event_type == "TaskDeleted":
+            del tasks[task_id]
+        return True
+
+    @staticmethod
+    async def _copy_tasks(
+        conn: asyncpg.Connection,
+        tasks: dict[UUID, TaskReadModel]
+    ) -> None:
+        """Write folded read models with one COPY."""
+        if not tasks:
+            return
+        await conn.copy_records_to_table(
+            "tasks_read_model",
+            records=[
+                tuple(getattr(task, name) for name in _TASK_COLUMNS)
+                for task in tasks.values()
+            ],
+            columns=_TASK_COLUMNS
+        )
+
+    @staticmethod
+    def _created_args(event: Event) -> tuple:
+        data = event.event_data
+        return (
+            _to_uuid(data["id"]),
+            _to_uuid(data["org_id"]),
+            data["title"],
+            data.get("description", ""),
+            "pending",
+            data.get("priority", "medium"),
+            _to_uuid(data["project_id"]) if data.get("project_id") else None,
+            _to_uuid(data["created_by"]),
+            event.created_at,
+            data.get("due_date"),
+            data.get("tags", []),
+            data.get("metadata") or {}
+        )
+
+    @staticmethod
+    def _assigned_args(event: Event) -> tuple:
         data = event.event_data
-        updates = []
-        params = []
-        param_count = 1
+        return (
+            data.get("agent_type"),
+            _to_uuid(data["user_id"]) if data.get("user_id") else None,
+            event.created_at,
+            _to_uuid(data["id"])
+        )
+
+    @staticmethod
+    def _status_changed_args(event: Event) -> tuple:
+        data = event.event_data
+        return (data["status"], event.created_at, _to_uuid(data["id"]))
 
-        for field in ["title", "description", "priority", "due_date", "tags"]:
-            if field in data:
-                updates.append(f"{field} = ${param_count}")
-                params.append(data[field])
-                param_count += 1
+    @staticmethod
+    def _completed_args(event: Event) -> tuple:
+        data = event.event_data
+        return (
+            event.created_at,
+            {"completion_result": data.get("result", {})},
+            _to_uuid(data["id"])
+        )
 
-        if updates:
-            updates.append(f"updated_at = ${param_count}")
-            params.append(event.created_at)
-            param_count += 1
+    @staticmethod
+    def _deleted_args(event: Event) -> tuple:
+        return (_to_uuid(event.event_data["id"]),)
 
-            params.append(UUID(data["id"]))
+    async def _handle_created(self, conn: asyncpg.Connection, event: Event) -> None:
+        """Handle TaskCreated event."""
+        await conn.execute(self._SQL_INSERT, *self._created_args(event))
 
-            async with self.pool.acquire() as conn:
-                await conn.execute(
-                    f"""
-                    UPDATE tasks_read_model
-                    SET {', '.join(updates)}
-                    WHERE id = ${param_count}
-                    """,
-                    *params
-                )
-
-    async def _handle_assigned(self, event: Event) -> None:
-        """Handle TaskAssigned event."""
+    async def _handle_updated(self, conn: asyncpg.Connection, event: Event) -> None:
+        """Handle TaskUpdated event."""
         data = event.event_data
-        async with self.pool.acquire() as conn:
+        columns = tuple(field for field in _UPDATABLE_FIELDS if field in data)
+
+        if columns:
             await conn.execute(
-                """
-                UPDATE tasks_read_model
-                SET assigned_agent = $1,
-                    assigned_user_id = $2,
-                    updated_at = $3
-                WHERE id = $4
-                """,
-                data.get("agent_type"),
-                UUID(data["user_id"]) if data.get("user_id") else None,
+                _update_sql(columns),
+                *(data[field] for field in columns),
                 event.created_at,
-                UUID(data["id"])
+                _to_uuid(data["id"])
             )
 
-    async def _handle_status_changed(self, event: Event) -> None:
+    async def _handle_assigned(self, conn: asyncpg.Connection, event: Event) -> None:
+        """Handle TaskAssigned event."""
+        await conn.execute(self._SQL_ASSIGN, *self._assigned_args(event))
+
+    async def _handle_status_changed(self, conn: asyncpg.Connection, event: Event) -> None:
         """Handle TaskStatusChanged event."""
-        data = event.event_data
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE tasks_read_model
-                SET status = $1, updated_at = $2
-                WHERE id = $3
-                """,
-                data["status"],
-                event.created_at,
-                UUID(data["id"])
-            )
+        await conn.execute(self._SQL_STATUS, *self._status_changed_args(event))
 
-    async def _handle_completed(self, event: Event) -> None:
+    async def _handle_completed(self, conn: asyncpg.Connection, event: Event) -> None:
         """Handle TaskCompleted event."""
-        data = event.event_data
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE tasks_read_model
-                SET status = 'completed',
-                    updated_at = $1,
-                    metadata = metadata || $2
-                WHERE id = $3
-                """,
-                event.created_at,
-                json.dumps({"completion_result": data.get("result", {})}),
-                UUID(data["id"])
-            )
+        await conn.execute(self._SQL_COMPLETE, *self._completed_args(event))
 
-    async def _handle_deleted(self, event: Event) -> None:
+    async def _handle_deleted(self, conn: asyncpg.Connection, event: Event) -> None:
         """Handle TaskDeleted event."""
-        data = event.event_data
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                "DELETE FROM tasks_read_model WHERE id = $1",
-                UUID(data["id"])
-            )
+        await conn.execute(self._SQL_DELETE, *self._deleted_args(event))
 
 
 class ProjectionManager:
@@ -212,11 +402,28 @@ class ProjectionManager:
         self.projections.append(projection)
 
     async def apply_event(self, event: Event) -> None:
-        """Apply event to all projections."""
-        for projection in self.projections:
-            await projection.apply(event)
+        """
+        Apply event to all projections.
+
+        Projections run concurrently; the first failure is re-raised once
+        every projection has finished.
+        """
+        raise_first(await asyncio.gather(
+            *(projection.apply(event) for projection in self.projections),
+            return_exceptions=True
+        ))
+
+    async def apply_events(self, events: list[Event]) -> None:
+        """Apply a batch of events to all projections concurrently."""
+        raise_first(await asyncio.gather(
+            *(projection.apply_batch(events) for projection in self.projections),
+            return_exceptions=True
+        ))
 
     async def rebuild_all(self) -> None:
-        """Rebuild all projections from event history."""
-        for projection in self.projections:
-            await projection.rebuild(self.event_store)
+        """Rebuild all projections from event history concurrently."""
+        raise_first(await asyncio.gather(
+            *(projection.rebuild(self.event_store) for projection in self.projections),
+            return_exceptions=True
+        ))
+
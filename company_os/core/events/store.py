@@ -4,16 +4,67 @@ Event Store Implementation.
 PostgreSQL-based event sourcing with optimistic concurrency control.
 """
 
+import asyncio
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, AsyncIterator, Callable
+from typing import Any, Optional, AsyncIterator, Callable, Iterable
 from uuid import UUID, uuid4
-import json
 
 import asyncpg
+import orjson
 
 
-@dataclass
+def _dump_json(value: Any) -> str:
+    """Encode a JSONB parameter (asyncpg's default jsonb codec takes text)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _load_json(value: Any) -> Any:
+    """Decode a JSONB column if the driver returned it as text."""
+    return orjson.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+# JSONB binary wire format: a version byte (1) followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Binary jsonb encoder; text is taken as already-serialized JSON."""
+    if isinstance(value, str):
+        return _JSONB_VERSION + value.encode()
+    return _JSONB_VERSION + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Binary jsonb decoder, parsing straight from the wire bytes."""
+    return orjson.loads(data[1:])
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Pool ``init`` hook that exchanges jsonb in binary format.
+
+    Rows come back as Python objects without an intermediate str, and
+    callers that still pass json.dumps() text keep working.
+    """
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary"
+    )
+
+
+# Column order Event.from_row reads records in
+_EVENT_COLUMNS = (
+    "id, stream_id, stream_version, event_type, event_data, metadata, created_at"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Event:
     """Immutable event record."""
     id: int
@@ -26,19 +77,25 @@ class Event:
 
     @classmethod
     def from_row(cls, row: asyncpg.Record) -> "Event":
-        """Create Event from database row."""
+        """
+        Create Event from database row.
+
+        Records are read by position, so queries must select _EVENT_COLUMNS
+        first and in order; extra trailing columns are ignored. event_type
+        is interned: few distinct types repeat across many rows.
+        """
         return cls(
-            id=row["id"],
-            stream_id=row["stream_id"],
-            stream_version=row["stream_version"],
-            event_type=row["event_type"],
-            event_data=json.loads(row["event_data"]) if isinstance(row["event_data"], str) else row["event_data"],
-            metadata=json.loads(row["metadata"]) if isinstance(row["metadata"], str) else row["metadata"],
-            created_at=row["created_at"]
+            row[0],
+            row[1],
+            row[2],
+            sys.intern(row[3]),
+            _load_json(row[4]),
+            _load_json(row[5]),
+            row[6]
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NewEvent:
     """Event to be appended."""
     event_type: str
@@ -97,48 +154,104 @@ class EventStore:
         if not events:
             return []
 
+        # append_events (migrations/006) takes a per-stream advisory lock,
+        # checks the version and inserts the batch in one server round trip.
+        # Writers to the same stream serialize on the lock, so a stale
+        # expected_version becomes OptimisticConcurrencyError rather than a
+        # unique violation; other streams never contend.
+        # Every returned row carries current_version; when the check fails
+        # nothing is inserted and a single row with NULL event columns comes back.
         async with self.pool.acquire() as conn:
-            async with conn.transaction():
-                # Get current stream version
-                current_version = await conn.fetchval(
-                    """
-                    SELECT COALESCE(MAX(stream_version), -1)
-                    FROM events
-                    WHERE stream_id = $1
-                    """,
-                    stream_id
+            rows = await conn.fetch(
+                f"""
+                SELECT {_EVENT_COLUMNS}, current_version
+                FROM append_events($1, $2, $3, $4, $5, $6)
+                """,
+                stream_id,
+                expected_version,
+                [event.event_type for event in events],
+                [_dump_json(event.event_data) for event in events],
+                [_dump_json(event.metadata) for event in events],
+                org_id
+            )
+
+        if rows[0]["id"] is None:
+            raise OptimisticConcurrencyError(
+                stream_id, expected_version, rows[0]["current_version"]
+            )
+
+        # RETURNING order is not guaranteed; restore version order
+        return sorted(
+            (Event.from_row(row) for row in rows),
+            key=lambda event: event.stream_version
+        )
+
+    async def bulk_append_unsafe(
+        self,
+        events: Iterable[tuple[str, int, NewEvent]],
+        org_id: Optional[UUID] = None
+    ) -> int:
+        """
+        Bulk-load events with COPY, for replays and migrations.
+
+        Skips optimistic concurrency entirely: callers assign every
+        stream_version themselves. A clash with an existing version still
+        fails the whole load on the unique constraint. Not for online writes.
+
+        Args:
+            events: (stream_id, stream_version, event) tuples
+            org_id: Organization ID for multi-tenancy
+
+        Returns:
+            Number of events loaded
+        """
+        def records():
+            for stream_id, stream_version, event in events:
+                yield (
+                    stream_id,
+                    stream_version,
+                    event.event_type,
+                    _dump_json(event.event_data),
+                    _dump_json(event.metadata),
+                    org_id
+                )
+
+        async with self.pool.acquire() as conn:
+            status = await conn.copy_records_to_table(
+                "events",
+                records=records(),
+                columns=(
+                    "stream_id", "stream_version", "event_type",
+                    "event_data", "metadata", "org_id"
                 )
+            )
+
+        # Command status is "COPY <n>"
+        return int(status.split()[-1])
+
+    def _stream_query(
+        self,
+        stream_id: str,
+        from_version: int,
+        to_version: Optional[int],
+        limit: int
+    ) -> tuple[str, list]:
+        """Build the read query and parameters for a stream range."""
+        query = f"""
+            SELECT {_EVENT_COLUMNS}
+            FROM events
+            WHERE stream_id = $1 AND stream_version >= $2
+        """
+        params = [stream_id, from_version]
+
+        if to_version is not None:
+            query += " AND stream_version <= $3"
+            params.append(to_version)
+
+        query += " ORDER BY stream_version ASC LIMIT $" + str(len(params) + 1)
+        params.append(limit)
 
-                # Check concurrency
-                if expected_version != -1 and current_version != expected_version:
-                    raise OptimisticConcurrencyError(
-                        stream_id, expected_version, current_version
-                    )
-
-                # Append events
-                appended = []
-                version = current_version + 1
-
-                for event in events:
-                    row = await conn.fetchrow(
-                        """
-                        INSERT INTO events
-                        (stream_id, stream_version, event_type, event_data, metadata, org_id)
-                        VALUES ($1, $2, $3, $4, $5, $6)
-                        RETURNING id, stream_id, stream_version, event_type,
-                                  event_data, metadata, created_at
-                        """,
-                        stream_id,
-                        version,
-                        event.event_type,
-                        json.dumps(event.event_data),
-                        json.dumps(event.metadata),
-                        org_id
-                    )
-                    appended.append(Event.from_row(row))
-                    version += 1
-
-                return appended
+        return query, params
 
     async def read_stream(
         self,
@@ -159,24 +272,45 @@ class EventStore:
         Returns:
             List of events in version order
         """
-        query = """
-            SELECT id, stream_id, stream_version, event_type,
-                   event_data, metadata, created_at
-            FROM events
-            WHERE stream_id = $1 AND stream_version >= $2
+        query, params = self._stream_query(stream_id, from_version, to_version, limit)
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+            return [Event.from_row(row) for row in rows]
+
+    async def iter_stream(
+        self,
+        stream_id: str,
+        from_version: int = 0,
+        to_version: Optional[int] = None,
+        limit: int = 1000,
+        prefetch: int = 256
+    ) -> AsyncIterator[Event]:
         """
-        params = [stream_id, from_version]
+        Stream events from a stream through a server-side cursor.
 
-        if to_version is not None:
-            query += " AND stream_version <= $3"
-            params.append(to_version)
+        Unlike read_stream, rows are fetched prefetch at a time, so memory
+        stays bounded and the first event is available before the rest of
+        the stream has been read. The connection is held until iteration
+        finishes.
 
-        query += " ORDER BY stream_version ASC LIMIT $" + str(len(params) + 1)
-        params.append(limit)
+        Args:
+            stream_id: Stream to read
+            from_version: Start version (inclusive)
+            to_version: End version (inclusive), None for all
+            limit: Maximum events to yield
+            prefetch: Rows fetched per cursor round-trip
+
+        Yields:
+            Events in version order
+        """
+        query, params = self._stream_query(stream_id, from_version, to_version, limit)
 
         async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [Event.from_row(row) for row in rows]
+            # Cursors only exist inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(query, *params, prefetch=prefetch):
+                    yield Event.from_row(row)
 
     async def read_all(
         self,
@@ -196,46 +330,53 @@ class EventStore:
             Events in global order
         """
         position = from_position
+        # One statement text for filtered and unfiltered reads, so both share
+        # a single cached prepared statement
+        types = list(event_types) if event_types else None
 
         while True:
-            query = """
-                SELECT id, stream_id, stream_version, event_type,
-                       event_data, metadata, created_at
-                FROM events
-                WHERE id > $1
-            """
-            params = [position]
-
-            if event_types:
-                query += " AND event_type = ANY($2)"
-                params.append(event_types)
-
-            query += " ORDER BY id ASC LIMIT $" + str(len(params) + 1)
-            params.append(batch_size)
-
             async with self.pool.acquire() as conn:
-                rows = await conn.fetch(query, *params)
-
-            if not rows:
-                break
+                rows = await conn.fetch(
+                    f"""
+                    SELECT {_EVENT_COLUMNS}
+                    FROM events
+                    WHERE id > $1
+                      AND ($2::text[] IS NULL OR event_type = ANY($2))
+                    ORDER BY id ASC
+                    LIMIT $3
+                    """,
+                    position,
+                    types,
+                    batch_size
+                )
 
             for row in rows:
                 event = Event.from_row(row)
                 yield event
                 position = event.id
 
+            # A short batch means the end was reached; skip the empty fetch
+            if len(rows) < batch_size:
+                break
+
     async def get_stream_version(self, stream_id: str) -> int:
-        """Get current version of a stream (-1 if doesn't exist)."""
+        """
+        Get current version of a stream (-1 if doesn't exist).
+
+        Always read from stream_versions (a primary-key lookup): callers pass
+        the result to append as expected_version, and a per-process cache
+        goes stale as soon as another worker appends to the stream.
+        """
         async with self.pool.acquire() as conn:
-            version = await conn.fetchval(
+            return await conn.fetchval(
                 """
-                SELECT COALESCE(MAX(stream_version), -1)
-                FROM events
-                WHERE stream_id = $1
+                SELECT COALESCE(
+                    (SELECT version FROM stream_versions WHERE stream_id = $1),
+                    -1
+                )
                 """,
                 stream_id
             )
-            return version
 
     async def stream_exists(self, stream_id: str) -> bool:
         """Check if a stream exists."""
@@ -246,24 +387,77 @@ class EventPublisher:
     """Publishes events to subscribers (for real-time projections)."""
 
     def __init__(self):
-        self._subscribers: dict[str, list[Callable]] = {}
+        self._subscribers: defaultdict[str, list[Callable]] = defaultdict(list)
+        # event_type -> type-specific + wildcard handlers, rebuilt lazily
+        # after any subscribe
+        self._resolved: dict[str, tuple[Callable, ...]] = {}
 
     def subscribe(self, event_type: str, handler: Callable):
         """Subscribe to an event type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+        self._subscribers[sys.intern(event_type)].append(handler)
+        self._resolved.clear()
 
     def subscribe_all(self, handler: Callable):
         """Subscribe to all events."""
         self.subscribe("*", handler)
 
     async def publish(self, event: Event):
-        """Publish an event to subscribers."""
-        # Type-specific subscribers
-        for handler in self._subscribers.get(event.event_type, []):
-            await handler(event)
-
-        # Wildcard subscribers
-        for handler in self._subscribers.get("*", []):
-            await handler(event)
+        """
+        Publish an event to subscribers.
+
+        Type-specific and wildcard handlers run concurrently. Every handler
+        is awaited even if another fails; the first failure is then re-raised.
+        """
+        handlers = self._handlers_for(event.event_type)
+        if not handlers:
+            return
+
+        raise_first(await asyncio.gather(
+            *(handler(event) for handler in handlers),
+            return_exceptions=True
+        ))
+
+    async def publish_many(self, events: list[Event]):
+        """
+        Publish a batch of events (e.g. the result of one append).
+
+        Each handler receives its events in order, one after another, while
+        different handlers run concurrently under a single gather. A failing
+        handler skips its remaining events; the first failure is re-raised
+        once every handler has finished.
+        """
+        batches: dict[Callable, list[Event]] = {}
+        for event in events:
+            for handler in self._handlers_for(event.event_type):
+                batches.setdefault(handler, []).append(event)
+        if not batches:
+            return
+
+        raise_first(await asyncio.gather(
+            *(_deliver(handler, batch) for handler, batch in batches.items()),
+            return_exceptions=True
+        ))
+
+    def _handlers_for(self, event_type: str) -> tuple[Callable, ...]:
+        """Handlers for an event type, wildcard subscribers last."""
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            # .get() so lookups never add keys to the defaultdict
+            handlers = self._resolved[event_type] = (
+                *self._subscribers.get(event_type, ()),
+                *self._subscribers.get("*", ())
+            )
+        return handlers
+
+
+async def _deliver(handler: Callable, events: list[Event]):
+    """Feed events to one handler in order."""
+    for event in events:
+        await handler(event)
+
+
+def raise_first(results: list[Any]):
+    """Re-raise the first exception collected by gather(return_exceptions=True)."""
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
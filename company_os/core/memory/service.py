@@ -87,7 +87,7 @@ class EmbeddingService:
             text: Text to embed
 
         Returns:
-            Numpy array of embedding vector
+            float32 embedding vector (pgvector stores float4)
         """
         client = await self._get_client()
 
@@ -96,12 +96,12 @@ class EmbeddingService:
                 model=self.model,
                 input=text
             )
-            return np.array(response.data[0].embedding)
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
 
         elif self.provider == "sentence-transformers":
             # sentence-transformers is synchronous
             embedding = client.encode(text)
-            return np.array(embedding)
+            return np.asarray(embedding, dtype=np.float32)
 
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
@@ -115,11 +115,11 @@ class EmbeddingService:
                 model=self.model,
                 input=texts
             )
-            return [np.array(d.embedding) for d in response.data]
+            return [np.asarray(d.embedding, dtype=np.float32) for d in response.data]
 
         elif self.provider == "sentence-transformers":
             embeddings = client.encode(texts)
-            return [np.array(e) for e in embeddings]
+            return [np.asarray(e, dtype=np.float32) for e in embeddings]
 
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
@@ -273,7 +273,7 @@ class SemanticMemoryService:
                 org_id=row["org_id"],
                 memory_type=MemoryType(row["memory_type"]),
                 content=row["content"],
-                embedding=np.array(row["embedding"]),
+                embedding=np.asarray(row["embedding"], dtype=np.float32),
                 quality_score=row["quality_score"],
                 usage_count=row["usage_count"],
                 metadata=json.loads(row["metadata"]) if isinstance(row["metadata"], str) else row["metadata"],
@@ -0,0 +1,42 @@
+-- Stream Versions Schema
+-- Denormalized current version per event stream, maintained by trigger
+
+-- Latest stream_version per stream (O(1) lookup instead of MAX() over events)
+CREATE TABLE IF NOT EXISTS stream_versions (
+    stream_id VARCHAR(255) PRIMARY KEY,
+    version INT NOT NULL,
+    org_id UUID
+);
+
+CREATE INDEX IF NOT EXISTS idx_stream_versions_org_id ON stream_versions(org_id);
+
+-- Keep stream_versions in step with events. Statement-level so a batched
+-- append updates each stream's row once.
+CREATE OR REPLACE FUNCTION bump_stream_versions() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO stream_versions (stream_id, version, org_id)
+    SELECT stream_id, MAX(stream_version), (array_agg(org_id))[1]
+    FROM new_events
+    GROUP BY stream_id
+    ON CONFLICT (stream_id)
+    DO UPDATE SET version = GREATEST(stream_versions.version, EXCLUDED.version);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS events_bump_stream_versions ON events;
+CREATE TRIGGER events_bump_stream_versions
+    AFTER INSERT ON events
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_stream_versions();
+
+-- Backfill streams written before this migration
+INSERT INTO stream_versions (stream_id, version, org_id)
+SELECT stream_id, MAX(stream_version), (array_agg(org_id))[1]
+FROM events
+GROUP BY stream_id
+ON CONFLICT (stream_id) DO NOTHING;
+
+COMMENT ON TABLE stream_versions IS 'Current version per event stream, maintained by trigger on events';
@@ -0,0 +1,59 @@
+-- Batched Append Function
+-- Lock, version check and insert for one stream in a single round trip
+
+-- Append a batch of events to one stream with optimistic concurrency.
+-- Writers to the same stream serialize on a transaction-scoped advisory
+-- lock; each statement below takes a fresh snapshot, so the version read
+-- after the lock already includes the previous writer's events.
+-- Returns the inserted events, or when the expected version does not match,
+-- a single row carrying only current_version.
+CREATE OR REPLACE FUNCTION append_events(
+    p_stream_id VARCHAR(255),
+    p_expected_version INT,
+    p_event_types TEXT[],
+    p_event_data JSONB[],
+    p_metadata JSONB[],
+    p_org_id UUID DEFAULT NULL
+) RETURNS TABLE (
+    current_version INT,
+    id BIGINT,
+    stream_id VARCHAR(255),
+    stream_version INT,
+    event_type VARCHAR(100),
+    event_data JSONB,
+    metadata JSONB,
+    created_at TIMESTAMPTZ
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_current_version INT;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(p_stream_id, 0));
+
+    SELECT COALESCE(
+        (SELECT sv.version FROM stream_versions sv WHERE sv.stream_id = p_stream_id),
+        -1
+    )
+    INTO v_current_version;
+
+    -- Check expected version (-1 means no check)
+    IF p_expected_version != -1 AND v_current_version != p_expected_version THEN
+        RETURN QUERY SELECT v_current_version, NULL::BIGINT, NULL::VARCHAR(255),
+            NULL::INT, NULL::VARCHAR(100), NULL::JSONB, NULL::JSONB, NULL::TIMESTAMPTZ;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO events AS ev
+        (stream_id, stream_version, event_type, event_data, metadata, org_id)
+    SELECT p_stream_id, v_current_version + e.ord::INT, e.event_type,
+           e.event_data, e.metadata, p_org_id
+    FROM unnest(p_event_types, p_event_data, p_metadata) WITH ORDINALITY
+         AS e(event_type, event_data, metadata, ord)
+    RETURNING v_current_version, ev.id, ev.stream_id, ev.stream_version,
+              ev.event_type, ev.event_data, ev.metadata, ev.created_at;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION append_events(VARCHAR, INT, TEXT[], JSONB[], JSONB[], UUID)
+    IS 'Append a batch of events to a stream under a per-stream advisory lock';
@@ -4,9 +4,8 @@ Pytest Configuration and Fixtures for Company OS.
 Provides shared fixtures for unit, integration, and system tests.
 """
 
-import asyncio
 import os
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator
 from uuid import uuid4
 
 import pytest
@@ -21,14 +20,6 @@ os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-testing-only")
 os.environ.setdefault("OPENAI_API_KEY", "test-key")
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def mock_pool() -> MagicMock:
     """Create a mock database pool."""
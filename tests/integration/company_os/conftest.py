@@ -68,7 +68,7 @@ def setup_app_state():
 
     # Mock projection manager
     app_state.projection_manager = AsyncMock(spec=ProjectionManager)
-    app_state.projection_manager.apply_event = AsyncMock()
+    app_state.projection_manager.apply_events = AsyncMock()
 
     # Mock memory service
     mock_embedding_service = MagicMock(spec=EmbeddingService)
@@ -61,7 +61,7 @@ def mock_event_store():
 def mock_projection_manager():
     """Create mock projection manager."""
     manager = AsyncMock()
-    manager.apply_event = AsyncMock()
+    manager.apply_events = AsyncMock()
     return manager
 
 
@@ -888,6 +888,6 @@ class TestEventSourcing:
                     )
 
                 # Verify projection manager received the event
-                mock_app_state.projection_manager.apply_event.assert_called_once()
-                call_args = mock_app_state.projection_manager.apply_event.call_args
-                assert call_args.args[0].event_type == "TaskCreated"
+                mock_app_state.projection_manager.apply_events.assert_called_once_with(
+                    [created_event]
+                )
@@ -0,0 +1,13 @@
+"""
+Shared FastAPI application for the API integration tests.
+"""
+
+from functools import lru_cache
+
+from company_os.api.main import create_app
+
+
+@lru_cache(maxsize=1)
+def get_test_app():
+    """Build the FastAPI app once; later calls return the cached instance."""
+    return create_app()
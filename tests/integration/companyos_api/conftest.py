@@ -0,0 +1,48 @@
+"""
+Pytest Configuration for Company OS API Integration Tests.
+
+Provides shared application and client fixtures for the API test modules.
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from httpx import URL, ASGITransport, AsyncClient
+
+from ._app import get_test_app
+
+# Parsed once instead of on every AsyncClient construction
+_BASE_URL = URL("http://test")
+
+
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """Create FastAPI app once for the test session."""
+    return get_test_app()
+
+
+@pytest.fixture(scope="session")
+def client(fastapi_app):
+    """
+    Synchronous test client for the shared app.
+
+    The client is not entered as a context manager, so the application
+    lifespan (database pool, services) is never started.
+    """
+    return TestClient(fastapi_app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(fastapi_app):
+    """
+    Asynchronous test client shared across the session.
+
+    ASGITransport does not run the lifespan handler, so the app's startup
+    (which opens a real database pool) is skipped; tests wire the mocked
+    services into app_state instead.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=fastapi_app),
+        base_url=_BASE_URL
+    ) as client:
+        yield client
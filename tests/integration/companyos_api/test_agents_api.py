@@ -1,7 +1,7 @@
 """
 Integration Tests for Agents API.
 
-Tests the agent management routes using FastAPI AsyncClient.
+Tests the agent management routes using the shared AsyncClient fixture.
 """
 
 import pytest
@@ -9,10 +9,8 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-from httpx import ASGITransport, AsyncClient
-
-from company_os.api.main import create_app
 from company_os.api.state import app_state
+from company_os.core.auth.models import TokenPayload
 from company_os.integrations.uws.adapter import AgentInfo, SessionInfo, SkillInfo
 
 
@@ -31,11 +29,6 @@ class AsyncContextManagerMock:
 class TestAgentsAPI:
     """Tests for agent management API endpoints."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_uws_adapter(self):
         """Create mock UWS adapter."""
@@ -144,21 +137,15 @@ class TestAgentsAPI:
         return mock_adapter
 
     @pytest.mark.asyncio
-    async def test_list_agents_unauthorized(self, fastapi_app):
+    async def test_list_agents_unauthorized(self, async_client):
         """Test listing agents without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents")
+        response = await async_client.get("/api/agents")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_list_agents_success(self, fastapi_app, mock_uws_adapter):
+    async def test_list_agents_success(self, async_client, mock_uws_adapter):
         """Test listing available agents with authentication."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -172,14 +159,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -194,27 +177,21 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_activate_agent_unauthorized(self, fastapi_app):
+    async def test_activate_agent_unauthorized(self, async_client):
         """Test activating agent without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/agents/activate",
-                json={
-                    "agent_type": "researcher",
-                    "task_description": "Analyze project requirements"
-                }
-            )
+        response = await async_client.post(
+            "/api/agents/activate",
+            json={
+                "agent_type": "researcher",
+                "task_description": "Analyze project requirements"
+            }
+        )
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_activate_agent_success(self, fastapi_app, mock_uws_adapter):
+    async def test_activate_agent_success(self, async_client, mock_uws_adapter):
         """Test activating an agent successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id="org-123",
@@ -228,19 +205,15 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/agents/activate",
-                    json={
-                        "agent_type": "researcher",
-                        "task_description": "Analyze project requirements",
-                        "task_id": "task-123"
-                    },
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.post(
+                "/api/agents/activate",
+                json={
+                    "agent_type": "researcher",
+                    "task_description": "Analyze project requirements",
+                    "task_id": "task-123"
+                },
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -251,36 +224,26 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_activate_agent_missing_fields(self, fastapi_app):
+    async def test_activate_agent_missing_fields(self, async_client):
         """Test activating agent with missing required fields."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/agents/activate",
-                json={"agent_type": "researcher"},  # Missing task_description
-                headers={"Authorization": "Bearer test.token"}
-            )
+        response = await async_client.post(
+            "/api/agents/activate",
+            json={"agent_type": "researcher"},  # Missing task_description
+            headers={"Authorization": "Bearer test.token"}
+        )
 
         assert response.status_code in [401, 403, 422]
 
     @pytest.mark.asyncio
-    async def test_list_sessions_unauthorized(self, fastapi_app):
+    async def test_list_sessions_unauthorized(self, async_client):
         """Test listing sessions without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/sessions")
+        response = await async_client.get("/api/agents/sessions")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_list_sessions_success(self, fastapi_app, mock_uws_adapter):
+    async def test_list_sessions_success(self, async_client, mock_uws_adapter):
         """Test listing agent sessions successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -294,14 +257,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/sessions",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/sessions",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -313,10 +272,8 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_list_sessions_with_filter(self, fastapi_app, mock_uws_adapter):
+    async def test_list_sessions_with_filter(self, async_client, mock_uws_adapter):
         """Test listing sessions with status filter."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -330,14 +287,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/sessions?status=active",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/sessions?status=active",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -349,21 +302,15 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_get_session_unauthorized(self, fastapi_app):
+    async def test_get_session_unauthorized(self, async_client):
         """Test getting session without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/sessions/session-001")
+        response = await async_client.get("/api/agents/sessions/session-001")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_get_session_success(self, fastapi_app, mock_uws_adapter):
+    async def test_get_session_success(self, async_client, mock_uws_adapter):
         """Test getting a specific session successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -377,14 +324,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/sessions/session-001",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/sessions/session-001",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -395,10 +338,8 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 404, 500]
 
     @pytest.mark.asyncio
-    async def test_get_session_not_found(self, fastapi_app, mock_uws_adapter):
+    async def test_get_session_not_found(self, async_client, mock_uws_adapter):
         """Test getting a non-existent session."""
-        from company_os.core.auth.models import TokenPayload
-
         # Mock returning None for non-existent session
         mock_uws_adapter.get_session = AsyncMock(return_value=None)
 
@@ -415,14 +356,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/sessions/nonexistent",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/sessions/nonexistent",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 404:
                 assert "not found" in response.json()["detail"].lower()
@@ -430,24 +367,18 @@ class TestAgentsAPI:
                 assert response.status_code in [401, 403, 404, 500]
 
     @pytest.mark.asyncio
-    async def test_update_session_unauthorized(self, fastapi_app):
+    async def test_update_session_unauthorized(self, async_client):
         """Test updating session without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.put(
-                "/api/agents/sessions/session-001",
-                json={"progress": 75}
-            )
+        response = await async_client.put(
+            "/api/agents/sessions/session-001",
+            json={"progress": 75}
+        )
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_update_session_success(self, fastapi_app, mock_uws_adapter):
+    async def test_update_session_success(self, async_client, mock_uws_adapter):
         """Test updating a session successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -461,19 +392,15 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.put(
-                    "/api/agents/sessions/session-001",
-                    json={
-                        "progress": 75,
-                        "status": "active",
-                        "task_update": "Making good progress"
-                    },
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.put(
+                "/api/agents/sessions/session-001",
+                json={
+                    "progress": 75,
+                    "status": "active",
+                    "task_update": "Making good progress"
+                },
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 mock_uws_adapter.update_session_progress.assert_called_once()
@@ -481,21 +408,15 @@ class TestAgentsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_end_session_unauthorized(self, fastapi_app):
+    async def test_end_session_unauthorized(self, async_client):
         """Test ending session without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.delete("/api/agents/sessions/session-001")
+        response = await async_client.delete("/api/agents/sessions/session-001")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_end_session_success(self, fastapi_app, mock_uws_adapter):
+    async def test_end_session_success(self, async_client, mock_uws_adapter):
         """Test ending a session successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -509,14 +430,10 @@ class TestAgentsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.delete(
-                    "/api/agents/sessions/session-001?result=success",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.delete(
+                "/api/agents/sessions/session-001?result=success",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -530,11 +447,6 @@ class TestAgentsAPI:
 class TestSkillsAPI:
     """Tests for skills API endpoints."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_uws_adapter(self):
         """Create mock UWS adapter."""
@@ -561,21 +473,15 @@ class TestSkillsAPI:
         return mock_adapter
 
     @pytest.mark.asyncio
-    async def test_list_skills_unauthorized(self, fastapi_app):
+    async def test_list_skills_unauthorized(self, async_client):
         """Test listing skills without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/skills")
+        response = await async_client.get("/api/agents/skills")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_list_skills_success(self, fastapi_app, mock_uws_adapter):
+    async def test_list_skills_success(self, async_client, mock_uws_adapter):
         """Test listing available skills successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -589,14 +495,10 @@ class TestSkillsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/skills",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/skills",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -608,21 +510,15 @@ class TestSkillsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_list_enabled_skills_unauthorized(self, fastapi_app):
+    async def test_list_enabled_skills_unauthorized(self, async_client):
         """Test listing enabled skills without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/skills/enabled")
+        response = await async_client.get("/api/agents/skills/enabled")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_list_enabled_skills_success(self, fastapi_app, mock_uws_adapter):
+    async def test_list_enabled_skills_success(self, async_client, mock_uws_adapter):
         """Test listing enabled skills successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -636,14 +532,10 @@ class TestSkillsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/skills/enabled",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/skills/enabled",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -653,21 +545,15 @@ class TestSkillsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_enable_skill_unauthorized(self, fastapi_app):
+    async def test_enable_skill_unauthorized(self, async_client):
         """Test enabling skill without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post("/api/agents/skills/testing/enable")
+        response = await async_client.post("/api/agents/skills/testing/enable")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_enable_skill_success(self, fastapi_app, mock_uws_adapter):
+    async def test_enable_skill_success(self, async_client, mock_uws_adapter):
         """Test enabling a skill successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -681,14 +567,10 @@ class TestSkillsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/agents/skills/testing/enable",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.post(
+                "/api/agents/skills/testing/enable",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -698,21 +580,15 @@ class TestSkillsAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_disable_skill_unauthorized(self, fastapi_app):
+    async def test_disable_skill_unauthorized(self, async_client):
         """Test disabling skill without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post("/api/agents/skills/code-review/disable")
+        response = await async_client.post("/api/agents/skills/code-review/disable")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_disable_skill_success(self, fastapi_app, mock_uws_adapter):
+    async def test_disable_skill_success(self, async_client, mock_uws_adapter):
         """Test disabling a skill successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -726,14 +602,10 @@ class TestSkillsAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/agents/skills/code-review/disable",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.post(
+                "/api/agents/skills/code-review/disable",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -746,11 +618,6 @@ class TestSkillsAPI:
 class TestWorkflowAPI:
     """Tests for workflow API endpoints."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_uws_adapter(self):
         """Create mock UWS adapter."""
@@ -782,21 +649,15 @@ class TestWorkflowAPI:
         return mock_adapter
 
     @pytest.mark.asyncio
-    async def test_get_workflow_status_unauthorized(self, fastapi_app):
+    async def test_get_workflow_status_unauthorized(self, async_client):
         """Test getting workflow status without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/workflow/status")
+        response = await async_client.get("/api/agents/workflow/status")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_get_workflow_status_success(self, fastapi_app, mock_uws_adapter):
+    async def test_get_workflow_status_success(self, async_client, mock_uws_adapter):
         """Test getting workflow status successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -810,14 +671,10 @@ class TestWorkflowAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/workflow/status",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/workflow/status",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -829,23 +686,17 @@ class TestWorkflowAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_create_checkpoint_unauthorized(self, fastapi_app):
+    async def test_create_checkpoint_unauthorized(self, async_client):
         """Test creating checkpoint without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/agents/workflow/checkpoint?message=Test checkpoint"
-            )
+        response = await async_client.post(
+            "/api/agents/workflow/checkpoint?message=Test checkpoint"
+        )
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_create_checkpoint_success(self, fastapi_app, mock_uws_adapter):
+    async def test_create_checkpoint_success(self, async_client, mock_uws_adapter):
         """Test creating a checkpoint successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -859,14 +710,10 @@ class TestWorkflowAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/agents/workflow/checkpoint?message=Test checkpoint",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.post(
+                "/api/agents/workflow/checkpoint?message=Test checkpoint",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -877,21 +724,15 @@ class TestWorkflowAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_list_checkpoints_unauthorized(self, fastapi_app):
+    async def test_list_checkpoints_unauthorized(self, async_client):
         """Test listing checkpoints without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/agents/workflow/checkpoints")
+        response = await async_client.get("/api/agents/workflow/checkpoints")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_list_checkpoints_success(self, fastapi_app, mock_uws_adapter):
+    async def test_list_checkpoints_success(self, async_client, mock_uws_adapter):
         """Test listing checkpoints successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -905,14 +746,10 @@ class TestWorkflowAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.get(
-                    "/api/agents/workflow/checkpoints",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.get(
+                "/api/agents/workflow/checkpoints",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -923,21 +760,15 @@ class TestWorkflowAPI:
                 assert response.status_code in [200, 401, 403, 500]
 
     @pytest.mark.asyncio
-    async def test_recover_context_unauthorized(self, fastapi_app):
+    async def test_recover_context_unauthorized(self, async_client):
         """Test recovering context without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post("/api/agents/workflow/recover")
+        response = await async_client.post("/api/agents/workflow/recover")
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_recover_context_success(self, fastapi_app, mock_uws_adapter):
+    async def test_recover_context_success(self, async_client, mock_uws_adapter):
         """Test recovering context successfully."""
-        from company_os.core.auth.models import TokenPayload
-
         mock_token = TokenPayload(
             sub=str(uuid4()),
             org_id=str(uuid4()),
@@ -951,14 +782,10 @@ class TestWorkflowAPI:
         with patch('company_os.api.security.get_current_user', new_callable=AsyncMock) as mock_auth:
             mock_auth.return_value = mock_token
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/agents/workflow/recover",
-                    headers={"Authorization": "Bearer valid.token"}
-                )
+            response = await async_client.post(
+                "/api/agents/workflow/recover",
+                headers={"Authorization": "Bearer valid.token"}
+            )
 
             if response.status_code == 200:
                 data = response.json()
@@ -10,11 +10,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
-from httpx import ASGITransport, AsyncClient
 
-from company_os.api.main import create_app
 from company_os.api.state import app_state
-from company_os.core.auth.service import AuthService
+from company_os.core.auth.service import AuthService, AuthenticationError
 from company_os.core.auth.models import User, Organization, TokenPair
 
 
@@ -33,11 +31,6 @@ class AsyncContextManagerMock:
 class TestAuthAPI:
     """Tests for authentication API endpoints."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_app_state(self):
         """Create mock application state."""
@@ -56,7 +49,7 @@ class TestAuthAPI:
         return app_state
 
     @pytest.mark.asyncio
-    async def test_register_success(self, fastapi_app, mock_app_state):
+    async def test_register_success(self, async_client, mock_app_state):
         """Test successful user registration."""
         user_id = uuid4()
         org_id = uuid4()
@@ -99,18 +92,14 @@ class TestAuthAPI:
                 mock_create.return_value = (mock_user, mock_org)
                 mock_tokens_call.return_value = mock_tokens
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/auth/register",
-                        json={
-                            "email": "newuser@example.com",
-                            "name": "New User",
-                            "password": "securepassword123"
-                        }
-                    )
+                response = await async_client.post(
+                    "/api/auth/register",
+                    json={
+                        "email": "newuser@example.com",
+                        "name": "New User",
+                        "password": "securepassword123"
+                    }
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -119,29 +108,25 @@ class TestAuthAPI:
                 assert data["token_type"] == "bearer"
 
     @pytest.mark.asyncio
-    async def test_register_duplicate_email(self, fastapi_app, mock_app_state):
+    async def test_register_duplicate_email(self, async_client, mock_app_state):
         """Test registration with existing email."""
         with patch.object(app_state.auth_service, 'create_user', new_callable=AsyncMock) as mock_create:
             mock_create.side_effect = Exception("unique constraint violation")
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/auth/register",
-                    json={
-                        "email": "existing@example.com",
-                        "name": "Existing User",
-                        "password": "password123"
-                    }
-                )
+            response = await async_client.post(
+                "/api/auth/register",
+                json={
+                    "email": "existing@example.com",
+                    "name": "Existing User",
+                    "password": "password123"
+                }
+            )
 
             assert response.status_code == 400
             assert "already registered" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_login_success(self, fastapi_app, mock_app_state):
+    async def test_login_success(self, async_client, mock_app_state):
         """Test successful login."""
         user_id = uuid4()
         org_id = uuid4()
@@ -182,47 +167,37 @@ class TestAuthAPI:
                 mock_auth.return_value = (mock_user, mock_org)
                 mock_tokens_call.return_value = mock_tokens
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/auth/login",
-                        json={
-                            "email": "user@example.com",
-                            "password": "correctpassword"
-                        }
-                    )
+                response = await async_client.post(
+                    "/api/auth/login",
+                    json={
+                        "email": "user@example.com",
+                        "password": "correctpassword"
+                    }
+                )
 
                 assert response.status_code == 200
                 data = response.json()
                 assert data["access_token"] == "valid.access.token"
 
     @pytest.mark.asyncio
-    async def test_login_invalid_credentials(self, fastapi_app, mock_app_state):
+    async def test_login_invalid_credentials(self, async_client, mock_app_state):
         """Test login with wrong password."""
-        from company_os.core.auth.service import AuthenticationError
-
         with patch.object(app_state.auth_service, 'authenticate', new_callable=AsyncMock) as mock_auth:
             mock_auth.side_effect = AuthenticationError("Invalid credentials")
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/auth/login",
-                    json={
-                        "email": "user@example.com",
-                        "password": "wrongpassword"
-                    }
-                )
+            response = await async_client.post(
+                "/api/auth/login",
+                json={
+                    "email": "user@example.com",
+                    "password": "wrongpassword"
+                }
+            )
 
             assert response.status_code == 401
             assert "Invalid credentials" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_refresh_tokens_success(self, fastapi_app, mock_app_state):
+    async def test_refresh_tokens_success(self, async_client, mock_app_state):
         """Test token refresh."""
         mock_tokens = TokenPair(
             access_token="new.access.token",
@@ -234,14 +209,10 @@ class TestAuthAPI:
         with patch.object(app_state.auth_service, 'refresh_tokens', new_callable=AsyncMock) as mock_refresh:
             mock_refresh.return_value = mock_tokens
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/auth/refresh",
-                    json={"refresh_token": "old.refresh.token"}
-                )
+            response = await async_client.post(
+                "/api/auth/refresh",
+                json={"refresh_token": "old.refresh.token"}
+            )
 
             assert response.status_code == 200
             data = response.json()
@@ -249,61 +220,43 @@ class TestAuthAPI:
             assert data["refresh_token"] == "new.refresh.token"
 
     @pytest.mark.asyncio
-    async def test_refresh_tokens_invalid(self, fastapi_app, mock_app_state):
+    async def test_refresh_tokens_invalid(self, async_client, mock_app_state):
         """Test refresh with invalid token."""
-        from company_os.core.auth.service import AuthenticationError
-
         with patch.object(app_state.auth_service, 'refresh_tokens', new_callable=AsyncMock) as mock_refresh:
             mock_refresh.side_effect = AuthenticationError("Invalid refresh token")
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/auth/refresh",
-                    json={"refresh_token": "invalid.token"}
-                )
+            response = await async_client.post(
+                "/api/auth/refresh",
+                json={"refresh_token": "invalid.token"}
+            )
 
             assert response.status_code == 401
 
     @pytest.mark.asyncio
-    async def test_logout_success(self, fastapi_app, mock_app_state):
+    async def test_logout_success(self, async_client, mock_app_state):
         """Test logout."""
         with patch.object(app_state.auth_service, 'revoke_refresh_token', new_callable=AsyncMock) as mock_revoke:
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/auth/logout",
-                    json={"refresh_token": "token.to.revoke"}
-                )
+            response = await async_client.post(
+                "/api/auth/logout",
+                json={"refresh_token": "token.to.revoke"}
+            )
 
             assert response.status_code == 200
             assert response.json()["message"] == "Logged out successfully"
             mock_revoke.assert_called_once_with("token.to.revoke")
 
     @pytest.mark.asyncio
-    async def test_get_current_user_unauthorized(self, fastapi_app, mock_app_state):
+    async def test_get_current_user_unauthorized(self, async_client, mock_app_state):
         """Test accessing /me without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/auth/me")
+        response = await async_client.get("/api/auth/me")
 
         # Should return 401 or 403 without auth header
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_github_oauth_not_implemented(self, fastapi_app, mock_app_state):
+    async def test_github_oauth_not_implemented(self, async_client, mock_app_state):
         """Test GitHub OAuth returns not implemented."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.get("/api/auth/github")
+        response = await async_client.get("/api/auth/github")
 
         assert response.status_code == 501
         assert "not yet configured" in response.json()["detail"]
@@ -312,53 +265,36 @@ class TestAuthAPI:
 class TestAuthValidation:
     """Tests for auth input validation."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.mark.asyncio
-    async def test_register_invalid_email(self, fastapi_app):
+    async def test_register_invalid_email(self, async_client):
         """Test registration with invalid email format."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/auth/register",
-                json={
-                    "email": "not-an-email",
-                    "name": "Test User",
-                    "password": "password123"
-                }
-            )
+        response = await async_client.post(
+            "/api/auth/register",
+            json={
+                "email": "not-an-email",
+                "name": "Test User",
+                "password": "password123"
+            }
+        )
 
         assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_register_missing_fields(self, fastapi_app):
+    async def test_register_missing_fields(self, async_client):
         """Test registration with missing required fields."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/auth/register",
-                json={"email": "test@example.com"}
-            )
+        response = await async_client.post(
+            "/api/auth/register",
+            json={"email": "test@example.com"}
+        )
 
         assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_login_missing_password(self, fastapi_app):
+    async def test_login_missing_password(self, async_client):
         """Test login with missing password."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/auth/login",
-                json={"email": "test@example.com"}
-            )
+        response = await async_client.post(
+            "/api/auth/login",
+            json={"email": "test@example.com"}
+        )
 
         assert response.status_code == 422
@@ -1,7 +1,7 @@
 """
 Integration Tests for Memory API.
 
-Tests the semantic memory routes using FastAPI AsyncClient.
+Tests the semantic memory routes using the shared AsyncClient fixture.
 """
 
 import pytest
@@ -9,9 +9,6 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4, UUID
 
-from httpx import ASGITransport, AsyncClient
-
-from company_os.api.main import create_app
 from company_os.api.state import app_state
 from company_os.core.memory.service import (
     SemanticMemoryService,
@@ -38,11 +35,6 @@ class AsyncContextManagerMock:
 class TestMemoryAPI:
     """Tests for Memory API endpoints."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_app_state(self):
         """Create mock application state."""
@@ -72,7 +64,7 @@ class TestMemoryAPI:
         )
 
     @pytest.mark.asyncio
-    async def test_store_memory_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_store_memory_success(self, async_client, mock_app_state, mock_token_payload):
         """Test storing a new memory."""
         memory_id = uuid4()
 
@@ -82,20 +74,16 @@ class TestMemoryAPI:
             with patch.object(app_state.memory_service, "store", new_callable=AsyncMock) as mock_store:
                 mock_store.return_value = memory_id
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/memory/store",
-                        json={
-                            "memory_type": "task",
-                            "content": "Implemented user authentication with JWT tokens",
-                            "metadata": {"agent_type": "implementer", "outcome": "success"},
-                            "quality_score": 0.8
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.post(
+                    "/api/memory/store",
+                    json={
+                        "memory_type": "task",
+                        "content": "Implemented user authentication with JWT tokens",
+                        "metadata": {"agent_type": "implementer", "outcome": "success"},
+                        "quality_score": 0.8
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 201
                 data = response.json()
@@ -110,48 +98,40 @@ class TestMemoryAPI:
                 assert call_args.kwargs["quality_score"] == 0.8
 
     @pytest.mark.asyncio
-    async def test_store_memory_invalid_type(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_store_memory_invalid_type(self, async_client, mock_app_state, mock_token_payload):
         """Test storing memory with invalid memory type."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/store",
-                    json={
-                        "memory_type": "invalid_type",
-                        "content": "Some content",
-                        "quality_score": 0.5
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/store",
+                json={
+                    "memory_type": "invalid_type",
+                    "content": "Some content",
+                    "quality_score": 0.5
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 400
             assert "Invalid memory_type" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_store_memory_unauthorized(self, fastapi_app, mock_app_state):
+    async def test_store_memory_unauthorized(self, async_client, mock_app_state):
         """Test storing memory without authentication."""
-        async with AsyncClient(
-            transport=ASGITransport(app=fastapi_app),
-            base_url="http://test"
-        ) as client:
-            response = await client.post(
-                "/api/memory/store",
-                json={
-                    "memory_type": "task",
-                    "content": "Some content",
-                    "quality_score": 0.5
-                }
-            )
+        response = await async_client.post(
+            "/api/memory/store",
+            json={
+                "memory_type": "task",
+                "content": "Some content",
+                "quality_score": 0.5
+            }
+        )
 
         assert response.status_code in [401, 403]
 
     @pytest.mark.asyncio
-    async def test_search_memories_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_search_memories_success(self, async_client, mock_app_state, mock_token_payload):
         """Test searching memories."""
         memory1 = Memory(
             id=uuid4(),
@@ -185,20 +165,16 @@ class TestMemoryAPI:
             with patch.object(app_state.memory_service, "search", new_callable=AsyncMock) as mock_search:
                 mock_search.return_value = [memory1, memory2]
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/memory/search",
-                        json={
-                            "query": "authentication implementation",
-                            "memory_types": ["task", "decision"],
-                            "limit": 10,
-                            "min_similarity": 0.7
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.post(
+                    "/api/memory/search",
+                    json={
+                        "query": "authentication implementation",
+                        "memory_types": ["task", "decision"],
+                        "limit": 10,
+                        "min_similarity": 0.7
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -209,30 +185,26 @@ class TestMemoryAPI:
                 assert data[1]["similarity"] == 0.87
 
     @pytest.mark.asyncio
-    async def test_search_memories_invalid_type(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_search_memories_invalid_type(self, async_client, mock_app_state, mock_token_payload):
         """Test searching with invalid memory type."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/search",
-                    json={
-                        "query": "test query",
-                        "memory_types": ["invalid_type"],
-                        "limit": 10
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/search",
+                json={
+                    "query": "test query",
+                    "memory_types": ["invalid_type"],
+                    "limit": 10
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 400
             assert "Invalid memory type" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_build_agent_context_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_build_agent_context_success(self, async_client, mock_app_state, mock_token_payload):
         """Test building agent context with memories."""
         enhanced_context = """You are a implementer agent.
 
@@ -262,18 +234,14 @@ Consider these related decisions we've made:
             with patch.object(AgentContextBuilder, "build_context", new_callable=AsyncMock) as mock_build:
                 mock_build.return_value = enhanced_context
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/memory/context",
-                        json={
-                            "agent_type": "implementer",
-                            "task": "Implement OAuth2 authentication"
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.post(
+                    "/api/memory/context",
+                    json={
+                        "agent_type": "implementer",
+                        "task": "Implement OAuth2 authentication"
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -283,7 +251,7 @@ Consider these related decisions we've made:
                 assert "Similar Successful Tasks" in data["enhanced_context"]
 
     @pytest.mark.asyncio
-    async def test_find_similar_tasks_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_find_similar_tasks_success(self, async_client, mock_app_state, mock_token_payload):
         """Test finding similar past tasks."""
         memory = Memory(
             id=uuid4(),
@@ -308,20 +276,16 @@ Consider these related decisions we've made:
             ) as mock_search:
                 mock_search.return_value = [memory]
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.get(
-                        "/api/memory/similar-tasks",
-                        params={
-                            "task_description": "Add rate limiting to API",
-                            "agent_type": "implementer",
-                            "outcome": "success",
-                            "limit": 5
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.get(
+                    "/api/memory/similar-tasks",
+                    params={
+                        "task_description": "Add rate limiting to API",
+                        "agent_type": "implementer",
+                        "outcome": "success",
+                        "limit": 5
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -330,7 +294,7 @@ Consider these related decisions we've made:
                 assert data[0]["content"] == "Implemented rate limiting middleware"
 
     @pytest.mark.asyncio
-    async def test_find_decisions_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_find_decisions_success(self, async_client, mock_app_state, mock_token_payload):
         """Test finding relevant past decisions."""
         memory = Memory(
             id=uuid4(),
@@ -355,18 +319,14 @@ Consider these related decisions we've made:
             ) as mock_search:
                 mock_search.return_value = [memory]
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.get(
-                        "/api/memory/decisions",
-                        params={
-                            "topic": "database selection",
-                            "limit": 5
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.get(
+                    "/api/memory/decisions",
+                    params={
+                        "topic": "database selection",
+                        "limit": 5
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -375,7 +335,7 @@ Consider these related decisions we've made:
                 assert "PostgreSQL" in data[0]["content"]
 
     @pytest.mark.asyncio
-    async def test_find_code_patterns_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_find_code_patterns_success(self, async_client, mock_app_state, mock_token_payload):
         """Test finding relevant code patterns."""
         memory = Memory(
             id=uuid4(),
@@ -400,19 +360,15 @@ Consider these related decisions we've made:
             ) as mock_search:
                 mock_search.return_value = [memory]
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.get(
-                        "/api/memory/code-patterns",
-                        params={
-                            "description": "database connection handling",
-                            "language": "python",
-                            "limit": 5
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.get(
+                    "/api/memory/code-patterns",
+                    params={
+                        "description": "database connection handling",
+                        "language": "python",
+                        "limit": 5
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -421,7 +377,7 @@ Consider these related decisions we've made:
                 assert "async def" in data[0]["content"]
 
     @pytest.mark.asyncio
-    async def test_find_errors_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_find_errors_success(self, async_client, mock_app_state, mock_token_payload):
         """Test finding similar past errors."""
         memory = Memory(
             id=uuid4(),
@@ -449,18 +405,14 @@ Consider these related decisions we've made:
             ) as mock_search:
                 mock_search.return_value = [memory]
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.get(
-                        "/api/memory/errors",
-                        params={
-                            "context": "database connection issues",
-                            "limit": 5
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.get(
+                    "/api/memory/errors",
+                    params={
+                        "context": "database connection issues",
+                        "limit": 5
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -469,7 +421,7 @@ Consider these related decisions we've made:
                 assert "Connection pool" in data[0]["content"]
 
     @pytest.mark.asyncio
-    async def test_update_memory_quality_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_update_memory_quality_success(self, async_client, mock_app_state, mock_token_payload):
         """Test updating memory quality score."""
         memory_id = uuid4()
 
@@ -481,18 +433,14 @@ Consider these related decisions we've made:
                 "update_quality",
                 new_callable=AsyncMock
             ) as mock_update:
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.put(
-                        f"/api/memory/{memory_id}/quality",
-                        params={
-                            "quality_score": 0.95,
-                            "feedback": "Very helpful for similar tasks"
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.put(
+                    f"/api/memory/{memory_id}/quality",
+                    params={
+                        "quality_score": 0.95,
+                        "feedback": "Very helpful for similar tasks"
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -507,26 +455,22 @@ Consider these related decisions we've made:
                 assert call_args.kwargs["feedback"] == "Very helpful for similar tasks"
 
     @pytest.mark.asyncio
-    async def test_update_memory_quality_invalid_uuid(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_update_memory_quality_invalid_uuid(self, async_client, mock_app_state, mock_token_payload):
         """Test updating quality with invalid UUID."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.put(
-                    "/api/memory/not-a-uuid/quality",
-                    params={"quality_score": 0.95},
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.put(
+                "/api/memory/not-a-uuid/quality",
+                params={"quality_score": 0.95},
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             # Should either be 422 (validation error) or 500 (UUID parsing error)
             assert response.status_code in [422, 500]
 
     @pytest.mark.asyncio
-    async def test_consolidate_memories_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_consolidate_memories_success(self, async_client, mock_app_state, mock_token_payload):
         """Test consolidating similar memories."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
@@ -538,18 +482,14 @@ Consider these related decisions we've made:
             ) as mock_consolidate:
                 mock_consolidate.return_value = 5
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/memory/consolidate",
-                        params={
-                            "memory_type": "task",
-                            "similarity_threshold": 0.96
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.post(
+                    "/api/memory/consolidate",
+                    params={
+                        "memory_type": "task",
+                        "similarity_threshold": 0.96
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -562,29 +502,25 @@ Consider these related decisions we've made:
                 assert call_args.kwargs["similarity_threshold"] == 0.96
 
     @pytest.mark.asyncio
-    async def test_consolidate_invalid_memory_type(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_consolidate_invalid_memory_type(self, async_client, mock_app_state, mock_token_payload):
         """Test consolidation with invalid memory type."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/consolidate",
-                    params={
-                        "memory_type": "invalid_type",
-                        "similarity_threshold": 0.95
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/consolidate",
+                params={
+                    "memory_type": "invalid_type",
+                    "similarity_threshold": 0.95
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 400
             assert "Invalid memory_type" in response.json()["detail"]
 
     @pytest.mark.asyncio
-    async def test_prune_old_memories_success(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_prune_old_memories_success(self, async_client, mock_app_state, mock_token_payload):
         """Test pruning old memories."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
@@ -596,19 +532,15 @@ Consider these related decisions we've made:
             ) as mock_prune:
                 mock_prune.return_value = 12
 
-                async with AsyncClient(
-                    transport=ASGITransport(app=fastapi_app),
-                    base_url="http://test"
-                ) as client:
-                    response = await client.post(
-                        "/api/memory/prune",
-                        params={
-                            "memory_type": "task",
-                            "max_age_days": 90,
-                            "keep_high_quality": True
-                        },
-                        headers={"Authorization": "Bearer fake.token.here"}
-                    )
+                response = await async_client.post(
+                    "/api/memory/prune",
+                    params={
+                        "memory_type": "task",
+                        "max_age_days": 90,
+                        "keep_high_quality": True
+                    },
+                    headers={"Authorization": "Bearer fake.token.here"}
+                )
 
                 assert response.status_code == 200
                 data = response.json()
@@ -622,23 +554,19 @@ Consider these related decisions we've made:
                 assert call_args.kwargs["keep_high_quality"] is True
 
     @pytest.mark.asyncio
-    async def test_prune_invalid_memory_type(self, fastapi_app, mock_app_state, mock_token_payload):
+    async def test_prune_invalid_memory_type(self, async_client, mock_app_state, mock_token_payload):
         """Test pruning with invalid memory type."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/prune",
-                    params={
-                        "memory_type": "invalid_type",
-                        "max_age_days": 90
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/prune",
+                params={
+                    "memory_type": "invalid_type",
+                    "max_age_days": 90
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 400
             assert "Invalid memory_type" in response.json()["detail"]
@@ -647,11 +575,6 @@ Consider these related decisions we've made:
 class TestMemoryValidation:
     """Tests for memory input validation."""
 
-    @pytest.fixture
-    def fastapi_app(self):
-        """Create FastAPI app for testing."""
-        return create_app()
-
     @pytest.fixture
     def mock_token_payload(self):
         """Create mock token payload for authenticated requests."""
@@ -666,85 +589,69 @@ class TestMemoryValidation:
         )
 
     @pytest.mark.asyncio
-    async def test_store_memory_missing_content(self, fastapi_app, mock_token_payload):
+    async def test_store_memory_missing_content(self, async_client, mock_token_payload):
         """Test storing memory with missing content field."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/store",
-                    json={
-                        "memory_type": "task",
-                        "quality_score": 0.5
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/store",
+                json={
+                    "memory_type": "task",
+                    "quality_score": 0.5
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_search_memory_missing_query(self, fastapi_app, mock_token_payload):
+    async def test_search_memory_missing_query(self, async_client, mock_token_payload):
         """Test searching memory with missing query field."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/search",
-                    json={
-                        "limit": 10
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/search",
+                json={
+                    "limit": 10
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_build_context_missing_fields(self, fastapi_app, mock_token_payload):
+    async def test_build_context_missing_fields(self, async_client, mock_token_payload):
         """Test building context with missing required fields."""
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.post(
-                    "/api/memory/context",
-                    json={
-                        "agent_type": "implementer"
-                        # Missing "task" field
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.post(
+                "/api/memory/context",
+                json={
+                    "agent_type": "implementer"
+                    # Missing "task" field
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 422  # Validation error
 
     @pytest.mark.asyncio
-    async def test_quality_score_out_of_range(self, fastapi_app, mock_token_payload):
+    async def test_quality_score_out_of_range(self, async_client, mock_token_payload):
         """Test updating quality with out-of-range score."""
         memory_id = uuid4()
 
         with patch("company_os.api.security.get_current_user") as mock_get_user:
             mock_get_user.return_value = mock_token_payload
 
-            async with AsyncClient(
-                transport=ASGITransport(app=fastapi_app),
-                base_url="http://test"
-            ) as client:
-                response = await client.put(
-                    f"/api/memory/{memory_id}/quality",
-                    params={
-                        "quality_score": 1.5  # Invalid: should be 0-1
-                    },
-                    headers={"Authorization": "Bearer fake.token.here"}
-                )
+            response = await async_client.put(
+                f"/api/memory/{memory_id}/quality",
+                params={
+                    "quality_score": 1.5  # Invalid: should be 0-1
+                },
+                headers={"Authorization": "Bearer fake.token.here"}
+            )
 
             assert response.status_code == 422  # Validation error
@@ -0,0 +1,17 @@
+"""
+Deterministic identifiers for the Company OS unit tests.
+"""
+
+import random
+from typing import Callable
+from uuid import UUID
+
+
+def seeded_uuid4(seed: int = 0xC0FFEE) -> Callable[[], UUID]:
+    """Return a factory of reproducible UUID4s (no urandom syscall)."""
+    rng = random.Random(seed)
+
+    def make() -> UUID:
+        return UUID(int=rng.getrandbits(128), version=4)
+
+    return make
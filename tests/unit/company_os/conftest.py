@@ -0,0 +1,90 @@
+"""
+Pytest Configuration for Company OS Unit Tests.
+
+Provides shared, session-scoped fixtures for the core service tests.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import MagicMock
+
+from company_os.core.auth.service import AuthService
+
+from ._ids import seeded_uuid4
+
+
+_NOW = datetime.now(timezone.utc)
+# Own seed so row IDs never repeat the IDs the test modules generate
+_uuid = seeded_uuid4(0xC0FFEF)
+
+
+@dataclass(frozen=True, slots=True)
+class _Settings:
+    """Minimal stand-in for the settings fields AuthService reads."""
+    jwt_secret_key: str = "test-secret-key-for-jwt-signing"
+    jwt_algorithm: str = "HS256"
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 7
+
+
+@pytest.fixture(scope="session")
+def auth_settings():
+    """Create auth settings shared by the session."""
+    return _Settings()
+
+
+@pytest.fixture(scope="session")
+def auth_service(auth_settings):
+    """
+    Create one AuthService for the session.
+
+    The service is stateless apart from its pool and settings; tests reset
+    the pool mock and restore any settings they change. Bcrypt is dropped to
+    its minimum cost (4) since tests only need hash round-trips.
+    """
+    service = AuthService(MagicMock(), auth_settings)
+    service.pwd_context.update(bcrypt__rounds=4)
+    return service
+
+
+@pytest.fixture(scope="session")
+def user_row_factory():
+    """Build a users table row; keyword arguments override columns."""
+    def make(**overrides):
+        row = {
+            "id": _uuid(),
+            "email": "test@example.com",
+            "name": "Test User",
+            "password_hash": "hashed",
+            "is_active": True,
+            "is_verified": True,
+            "created_at": _NOW,
+            "updated_at": _NOW,
+            "last_login": None,
+            "avatar_url": None,
+            "preferences": {}
+        }
+        row.update(overrides)
+        return row
+    return make
+
+
+@pytest.fixture(scope="session")
+def org_row_factory():
+    """Build an organizations table row; keyword arguments override columns."""
+    def make(**overrides):
+        row = {
+            "id": _uuid(),
+            "name": "Test Org",
+            "slug": "test-org",
+            "plan": "free",
+            "created_at": _NOW,
+            "updated_at": _NOW,
+            "settings": {},
+            "limits": {}
+        }
+        row.update(overrides)
+        return row
+    return make
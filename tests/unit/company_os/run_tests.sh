@@ -42,6 +42,7 @@ SPECIFIC_FILE=""
 SPECIFIC_TEST=""
 MARKERS=""
 HTML_REPORT=false
+PARALLEL=false
 
 # Parse arguments
 while [[ $# -gt 0 ]]; do
@@ -58,6 +59,10 @@ while [[ $# -gt 0 ]]; do
             HTML_REPORT=true
             shift
             ;;
+        --parallel|-p)
+            PARALLEL=true
+            shift
+            ;;
         --file|-f)
             SPECIFIC_FILE="$2"
             shift 2
@@ -77,6 +82,7 @@ while [[ $# -gt 0 ]]; do
             echo "  -c, --coverage        Run with coverage report"
             echo "  -v, --verbose         Verbose output"
             echo "  --html                Generate HTML coverage report"
+            echo "  -p, --parallel        Run test classes in parallel (requires pytest-xdist)"
             echo "  -f, --file FILE       Run specific test file"
             echo "  -t, --test TEST       Run specific test"
             echo "  -m, --markers MARKER  Run tests with specific marker"
@@ -87,6 +93,7 @@ while [[ $# -gt 0 ]]; do
             echo "  $0 --file test_event_store.py"
             echo "  $0 --test test_authenticate_success"
             echo "  $0 --markers asyncio"
+            echo "  $0 --parallel --file test_auth_service.py"
             exit 0
             ;;
         *)
@@ -122,6 +129,11 @@ else
     PYTEST_CMD="$PYTEST_CMD -q"
 fi
 
+# Distribute whole test classes across workers so class/module fixtures stay per-worker
+if [ "$PARALLEL" = true ]; then
+    PYTEST_CMD="$PYTEST_CMD -n auto --dist=loadscope"
+fi
+
 # Add coverage flags
 if [ "$COVERAGE" = true ]; then
     PYTEST_CMD="$PYTEST_CMD --cov=company_os.core --cov-report=term-missing"
@@ -5,12 +5,12 @@ Tests user management, tokens, and authorization.
 """
 
 import pytest
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from datetime import datetime, timezone, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
 
 from company_os.core.auth.service import (
-    AuthService,
     AuthenticationError,
     AuthorizationError
 )
@@ -23,33 +23,58 @@ from company_os.core.auth.models import (
     ROLE_PERMISSIONS
 )
 
+from ._ids import seeded_uuid4
 
-class AsyncContextManagerMock:
-    """Mock async context manager for connection pool and transactions."""
-    def __init__(self, return_value=None):
-        self.return_value = return_value
 
-    async def __aenter__(self):
-        return self.return_value
+_NOW = datetime.now(timezone.utc)
+_ALL_PERMS = frozenset(Permission)
+# Deterministic UUID4s for opaque test identifiers
+_uuid = seeded_uuid4()
 
-    async def __aexit__(self, *args):
-        pass
+
+@asynccontextmanager
+async def _yielding(value):
+    """Async context manager that yields value."""
+    yield value
+
+
+def _acm(value):
+    """
+    Side effect for pool.acquire() / conn.transaction() mocks.
+
+    Generator-based context managers are single-use, so each call gets a
+    fresh one yielding value.
+    """
+    return lambda *args, **kwargs: _yielding(value)
+
+
+@pytest.fixture(scope="module")
+def _raw_mock_conn():
+    """Connection mock built once per module; see mock_conn."""
+    conn = AsyncMock()
+    conn.transaction = MagicMock()
+    return conn
+
+
+@pytest.fixture
+def mock_conn(auth_service, _raw_mock_conn):
+    """
+    Connection handed out by the shared AuthService pool.
+
+    The module-wide mock is reset for each test, so tests only configure
+    return values and side effects.
+    """
+    _raw_mock_conn.reset_mock(return_value=True, side_effect=True)
+    _raw_mock_conn.transaction.side_effect = _acm(None)
+
+    auth_service.pool.reset_mock(return_value=True, side_effect=True)
+    auth_service.pool.acquire.side_effect = _acm(_raw_mock_conn)
+    return _raw_mock_conn
 
 
 class TestPasswordHashing:
     """Tests for password hashing functionality."""
 
-    @pytest.fixture
-    def auth_service(self):
-        """Create AuthService with mocked dependencies."""
-        mock_pool = MagicMock()
-        mock_settings = MagicMock()
-        mock_settings.jwt_secret_key = "test-secret"
-        mock_settings.jwt_algorithm = "HS256"
-        mock_settings.access_token_expire_minutes = 15
-        mock_settings.refresh_token_expire_days = 7
-        return AuthService(mock_pool, mock_settings)
-
     def test_hash_password(self, auth_service):
         """Test password hashing produces hash."""
         password = "secure_password_123"
@@ -88,68 +113,16 @@ class TestPasswordHashing:
 class TestUserManagement:
     """Tests for user creation and retrieval."""
 
-    @pytest.fixture
-    def mock_pool(self):
-        """Create mock database pool."""
-        pool = MagicMock()
-        return pool
-
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.jwt_secret_key = "test-secret-key-12345"
-        settings.jwt_algorithm = "HS256"
-        settings.access_token_expire_minutes = 15
-        settings.refresh_token_expire_days = 7
-        return settings
-
-    @pytest.fixture
-    def auth_service(self, mock_pool, mock_settings):
-        """Create AuthService with mocks."""
-        return AuthService(mock_pool, mock_settings)
-
-    @pytest.mark.asyncio
-    async def test_create_user(self, auth_service, mock_pool):
+    async def test_create_user(
+        self, auth_service, mock_conn, user_row_factory, org_row_factory
+    ):
         """Test creating a new user."""
-        user_id = uuid4()
-        org_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(side_effect=[
+        mock_conn.fetchrow.side_effect = [
             # First call - user creation
-            {
-                "id": user_id,
-                "email": "test@example.com",
-                "name": "Test User",
-                "password_hash": "hashed",
-                "is_active": True,
-                "is_verified": False,
-                "created_at": now,
-                "updated_at": now,
-                "last_login": None,
-                "avatar_url": None,
-                "preferences": {}
-            },
+            user_row_factory(is_verified=False),
             # Second call - org creation
-            {
-                "id": org_id,
-                "name": "Test User's Workspace",
-                "slug": "test-user-abc123",
-                "plan": "free",
-                "created_at": now,
-                "updated_at": now,
-                "settings": {},
-                "limits": {}
-            }
-        ])
-        mock_conn.execute = AsyncMock()
-
-        # Setup proper async context managers
-        # transaction() returns a context manager, not a coroutine
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
+            org_row_factory(name="Test User's Workspace", slug="test-user-abc123")
+        ]
 
         user, org = await auth_service.create_user(
             email="test@example.com",
@@ -161,28 +134,14 @@ class TestUserManagement:
         assert user.name == "Test User"
         assert org.plan == "free"
 
-    @pytest.mark.asyncio
-    async def test_get_user_by_email(self, auth_service, mock_pool):
+    async def test_get_user_by_email(self, auth_service, mock_conn, user_row_factory):
         """Test retrieving user by email."""
-        user_id = uuid4()
-        now = datetime.now(timezone.utc)
+        now = _NOW
 
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": user_id,
-            "email": "test@example.com",
-            "name": "Test User",
-            "password_hash": "hashed",
-            "is_active": True,
-            "is_verified": True,
-            "created_at": now,
-            "updated_at": now,
-            "last_login": now,
-            "avatar_url": None,
-            "preferences": {"theme": "dark"}
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        mock_conn.fetchrow.return_value = user_row_factory(
+            last_login=now,
+            preferences={"theme": "dark"}
+        )
 
         user = await auth_service.get_user_by_email("test@example.com")
 
@@ -190,40 +149,22 @@ class TestUserManagement:
         assert user.email == "test@example.com"
         assert user.preferences == {"theme": "dark"}
 
-    @pytest.mark.asyncio
-    async def test_get_user_by_email_not_found(self, auth_service, mock_pool):
+    async def test_get_user_by_email_not_found(self, auth_service, mock_conn):
         """Test retrieving non-existent user returns None."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value=None)
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        mock_conn.fetchrow.return_value = None
 
         user = await auth_service.get_user_by_email("nonexistent@example.com")
 
         assert user is None
 
-    @pytest.mark.asyncio
-    async def test_get_user_by_id(self, auth_service, mock_pool):
+    async def test_get_user_by_id(self, auth_service, mock_conn, user_row_factory):
         """Test retrieving user by ID."""
-        user_id = uuid4()
-        now = datetime.now(timezone.utc)
+        user_id = _uuid()
 
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": user_id,
-            "email": "test@example.com",
-            "name": "Test User",
-            "password_hash": "hashed",
-            "is_active": True,
-            "is_verified": True,
-            "created_at": now,
-            "updated_at": now,
-            "last_login": None,
-            "avatar_url": "https://example.com/avatar.png",
-            "preferences": {}
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        mock_conn.fetchrow.return_value = user_row_factory(
+            id=user_id,
+            avatar_url="https://example.com/avatar.png"
+        )
 
         user = await auth_service.get_user_by_id(user_id)
 
@@ -235,110 +176,51 @@ class TestUserManagement:
 class TestAuthentication:
     """Tests for authentication flow."""
 
-    @pytest.fixture
-    def mock_pool(self):
-        return MagicMock()
-
-    @pytest.fixture
-    def mock_settings(self):
-        settings = MagicMock()
-        settings.jwt_secret_key = "test-secret-key-12345"
-        settings.jwt_algorithm = "HS256"
-        settings.access_token_expire_minutes = 15
-        settings.refresh_token_expire_days = 7
-        return settings
-
-    @pytest.fixture
-    def auth_service(self, mock_pool, mock_settings):
-        return AuthService(mock_pool, mock_settings)
-
-    @pytest.mark.asyncio
-    async def test_authenticate_success(self, auth_service, mock_pool):
+    @pytest.fixture(scope="module")
+    def password_and_hash(self, auth_service):
+        """Hash one password for reuse across authentication tests."""
+        password = "correct_password"
+        return password, auth_service.hash_password(password)
+
+    async def test_authenticate_success(
+        self, auth_service, mock_conn, password_and_hash, user_row_factory, org_row_factory
+    ):
         """Test successful authentication."""
-        user_id = uuid4()
-        org_id = uuid4()
-        now = datetime.now(timezone.utc)
-        password_hash = auth_service.hash_password("correct_password")
+        org_id = _uuid()
+        password, password_hash = password_and_hash
 
-        mock_conn = AsyncMock()
-        # First call - get user
-        mock_conn.fetchrow = AsyncMock(side_effect=[
-            {
-                "id": user_id,
-                "email": "test@example.com",
-                "name": "Test User",
-                "password_hash": password_hash,
-                "is_active": True,
-                "is_verified": True,
-                "created_at": now,
-                "updated_at": now,
-                "last_login": None,
-                "avatar_url": None,
-                "preferences": {}
-            },
+        mock_conn.fetchrow.side_effect = [
+            # First call - get user
+            user_row_factory(password_hash=password_hash),
             # Second call - get org
-            {
-                "id": org_id,
-                "name": "Test Org",
-                "slug": "test-org",
-                "plan": "free",
-                "created_at": now,
-                "updated_at": now,
-                "settings": {},
-                "limits": {}
-            }
-        ])
-        mock_conn.execute = AsyncMock()
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+            org_row_factory(id=org_id)
+        ]
 
         user, org = await auth_service.authenticate(
             email="test@example.com",
-            password="correct_password"
+            password=password
         )
 
         assert user.email == "test@example.com"
         assert org.id == org_id
 
-    @pytest.mark.asyncio
-    async def test_authenticate_wrong_password(self, auth_service, mock_pool):
+    async def test_authenticate_wrong_password(
+        self, auth_service, mock_conn, password_and_hash, user_row_factory
+    ):
         """Test authentication fails with wrong password."""
-        user_id = uuid4()
-        now = datetime.now(timezone.utc)
-        password_hash = auth_service.hash_password("correct_password")
+        _, password_hash = password_and_hash
 
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": user_id,
-            "email": "test@example.com",
-            "name": "Test User",
-            "password_hash": password_hash,
-            "is_active": True,
-            "is_verified": True,
-            "created_at": now,
-            "updated_at": now,
-            "last_login": None,
-            "avatar_url": None,
-            "preferences": {}
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
-        with pytest.raises(AuthenticationError) as exc_info:
+        mock_conn.fetchrow.return_value = user_row_factory(password_hash=password_hash)
+
+        with pytest.raises(AuthenticationError, match="Invalid"):
             await auth_service.authenticate(
                 email="test@example.com",
                 password="wrong_password"
             )
 
-        assert "Invalid" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_authenticate_user_not_found(self, auth_service, mock_pool):
+    async def test_authenticate_user_not_found(self, auth_service, mock_conn):
         """Test authentication fails for non-existent user."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value=None)
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        mock_conn.fetchrow.return_value = None
 
         with pytest.raises(AuthenticationError):
             await auth_service.authenticate(
@@ -346,91 +228,82 @@ class TestAuthentication:
                 password="any_password"
             )
 
-    @pytest.mark.asyncio
-    async def test_authenticate_inactive_user(self, auth_service, mock_pool):
+    async def test_authenticate_inactive_user(
+        self, auth_service, mock_conn, password_and_hash, user_row_factory
+    ):
         """Test authentication fails for inactive user."""
-        user_id = uuid4()
-        now = datetime.now(timezone.utc)
-        password_hash = auth_service.hash_password("password")
+        password, password_hash = password_and_hash
 
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": user_id,
-            "email": "test@example.com",
-            "name": "Test User",
-            "password_hash": password_hash,
-            "is_active": False,  # Inactive!
-            "is_verified": True,
-            "created_at": now,
-            "updated_at": now,
-            "last_login": None,
-            "avatar_url": None,
-            "preferences": {}
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
-        with pytest.raises(AuthenticationError) as exc_info:
+        mock_conn.fetchrow.return_value = user_row_factory(
+            password_hash=password_hash,
+            is_active=False  # Inactive!
+        )
+
+        with pytest.raises(AuthenticationError, match="disabled"):
             await auth_service.authenticate(
                 email="test@example.com",
-                password="password"
+                password=password
             )
 
-        assert "disabled" in str(exc_info.value)
-
+    async def test_authenticate_inactive_user_wrong_password(
+        self, auth_service, mock_conn, password_and_hash, user_row_factory
+    ):
+        """Test inactive status is not revealed without the right password."""
+        _, password_hash = password_and_hash
 
-class TestTokenManagement:
-    """Tests for JWT token creation and verification."""
+        mock_conn.fetchrow.return_value = user_row_factory(
+            password_hash=password_hash,
+            is_active=False
+        )
 
-    @pytest.fixture
-    def mock_pool(self):
-        return MagicMock()
+        with pytest.raises(AuthenticationError, match="Invalid email or password"):
+            await auth_service.authenticate(
+                email="test@example.com",
+                password="wrong_password"
+            )
 
-    @pytest.fixture
-    def mock_settings(self):
-        settings = MagicMock()
-        settings.jwt_secret_key = "test-secret-key-for-jwt-signing"
-        settings.jwt_algorithm = "HS256"
-        settings.access_token_expire_minutes = 15
-        settings.refresh_token_expire_days = 7
-        return settings
 
-    @pytest.fixture
-    def auth_service(self, mock_pool, mock_settings):
-        return AuthService(mock_pool, mock_settings)
+class TestTokenManagement:
+    """Tests for JWT token creation and verification."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_user(self):
         return User(
-            id=uuid4(),
+            id=_uuid(),
             email="test@example.com",
             name="Test User",
             password_hash="hashed",
             is_active=True,
             is_verified=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            created_at=_NOW,
+            updated_at=_NOW
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_org(self):
         return Organization(
-            id=uuid4(),
+            id=_uuid(),
             name="Test Org",
             slug="test-org",
             plan="free",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            created_at=_NOW,
+            updated_at=_NOW
         )
 
-    @pytest.mark.asyncio
-    async def test_create_tokens(self, auth_service, mock_pool, sample_user, sample_org):
-        """Test token creation."""
+    @pytest.fixture(scope="module")
+    async def issued_tokens(self, auth_service, sample_user, sample_org):
+        """Issue one token pair for the verification tests to share."""
         mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value="owner")  # User role
+        mock_conn.fetchval = AsyncMock(return_value="owner")
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        auth_service.pool.acquire.side_effect = _acm(mock_conn)
+
+        return await auth_service.create_tokens(sample_user, sample_org)
+
+    async def test_create_tokens(self, auth_service, mock_conn, sample_user, sample_org):
+        """Test token creation."""
+        mock_conn.fetchval.return_value = "owner"  # User role
 
         tokens = await auth_service.create_tokens(sample_user, sample_org)
 
@@ -439,93 +312,63 @@ class TestTokenManagement:
         assert tokens.token_type == "bearer"
         assert tokens.expires_in == 15 * 60  # 15 minutes in seconds
 
-    @pytest.mark.asyncio
-    async def test_verify_access_token(self, auth_service, mock_pool, sample_user, sample_org):
+    async def test_verify_access_token(self, auth_service, issued_tokens, sample_user, sample_org):
         """Test access token verification."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value="owner")
-        mock_conn.execute = AsyncMock()
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
-        tokens = await auth_service.create_tokens(sample_user, sample_org)
-
-        payload = await auth_service.verify_access_token(tokens.access_token)
+        payload = await auth_service.verify_access_token(issued_tokens.access_token)
 
         assert payload.sub == str(sample_user.id)
         assert payload.org_id == str(sample_org.id)
 
-    @pytest.mark.asyncio
     async def test_verify_invalid_token(self, auth_service):
         """Test verification fails for invalid token."""
         with pytest.raises(AuthenticationError):
             await auth_service.verify_access_token("invalid-token")
 
-    @pytest.mark.asyncio
-    async def test_verify_expired_token(self, auth_service, mock_pool, sample_user, sample_org):
+    async def test_verify_expired_token(self, auth_service, mock_conn, sample_user, sample_org):
         """Test verification fails for expired token."""
-        # Create service with very short expiry
-        auth_service.settings.access_token_expire_minutes = -1  # Already expired
-
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value="owner")
-        mock_conn.execute = AsyncMock()
+        mock_conn.fetchval.return_value = "owner"
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        # Issue tokens with a negative expiry; the service is shared, so restore it
+        settings = auth_service.settings
+        auth_service.settings = replace(settings, access_token_expire_minutes=-1)  # Already expired
+        try:
+            tokens = await auth_service.create_tokens(sample_user, sample_org)
+        finally:
+            auth_service.settings = settings
 
-        tokens = await auth_service.create_tokens(sample_user, sample_org)
-
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError, match="(?i)expired"):
             await auth_service.verify_access_token(tokens.access_token)
 
-        assert "expired" in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_refresh_tokens_success(self, auth_service, mock_pool, sample_user, sample_org):
+    async def test_refresh_tokens_success(
+        self, auth_service, mock_conn, monkeypatch,
+        sample_user, sample_org, user_row_factory, org_row_factory
+    ):
         """Test successful token refresh with rotation."""
-        refresh_token_id = uuid4()
+        refresh_token_id = _uuid()
         user_id = sample_user.id
-        now = datetime.now(timezone.utc)
+        now = _NOW
 
-        mock_conn = AsyncMock()
         # First fetchrow - find refresh token
         # Second fetchrow - get user
         # Third fetchrow - get org
-        mock_conn.fetchrow = AsyncMock(side_effect=[
+        rows = iter([
             {
                 "id": refresh_token_id,
                 "user_id": user_id,
                 "expires_at": now + timedelta(days=7),
                 "revoked_at": None
             },
-            {
-                "id": user_id,
-                "email": sample_user.email,
-                "name": sample_user.name,
-                "password_hash": "hashed",
-                "is_active": True,
-                "is_verified": True,
-                "created_at": now,
-                "updated_at": now,
-                "last_login": None,
-                "avatar_url": None,
-                "preferences": {}
-            },
-            {
-                "id": sample_org.id,
-                "name": sample_org.name,
-                "slug": sample_org.slug,
-                "plan": "free",
-                "created_at": now,
-                "updated_at": now,
-                "settings": {},
-                "limits": {}
-            }
+            user_row_factory(id=user_id, email=sample_user.email, name=sample_user.name),
+            org_row_factory(id=sample_org.id, name=sample_org.name, slug=sample_org.slug)
         ])
-        mock_conn.fetchval = AsyncMock(return_value="owner")
-        mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        async def _fetchrow(*args, **kwargs):
+            return next(rows)
+
+        # Plain coroutine: call history is only asserted on execute. monkeypatch
+        # restores the shared connection mock's fetchrow afterwards.
+        monkeypatch.setattr(mock_conn, "fetchrow", _fetchrow)
+        mock_conn.fetchval.return_value = "owner"
 
         new_tokens = await auth_service.refresh_tokens(
             refresh_token="valid_refresh_token",
@@ -538,68 +381,31 @@ class TestTokenManagement:
         # Verify old token was revoked
         assert mock_conn.execute.call_count >= 2  # Revoke old + store new
 
-    @pytest.mark.asyncio
-    async def test_refresh_tokens_invalid_token(self, auth_service, mock_pool):
-        """Test refresh fails with invalid token."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value=None)  # Token not found
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            await auth_service.refresh_tokens("invalid_token")
-
-        assert "Invalid refresh token" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_refresh_tokens_revoked_token(self, auth_service, mock_pool):
-        """Test refresh fails with revoked token."""
-        refresh_token_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": refresh_token_id,
-            "user_id": uuid4(),
-            "expires_at": now + timedelta(days=7),
-            "revoked_at": now - timedelta(hours=1)  # Already revoked
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            await auth_service.refresh_tokens("revoked_token")
-
-        assert "revoked" in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_refresh_tokens_expired_token(self, auth_service, mock_pool):
-        """Test refresh fails with expired token."""
-        refresh_token_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        mock_conn = AsyncMock()
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": refresh_token_id,
-            "user_id": uuid4(),
-            "expires_at": now - timedelta(days=1),  # Expired
+    @pytest.mark.parametrize("row,msg", [
+        (None, "Invalid refresh token"),  # Token not found
+        ({
+            "id": _uuid(),
+            "user_id": _uuid(),
+            "expires_at": _NOW + timedelta(days=7),
+            "revoked_at": _NOW - timedelta(hours=1)  # Already revoked
+        }, "(?i)revoked"),
+        ({
+            "id": _uuid(),
+            "user_id": _uuid(),
+            "expires_at": _NOW - timedelta(days=1),  # Expired
             "revoked_at": None
-        })
+        }, "(?i)expired"),
+    ], ids=["invalid", "revoked", "expired"])
+    async def test_refresh_tokens_failure(self, auth_service, mock_conn, row, msg):
+        """Test refresh fails with unknown, revoked or expired tokens."""
+        mock_conn.fetchrow.return_value = row
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        with pytest.raises(AuthenticationError, match=msg):
+            await auth_service.refresh_tokens("refresh_token")
 
-        with pytest.raises(AuthenticationError) as exc_info:
-            await auth_service.refresh_tokens("expired_token")
-
-        assert "expired" in str(exc_info.value).lower()
-
-    @pytest.mark.asyncio
-    async def test_revoke_refresh_token(self, auth_service, mock_pool):
+    async def test_revoke_refresh_token(self, auth_service, mock_conn):
         """Test revoking a refresh token (logout)."""
-        mock_conn = AsyncMock()
-        mock_conn.execute = AsyncMock(return_value="UPDATE 1")
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        mock_conn.execute.return_value = "UPDATE 1"
 
         await auth_service.revoke_refresh_token("token_to_revoke")
 
@@ -612,117 +418,74 @@ class TestTokenManagement:
 class TestAuthorization:
     """Tests for permission checking."""
 
-    @pytest.fixture
-    def mock_pool(self):
-        return MagicMock()
-
-    @pytest.fixture
-    def mock_settings(self):
-        settings = MagicMock()
-        settings.jwt_secret_key = "test-secret"
-        settings.jwt_algorithm = "HS256"
-        settings.access_token_expire_minutes = 15
-        settings.refresh_token_expire_days = 7
-        return settings
-
-    @pytest.fixture
-    def auth_service(self, mock_pool, mock_settings):
-        return AuthService(mock_pool, mock_settings)
+    @pytest.fixture(scope="module")
+    def make_payload(self):
+        """Build TokenPayloads that differ only in role and permissions."""
+        sub, org_id, jti = str(_uuid()), str(_uuid()), str(_uuid())
+        exp = _NOW + timedelta(hours=1)
+
+        def make(role, permissions):
+            return TokenPayload(
+                sub=sub,
+                org_id=org_id,
+                role=role,
+                permissions=permissions,
+                exp=exp,
+                iat=_NOW,
+                jti=jti
+            )
+        return make
 
-    def test_check_permission_granted(self, auth_service):
+    def test_check_permission_granted(self, auth_service, make_payload):
         """Test permission check returns True when granted."""
-        payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
-            role="admin",
-            permissions=["tasks:create", "tasks:read", "tasks:update"],
-            exp=datetime.now(timezone.utc) + timedelta(hours=1),
-            iat=datetime.now(timezone.utc),
-            jti=str(uuid4())
-        )
+        payload = make_payload("admin", ["tasks:create", "tasks:read", "tasks:update"])
 
         assert auth_service.check_permission(payload, Permission.TASKS_CREATE) is True
         assert auth_service.check_permission(payload, Permission.TASKS_READ) is True
 
-    def test_check_permission_denied(self, auth_service):
+    def test_check_permission_denied(self, auth_service, make_payload):
         """Test permission check returns False when not granted."""
-        payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
-            role="viewer",
-            permissions=["tasks:read"],
-            exp=datetime.now(timezone.utc) + timedelta(hours=1),
-            iat=datetime.now(timezone.utc),
-            jti=str(uuid4())
-        )
+        payload = make_payload("viewer", ["tasks:read"])
 
         assert auth_service.check_permission(payload, Permission.TASKS_CREATE) is False
         assert auth_service.check_permission(payload, Permission.ADMIN_FULL) is False
 
-    def test_require_permission_success(self, auth_service):
+    def test_require_permission_success(self, auth_service, make_payload):
         """Test require_permission passes when granted."""
-        payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
-            role="admin",
-            permissions=["tasks:delete"],
-            exp=datetime.now(timezone.utc) + timedelta(hours=1),
-            iat=datetime.now(timezone.utc),
-            jti=str(uuid4())
-        )
+        payload = make_payload("admin", ["tasks:delete"])
 
         # Should not raise
         auth_service.require_permission(payload, Permission.TASKS_DELETE)
 
-    def test_require_permission_failure(self, auth_service):
+    def test_require_permission_failure(self, auth_service, make_payload):
         """Test require_permission raises when denied."""
-        payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
-            role="viewer",
-            permissions=["tasks:read"],
-            exp=datetime.now(timezone.utc) + timedelta(hours=1),
-            iat=datetime.now(timezone.utc),
-            jti=str(uuid4())
-        )
+        payload = make_payload("viewer", ["tasks:read"])
 
-        with pytest.raises(AuthorizationError) as exc_info:
+        with pytest.raises(AuthorizationError, match="Permission denied"):
             auth_service.require_permission(payload, Permission.TASKS_DELETE)
 
-        assert "Permission denied" in str(exc_info.value)
-
 
 class TestRolePermissionMappings:
     """Tests for role-permission mapping configuration."""
 
-    def test_owner_has_all_permissions(self):
-        """Test owner role has all permissions."""
-        owner_perms = ROLE_PERMISSIONS[UserRole.OWNER]
-        assert owner_perms == set(Permission)
-
-    def test_admin_has_expected_permissions(self):
-        """Test admin role has expected permissions."""
-        admin_perms = ROLE_PERMISSIONS[UserRole.ADMIN]
-
-        assert Permission.TASKS_CREATE in admin_perms
-        assert Permission.TASKS_DELETE in admin_perms
-        assert Permission.AGENTS_CONFIGURE in admin_perms
-        assert Permission.ADMIN_FULL not in admin_perms
-
-    def test_member_has_limited_permissions(self):
-        """Test member role has limited permissions."""
-        member_perms = ROLE_PERMISSIONS[UserRole.MEMBER]
-
-        assert Permission.TASKS_CREATE in member_perms
-        assert Permission.TASKS_READ in member_perms
-        assert Permission.TASKS_DELETE not in member_perms
-        assert Permission.ORG_MANAGE not in member_perms
-
-    def test_viewer_has_read_only(self):
-        """Test viewer role has read-only permissions."""
-        viewer_perms = ROLE_PERMISSIONS[UserRole.VIEWER]
-
-        assert Permission.TASKS_READ in viewer_perms
-        assert Permission.PROJECTS_READ in viewer_perms
-        assert Permission.TASKS_CREATE not in viewer_perms
-        assert Permission.TASKS_UPDATE not in viewer_perms
+    @pytest.mark.parametrize("role,must_have,must_not_have", [
+        # Owner has every permission
+        (UserRole.OWNER, _ALL_PERMS, []),
+        (UserRole.ADMIN,
+         [Permission.TASKS_CREATE, Permission.TASKS_DELETE, Permission.AGENTS_CONFIGURE],
+         [Permission.ADMIN_FULL]),
+        # Member has limited permissions
+        (UserRole.MEMBER,
+         [Permission.TASKS_CREATE, Permission.TASKS_READ],
+         [Permission.TASKS_DELETE, Permission.ORG_MANAGE]),
+        # Viewer is read-only
+        (UserRole.VIEWER,
+         [Permission.TASKS_READ, Permission.PROJECTS_READ],
+         [Permission.TASKS_CREATE, Permission.TASKS_UPDATE]),
+    ], ids=["owner", "admin", "member", "viewer"])
+    def test_role_permissions(self, role, must_have, must_not_have):
+        """Test each role grants and withholds the expected permissions."""
+        perms = ROLE_PERMISSIONS[role]
+
+        assert all(p in perms for p in must_have)
+        assert not any(p in perms for p in must_not_have)
@@ -5,9 +5,9 @@ Tests all dataclasses, enums, and permission mappings from auth models.
 """
 
 import unittest
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime, timedelta
-from uuid import uuid4, UUID
+from uuid import UUID
 
 from company_os.core.auth.models import (
     User,
@@ -20,12 +20,134 @@ from company_os.core.auth.models import (
     TokenPayload,
     UserRole,
     Permission,
+    PERMISSION_VALUES,
     ROLE_PERMISSIONS,
+    ROLE_PERMISSION_MASKS,
+    permissions_mask,
+    role_from_string,
 )
 
 
-class TestUserRole(unittest.TestCase):
-    """Test UserRole enum."""
+# Fixed timestamps: deterministic and no clock read per test
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_NOW_PLUS_15M = _NOW + timedelta(minutes=15)
+_NOW_PLUS_1H = _NOW + timedelta(hours=1)
+_NOW_PLUS_30D = _NOW + timedelta(days=30)
+_NOW_EPOCH = int(_NOW.timestamp())
+
+# Opaque identifiers; none of these tests depend on randomness
+_UUID_POOL = tuple(UUID(int=i) for i in range(1, 33))
+
+# Base instances for tests that vary a single field via dataclasses.replace
+# (and, for User, read-only field inspection)
+_BASE_USER = User(
+    id=_UUID_POOL[0],
+    email="test@example.com",
+    name="Test User",
+    password_hash="hash",
+    is_active=True,
+    is_verified=False,
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+_BASE_ORG = Organization(
+    id=_UUID_POOL[0],
+    name="Test Org",
+    slug="test-org",
+    plan="free",
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+_BASE_MEMBERSHIP = OrgMembership(
+    user_id=_UUID_POOL[0],
+    org_id=_UUID_POOL[1],
+    role=UserRole.MEMBER,
+    joined_at=_NOW,
+)
+
+_BASE_OAUTH = OAuthAccount(
+    id=_UUID_POOL[0],
+    user_id=_UUID_POOL[1],
+    provider="github",
+    provider_user_id="12345",
+    provider_username=None,
+    access_token="token",
+    refresh_token=None,
+    token_expires_at=None,
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+_ALL_PERMS = frozenset(Permission)
+
+# Role x permission matrix as bitmasks (see ROLE_PERMISSION_MASKS)
+_EXPECTED_ROLE_MASKS = {
+    UserRole.OWNER: 0xFFFF,
+    UserRole.ADMIN: 0xFFFF & ~(
+        Permission.ORG_MANAGE.mask
+        | Permission.ORG_BILLING.mask
+        | Permission.ADMIN_FULL.mask
+    ),
+    UserRole.MEMBER: (
+        Permission.TASKS_CREATE.mask | Permission.TASKS_READ.mask
+        | Permission.TASKS_UPDATE.mask | Permission.TASKS_ASSIGN.mask
+        | Permission.AGENTS_ACTIVATE.mask | Permission.AGENTS_VIEW.mask
+        | Permission.PROJECTS_READ.mask
+    ),
+    UserRole.VIEWER: (
+        Permission.TASKS_READ.mask | Permission.AGENTS_VIEW.mask
+        | Permission.PROJECTS_READ.mask
+    ),
+}
+
+_EXPECTED_PERM_VALUES = (
+    (Permission.TASKS_CREATE, "tasks:create"),
+    (Permission.TASKS_READ, "tasks:read"),
+    (Permission.TASKS_UPDATE, "tasks:update"),
+    (Permission.TASKS_DELETE, "tasks:delete"),
+    (Permission.TASKS_ASSIGN, "tasks:assign"),
+    (Permission.AGENTS_ACTIVATE, "agents:activate"),
+    (Permission.AGENTS_VIEW, "agents:view"),
+    (Permission.AGENTS_CONFIGURE, "agents:configure"),
+    (Permission.PROJECTS_CREATE, "projects:create"),
+    (Permission.PROJECTS_READ, "projects:read"),
+    (Permission.PROJECTS_UPDATE, "projects:update"),
+    (Permission.PROJECTS_DELETE, "projects:delete"),
+    (Permission.ORG_MANAGE, "org:manage"),
+    (Permission.ORG_BILLING, "org:billing"),
+    (Permission.ORG_MEMBERS, "org:members"),
+    (Permission.ADMIN_FULL, "admin:full"),
+)
+
+_EXPECTED_ADMIN_PERMS = frozenset({
+    Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
+    Permission.TASKS_DELETE, Permission.TASKS_ASSIGN,
+    Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW, Permission.AGENTS_CONFIGURE,
+    Permission.PROJECTS_CREATE, Permission.PROJECTS_READ, Permission.PROJECTS_UPDATE,
+    Permission.PROJECTS_DELETE,
+    Permission.ORG_MEMBERS,
+})
+
+_EXPECTED_MEMBER_PERMS = frozenset({
+    Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
+    Permission.TASKS_ASSIGN,
+    Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW,
+    Permission.PROJECTS_READ,
+})
+
+_EXPECTED_VIEWER_PERMS = frozenset({
+    Permission.TASKS_READ,
+    Permission.AGENTS_VIEW,
+    Permission.PROJECTS_READ,
+})
+
+
+class TestAuthEnums(unittest.TestCase):
+    """Test UserRole and Permission enums and role permission mappings."""
+
+    # UserRole enum
 
     def test_all_role_values(self):
         """Test that all expected roles exist."""
@@ -53,78 +175,46 @@ class TestUserRole(unittest.TestCase):
 
     def test_role_from_string(self):
         """Test creating role from string value."""
-        role = UserRole("admin")
-        self.assertEqual(role, UserRole.ADMIN)
-
-
-class TestPermission(unittest.TestCase):
-    """Test Permission enum."""
-
-    def test_task_permissions_exist(self):
-        """Test all task permissions are defined."""
-        self.assertEqual(Permission.TASKS_CREATE.value, "tasks:create")
-        self.assertEqual(Permission.TASKS_READ.value, "tasks:read")
-        self.assertEqual(Permission.TASKS_UPDATE.value, "tasks:update")
-        self.assertEqual(Permission.TASKS_DELETE.value, "tasks:delete")
-        self.assertEqual(Permission.TASKS_ASSIGN.value, "tasks:assign")
-
-    def test_agent_permissions_exist(self):
-        """Test all agent permissions are defined."""
-        self.assertEqual(Permission.AGENTS_ACTIVATE.value, "agents:activate")
-        self.assertEqual(Permission.AGENTS_VIEW.value, "agents:view")
-        self.assertEqual(Permission.AGENTS_CONFIGURE.value, "agents:configure")
-
-    def test_project_permissions_exist(self):
-        """Test all project permissions are defined."""
-        self.assertEqual(Permission.PROJECTS_CREATE.value, "projects:create")
-        self.assertEqual(Permission.PROJECTS_READ.value, "projects:read")
-        self.assertEqual(Permission.PROJECTS_UPDATE.value, "projects:update")
-        self.assertEqual(Permission.PROJECTS_DELETE.value, "projects:delete")
-
-    def test_org_permissions_exist(self):
-        """Test all organization permissions are defined."""
-        self.assertEqual(Permission.ORG_MANAGE.value, "org:manage")
-        self.assertEqual(Permission.ORG_BILLING.value, "org:billing")
-        self.assertEqual(Permission.ORG_MEMBERS.value, "org:members")
-
-    def test_admin_permissions_exist(self):
-        """Test admin permissions are defined."""
-        self.assertEqual(Permission.ADMIN_FULL.value, "admin:full")
+        role = role_from_string("admin")
+        self.assertIs(role, UserRole.ADMIN)
+
+    def test_role_from_invalid_string(self):
+        """Test that unknown role strings are rejected like UserRole(value)."""
+        with self.assertRaises(ValueError):
+            role_from_string("superuser")
+
+    # Permission enum
+
+    def test_all_permission_values(self):
+        """Test every permission value, each in resource:action form."""
+        self.assertEqual(frozenset(p for p, _ in _EXPECTED_PERM_VALUES), _ALL_PERMS)
+        for perm, value in _EXPECTED_PERM_VALUES:
+            with self.subTest(perm=perm):
+                self.assertEqual(perm.value, value)
+                self.assertIn(":", value)
+
+    def test_permission_values_set(self):
+        """Test PERMISSION_VALUES holds every value in resource:action form."""
+        self.assertEqual(PERMISSION_VALUES, {value for _, value in _EXPECTED_PERM_VALUES})
+        self.assertTrue(all(":" in value for value in PERMISSION_VALUES))
 
     def test_permission_count(self):
         """Test that we have exactly 16 permissions."""
         self.assertEqual(len(Permission), 16)
 
-    def test_permission_naming_convention(self):
-        """Test that all permissions follow resource:action naming."""
-        for perm in Permission:
-            self.assertIn(":", perm.value, f"Permission {perm.value} doesn't follow resource:action format")
-
-
-class TestRolePermissions(unittest.TestCase):
-    """Test ROLE_PERMISSIONS mapping."""
+    # ROLE_PERMISSIONS mapping
 
     def test_owner_has_all_permissions(self):
         """Test that OWNER role has all permissions."""
         owner_perms = ROLE_PERMISSIONS[UserRole.OWNER]
-        all_perms = set(Permission)
-        self.assertEqual(owner_perms, all_perms)
+        self.assertEqual(owner_perms, _ALL_PERMS)
         self.assertEqual(len(owner_perms), 16)
 
     def test_admin_has_expected_permissions(self):
         """Test that ADMIN role has expected permissions."""
         admin_perms = ROLE_PERMISSIONS[UserRole.ADMIN]
 
-        # Admin should have these permissions
-        expected = {
-            Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
-            Permission.TASKS_DELETE, Permission.TASKS_ASSIGN,
-            Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW, Permission.AGENTS_CONFIGURE,
-            Permission.PROJECTS_CREATE, Permission.PROJECTS_READ, Permission.PROJECTS_UPDATE,
-            Permission.PROJECTS_DELETE,
-            Permission.ORG_MEMBERS,
-        }
-        self.assertEqual(admin_perms, expected)
+        self.assertEqual(admin_perms, _EXPECTED_ADMIN_PERMS)
         self.assertEqual(len(admin_perms), 13)
 
     def test_admin_lacks_owner_permissions(self):
@@ -140,13 +230,7 @@ class TestRolePermissions(unittest.TestCase):
         """Test that MEMBER role has limited permissions."""
         member_perms = ROLE_PERMISSIONS[UserRole.MEMBER]
 
-        expected = {
-            Permission.TASKS_CREATE, Permission.TASKS_READ, Permission.TASKS_UPDATE,
-            Permission.TASKS_ASSIGN,
-            Permission.AGENTS_ACTIVATE, Permission.AGENTS_VIEW,
-            Permission.PROJECTS_READ,
-        }
-        self.assertEqual(member_perms, expected)
+        self.assertEqual(member_perms, _EXPECTED_MEMBER_PERMS)
         self.assertEqual(len(member_perms), 7)
 
     def test_member_cannot_delete(self):
@@ -161,12 +245,7 @@ class TestRolePermissions(unittest.TestCase):
         """Test that VIEWER role is read-only."""
         viewer_perms = ROLE_PERMISSIONS[UserRole.VIEWER]
 
-        expected = {
-            Permission.TASKS_READ,
-            Permission.AGENTS_VIEW,
-            Permission.PROJECTS_READ,
-        }
-        self.assertEqual(viewer_perms, expected)
+        self.assertEqual(viewer_perms, _EXPECTED_VIEWER_PERMS)
         self.assertEqual(len(viewer_perms), 3)
 
     def test_viewer_cannot_write(self):
@@ -182,9 +261,8 @@ class TestRolePermissions(unittest.TestCase):
 
     def test_all_roles_have_permission_sets(self):
         """Test that all roles have permission mappings."""
-        for role in UserRole:
-            self.assertIn(role, ROLE_PERMISSIONS)
-            self.assertIsInstance(ROLE_PERMISSIONS[role], set)
+        self.assertEqual(set(ROLE_PERMISSIONS), set(UserRole))
+        self.assertTrue(all(isinstance(v, frozenset) for v in ROLE_PERMISSIONS.values()))
 
     def test_permission_hierarchy(self):
         """Test that permission sets follow a hierarchy (owner > admin > member > viewer)."""
@@ -193,23 +271,53 @@ class TestRolePermissions(unittest.TestCase):
         member_perms = ROLE_PERMISSIONS[UserRole.MEMBER]
         viewer_perms = ROLE_PERMISSIONS[UserRole.VIEWER]
 
-        # Admin permissions should be subset of owner
-        self.assertTrue(admin_perms.issubset(owner_perms))
+        self.assertTrue(viewer_perms <= member_perms <= admin_perms <= owner_perms)
+
+    # ROLE_PERMISSION_MASKS bitmask mapping
+
+    def test_permission_masks_are_distinct_bits(self):
+        """Test that each permission maps to its own bit within a uint16."""
+        masks = [perm.mask for perm in Permission]
+        self.assertEqual(len(set(masks)), 16)
+        for mask in masks:
+            self.assertEqual(mask & (mask - 1), 0)
+        self.assertEqual(permissions_mask(Permission), 0xFFFF)
 
-        # Member permissions should be subset of admin
-        self.assertTrue(member_perms.issubset(admin_perms))
+    def test_masks_match_permission_sets(self):
+        """Test that every role mask encodes its permission set."""
+        self.assertEqual(set(ROLE_PERMISSION_MASKS), set(UserRole))
+        for role, perms in ROLE_PERMISSIONS.items():
+            mask = ROLE_PERMISSION_MASKS[role]
+            for perm in Permission:
+                self.assertEqual(bool(mask & perm.mask), perm in perms)
 
-        # Viewer permissions should be subset of member
-        self.assertTrue(viewer_perms.issubset(member_perms))
+    def test_role_permission_matrix(self):
+        """Test each role's mask against the expected role x permission matrix."""
+        for role, expected in _EXPECTED_ROLE_MASKS.items():
+            with self.subTest(role=role):
+                self.assertEqual(ROLE_PERMISSION_MASKS[role], expected)
 
+    def test_mask_hierarchy(self):
+        """Test that role masks nest (viewer within member within admin within owner)."""
+        owner_mask = ROLE_PERMISSION_MASKS[UserRole.OWNER]
+        admin_mask = ROLE_PERMISSION_MASKS[UserRole.ADMIN]
+        member_mask = ROLE_PERMISSION_MASKS[UserRole.MEMBER]
+        viewer_mask = ROLE_PERMISSION_MASKS[UserRole.VIEWER]
 
-class TestUser(unittest.TestCase):
-    """Test User dataclass."""
+        self.assertEqual(admin_mask & owner_mask, admin_mask)
+        self.assertEqual(member_mask & admin_mask, member_mask)
+        self.assertEqual(viewer_mask & member_mask, viewer_mask)
+
+
+class TestCoreDataclasses(unittest.TestCase):
+    """Test User, Organization and OrgMembership dataclasses."""
+
+    # User dataclass
 
     def test_user_creation(self):
         """Test creating a user with all fields."""
-        user_id = uuid4()
-        now = datetime.utcnow()
+        user_id = _UUID_POOL[0]
+        now = _NOW
 
         user = User(
             id=user_id,
@@ -222,19 +330,17 @@ class TestUser(unittest.TestCase):
             updated_at=now,
         )
 
-        self.assertEqual(user.id, user_id)
-        self.assertEqual(user.email, "test@example.com")
-        self.assertEqual(user.name, "Test User")
-        self.assertEqual(user.password_hash, "hashed_password_123")
-        self.assertTrue(user.is_active)
-        self.assertFalse(user.is_verified)
-        self.assertEqual(user.created_at, now)
-        self.assertEqual(user.updated_at, now)
+        self.assertEqual(
+            (user.id, user.email, user.name, user.password_hash,
+             user.is_active, user.is_verified, user.created_at, user.updated_at),
+            (user_id, "test@example.com", "Test User", "hashed_password_123",
+             True, False, now, now),
+        )
 
     def test_user_optional_fields(self):
         """Test user with optional fields."""
-        user_id = uuid4()
-        now = datetime.utcnow()
+        user_id = _UUID_POOL[0]
+        now = _NOW
         last_login = now - timedelta(hours=1)
 
         user = User(
@@ -260,51 +366,49 @@ class TestUser(unittest.TestCase):
     def test_user_default_preferences(self):
         """Test that preferences default to empty dict."""
         user = User(
-            id=uuid4(),
+            id=_UUID_POOL[0],
             email="test@example.com",
             name="Test User",
             password_hash="hash",
             is_active=True,
             is_verified=False,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
 
         self.assertEqual(user.preferences, {})
 
     def test_user_field_types(self):
         """Test that user fields have correct types."""
-        user_id = uuid4()
-        now = datetime.utcnow()
-
-        user = User(
-            id=user_id,
-            email="test@example.com",
-            name="Test User",
-            password_hash="hash",
-            is_active=True,
-            is_verified=False,
-            created_at=now,
-            updated_at=now,
-        )
-
-        self.assertIsInstance(user.id, UUID)
-        self.assertIsInstance(user.email, str)
-        self.assertIsInstance(user.name, str)
-        self.assertIsInstance(user.is_active, bool)
-        self.assertIsInstance(user.is_verified, bool)
-        self.assertIsInstance(user.created_at, datetime)
-        self.assertIsInstance(user.updated_at, datetime)
-        self.assertIsInstance(user.preferences, dict)
-
-
-class TestOrganization(unittest.TestCase):
-    """Test Organization dataclass."""
+        user = _BASE_USER
+        for value, expected in (
+            (user.id, UUID),
+            (user.email, str),
+            (user.name, str),
+            (user.is_active, bool),
+            (user.is_verified, bool),
+            (user.created_at, datetime),
+            (user.updated_at, datetime),
+            (user.preferences, dict),
+        ):
+            with self.subTest(expected=expected.__name__):
+                self.assertIsInstance(value, expected)
+
+    def test_user_is_frozen(self):
+        """Test that user fields cannot be reassigned."""
+        with self.assertRaises(FrozenInstanceError):
+            _BASE_USER.email = "other@example.com"
+
+    def test_user_has_no_instance_dict(self):
+        """Test that User is slotted (no per-instance __dict__)."""
+        self.assertFalse(hasattr(_BASE_USER, "__dict__"))
+
+    # Organization dataclass
 
     def test_organization_creation(self):
         """Test creating an organization."""
-        org_id = uuid4()
-        now = datetime.utcnow()
+        org_id = _UUID_POOL[0]
+        now = _NOW
 
         org = Organization(
             id=org_id,
@@ -315,27 +419,19 @@ class TestOrganization(unittest.TestCase):
             updated_at=now,
         )
 
-        self.assertEqual(org.id, org_id)
-        self.assertEqual(org.name, "Test Org")
-        self.assertEqual(org.slug, "test-org")
-        self.assertEqual(org.plan, "pro")
-        self.assertEqual(org.created_at, now)
-        self.assertEqual(org.updated_at, now)
+        self.assertEqual(
+            (org.id, org.name, org.slug, org.plan, org.created_at, org.updated_at),
+            (org_id, "Test Org", "test-org", "pro", now, now),
+        )
 
     def test_organization_plans(self):
         """Test different organization plans."""
         plans = ["free", "starter", "pro", "enterprise"]
 
         for plan in plans:
-            org = Organization(
-                id=uuid4(),
-                name="Test Org",
-                slug="test-org",
-                plan=plan,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.assertEqual(org.plan, plan)
+            org = replace(_BASE_ORG, plan=plan)
+            with self.subTest(plan=plan):
+                self.assertEqual(org.plan, plan)
 
     def test_organization_with_settings(self):
         """Test organization with settings."""
@@ -346,12 +442,12 @@ class TestOrganization(unittest.TestCase):
         }
 
         org = Organization(
-            id=uuid4(),
+            id=_UUID_POOL[0],
             name="Test Org",
             slug="test-org",
             plan="enterprise",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             settings=settings,
         )
 
@@ -368,12 +464,12 @@ class TestOrganization(unittest.TestCase):
         }
 
         org = Organization(
-            id=uuid4(),
+            id=_UUID_POOL[0],
             name="Test Org",
             slug="test-org",
             plan="pro",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             limits=limits,
         )
 
@@ -384,26 +480,24 @@ class TestOrganization(unittest.TestCase):
     def test_organization_default_collections(self):
         """Test that settings and limits default to empty dicts."""
         org = Organization(
-            id=uuid4(),
+            id=_UUID_POOL[0],
             name="Test Org",
             slug="test-org",
             plan="free",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
 
         self.assertEqual(org.settings, {})
         self.assertEqual(org.limits, {})
 
-
-class TestOrgMembership(unittest.TestCase):
-    """Test OrgMembership dataclass."""
+    # OrgMembership dataclass
 
     def test_membership_creation(self):
         """Test creating an organization membership."""
-        user_id = uuid4()
-        org_id = uuid4()
-        now = datetime.utcnow()
+        user_id = _UUID_POOL[0]
+        org_id = _UUID_POOL[1]
+        now = _NOW
 
         membership = OrgMembership(
             user_id=user_id,
@@ -420,10 +514,10 @@ class TestOrgMembership(unittest.TestCase):
 
     def test_membership_with_invitation(self):
         """Test membership with inviter information."""
-        user_id = uuid4()
-        org_id = uuid4()
-        inviter_id = uuid4()
-        now = datetime.utcnow()
+        user_id = _UUID_POOL[0]
+        org_id = _UUID_POOL[1]
+        inviter_id = _UUID_POOL[2]
+        now = _NOW
 
         membership = OrgMembership(
             user_id=user_id,
@@ -438,24 +532,22 @@ class TestOrgMembership(unittest.TestCase):
     def test_membership_all_roles(self):
         """Test creating memberships with different roles."""
         for role in UserRole:
-            membership = OrgMembership(
-                user_id=uuid4(),
-                org_id=uuid4(),
-                role=role,
-                joined_at=datetime.utcnow(),
-            )
-            self.assertEqual(membership.role, role)
+            membership = replace(_BASE_MEMBERSHIP, role=role)
+            with self.subTest(role=role):
+                self.assertEqual(membership.role, role)
 
 
-class TestOAuthAccount(unittest.TestCase):
-    """Test OAuthAccount dataclass."""
+class TestTokenDataclasses(unittest.TestCase):
+    """Test OAuth, API key and token dataclasses."""
+
+    # OAuthAccount dataclass
 
     def test_oauth_account_creation(self):
         """Test creating an OAuth account."""
-        account_id = uuid4()
-        user_id = uuid4()
-        now = datetime.utcnow()
-        expires = now + timedelta(hours=1)
+        account_id = _UUID_POOL[0]
+        user_id = _UUID_POOL[1]
+        now = _NOW
+        expires = _NOW_PLUS_1H
 
         oauth = OAuthAccount(
             id=account_id,
@@ -470,63 +562,59 @@ class TestOAuthAccount(unittest.TestCase):
             updated_at=now,
         )
 
-        self.assertEqual(oauth.id, account_id)
-        self.assertEqual(oauth.user_id, user_id)
-        self.assertEqual(oauth.provider, "github")
-        self.assertEqual(oauth.provider_user_id, "12345")
-        self.assertEqual(oauth.provider_username, "testuser")
-        self.assertEqual(oauth.access_token, "access_token_xyz")
-        self.assertEqual(oauth.refresh_token, "refresh_token_abc")
-        self.assertEqual(oauth.token_expires_at, expires)
+        self.assertEqual(
+            (oauth.id, oauth.user_id, oauth.provider, oauth.provider_user_id,
+             oauth.provider_username, oauth.access_token, oauth.refresh_token,
+             oauth.token_expires_at),
+            (account_id, user_id, "github", "12345",
+             "testuser", "access_token_xyz", "refresh_token_abc",
+             expires),
+        )
 
     def test_oauth_different_providers(self):
         """Test OAuth accounts for different providers."""
         providers = ["github", "google", "microsoft", "gitlab"]
 
         for provider in providers:
-            oauth = OAuthAccount(
-                id=uuid4(),
-                user_id=uuid4(),
-                provider=provider,
-                provider_user_id="12345",
-                provider_username=None,
-                access_token="token",
-                refresh_token=None,
-                token_expires_at=None,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-            self.assertEqual(oauth.provider, provider)
+            oauth = replace(_BASE_OAUTH, provider=provider)
+            with self.subTest(provider=provider):
+                self.assertEqual(oauth.provider, provider)
 
     def test_oauth_optional_fields(self):
         """Test OAuth account with optional fields as None."""
         oauth = OAuthAccount(
-            id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            user_id=_UUID_POOL[1],
             provider="github",
             provider_user_id="12345",
             provider_username=None,
             access_token="token",
             refresh_token=None,
             token_expires_at=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
 
         self.assertIsNone(oauth.provider_username)
         self.assertIsNone(oauth.refresh_token)
         self.assertIsNone(oauth.token_expires_at)
 
+    def test_oauth_is_expired(self):
+        """Test OAuth token expiry against epoch seconds."""
+        self.assertFalse(_BASE_OAUTH.is_expired(_NOW_EPOCH))  # No expiry set
+
+        oauth = replace(_BASE_OAUTH, token_expires_at=_NOW_PLUS_1H)
+        self.assertFalse(oauth.is_expired(_NOW_EPOCH))
+        self.assertTrue(oauth.is_expired(_NOW_EPOCH + 3600))
 
-class TestAPIKey(unittest.TestCase):
-    """Test APIKey dataclass."""
+    # APIKey dataclass
 
     def test_api_key_creation(self):
         """Test creating an API key."""
-        key_id = uuid4()
-        org_id = uuid4()
-        user_id = uuid4()
-        now = datetime.utcnow()
+        key_id = _UUID_POOL[0]
+        org_id = _UUID_POOL[1]
+        user_id = _UUID_POOL[2]
+        now = _NOW
 
         api_key = APIKey(
             id=key_id,
@@ -553,13 +641,13 @@ class TestAPIKey(unittest.TestCase):
 
     def test_api_key_with_usage(self):
         """Test API key with usage information."""
-        now = datetime.utcnow()
+        now = _NOW
         last_used = now - timedelta(hours=2)
 
         api_key = APIKey(
-            id=uuid4(),
-            org_id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            org_id=_UUID_POOL[1],
+            user_id=_UUID_POOL[2],
             name="Test Key",
             key_hash="hash",
             key_prefix="uws_test",
@@ -573,13 +661,13 @@ class TestAPIKey(unittest.TestCase):
 
     def test_api_key_with_expiration(self):
         """Test API key with expiration."""
-        now = datetime.utcnow()
-        expires = now + timedelta(days=30)
+        now = _NOW
+        expires = _NOW_PLUS_30D
 
         api_key = APIKey(
-            id=uuid4(),
-            org_id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            org_id=_UUID_POOL[1],
+            user_id=_UUID_POOL[2],
             name="Temporary Key",
             key_hash="hash",
             key_prefix="uws_temp",
@@ -594,16 +682,16 @@ class TestAPIKey(unittest.TestCase):
     def test_api_key_inactive(self):
         """Test creating an inactive API key."""
         api_key = APIKey(
-            id=uuid4(),
-            org_id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            org_id=_UUID_POOL[1],
+            user_id=_UUID_POOL[2],
             name="Revoked Key",
             key_hash="hash",
             key_prefix="uws_old",
             permissions=[],
             last_used_at=None,
             expires_at=None,
-            created_at=datetime.utcnow(),
+            created_at=_NOW,
             is_active=False,
         )
 
@@ -612,30 +700,47 @@ class TestAPIKey(unittest.TestCase):
     def test_api_key_default_active(self):
         """Test that API keys are active by default."""
         api_key = APIKey(
-            id=uuid4(),
-            org_id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            org_id=_UUID_POOL[1],
+            user_id=_UUID_POOL[2],
             name="New Key",
             key_hash="hash",
             key_prefix="uws_new",
             permissions=["tasks:read"],
             last_used_at=None,
             expires_at=None,
-            created_at=datetime.utcnow(),
+            created_at=_NOW,
         )
 
         self.assertTrue(api_key.is_active)
 
+    def test_api_key_is_expired(self):
+        """Test API key expiry against epoch seconds."""
+        api_key = APIKey(
+            id=_UUID_POOL[0],
+            org_id=_UUID_POOL[1],
+            user_id=_UUID_POOL[2],
+            name="Temporary Key",
+            key_hash="hash",
+            key_prefix="uws_temp",
+            permissions=["projects:read"],
+            last_used_at=None,
+            expires_at=_NOW_PLUS_30D,
+            created_at=_NOW,
+        )
 
-class TestRefreshToken(unittest.TestCase):
-    """Test RefreshToken dataclass."""
+        self.assertFalse(api_key.is_expired(_NOW_EPOCH))
+        self.assertTrue(api_key.is_expired(_NOW_EPOCH + 30 * 86400))
+        self.assertFalse(replace(api_key, expires_at=None).is_expired(_NOW_EPOCH))
+
+    # RefreshToken dataclass
 
     def test_refresh_token_creation(self):
         """Test creating a refresh token."""
-        token_id = uuid4()
-        user_id = uuid4()
-        now = datetime.utcnow()
-        expires = now + timedelta(days=30)
+        token_id = _UUID_POOL[0]
+        user_id = _UUID_POOL[1]
+        now = _NOW
+        expires = _NOW_PLUS_30D
 
         token = RefreshToken(
             id=token_id,
@@ -647,25 +752,24 @@ class TestRefreshToken(unittest.TestCase):
             created_at=now,
         )
 
-        self.assertEqual(token.id, token_id)
-        self.assertEqual(token.user_id, user_id)
-        self.assertEqual(token.token_hash, "hashed_token_xyz")
-        self.assertEqual(token.device_info, "Chrome on macOS")
-        self.assertEqual(token.ip_address, "192.168.1.1")
-        self.assertEqual(token.expires_at, expires)
-        self.assertEqual(token.created_at, now)
+        self.assertEqual(
+            (token.id, token.user_id, token.token_hash, token.device_info,
+             token.ip_address, token.expires_at, token.created_at),
+            (token_id, user_id, "hashed_token_xyz", "Chrome on macOS",
+             "192.168.1.1", expires, now),
+        )
         self.assertIsNone(token.revoked_at)
 
     def test_refresh_token_optional_fields(self):
         """Test refresh token with optional fields as None."""
         token = RefreshToken(
-            id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            user_id=_UUID_POOL[1],
             token_hash="hash",
             device_info=None,
             ip_address=None,
-            expires_at=datetime.utcnow() + timedelta(days=30),
-            created_at=datetime.utcnow(),
+            expires_at=_NOW_PLUS_30D,
+            created_at=_NOW,
         )
 
         self.assertIsNone(token.device_info)
@@ -673,16 +777,16 @@ class TestRefreshToken(unittest.TestCase):
 
     def test_refresh_token_revoked(self):
         """Test revoking a refresh token."""
-        now = datetime.utcnow()
-        revoked = now + timedelta(hours=1)
+        now = _NOW
+        revoked = _NOW_PLUS_1H
 
         token = RefreshToken(
-            id=uuid4(),
-            user_id=uuid4(),
+            id=_UUID_POOL[0],
+            user_id=_UUID_POOL[1],
             token_hash="hash",
             device_info="Mobile App",
             ip_address="10.0.0.1",
-            expires_at=now + timedelta(days=30),
+            expires_at=_NOW_PLUS_30D,
             created_at=now,
             revoked_at=revoked,
         )
@@ -690,9 +794,22 @@ class TestRefreshToken(unittest.TestCase):
         self.assertEqual(token.revoked_at, revoked)
         self.assertIsNotNone(token.revoked_at)
 
+    def test_refresh_token_is_expired(self):
+        """Test refresh token expiry against epoch seconds."""
+        token = RefreshToken(
+            id=_UUID_POOL[0],
+            user_id=_UUID_POOL[1],
+            token_hash="hash",
+            device_info=None,
+            ip_address=None,
+            expires_at=_NOW_PLUS_30D,
+            created_at=_NOW,
+        )
+
+        self.assertFalse(token.is_expired(_NOW_EPOCH))
+        self.assertTrue(token.is_expired(_NOW_EPOCH + 30 * 86400))
 
-class TestTokenPair(unittest.TestCase):
-    """Test TokenPair dataclass."""
+    # TokenPair dataclass
 
     def test_token_pair_creation(self):
         """Test creating a token pair."""
@@ -729,17 +846,15 @@ class TestTokenPair(unittest.TestCase):
         self.assertEqual(pair.token_type, "bearer")
         self.assertEqual(pair.expires_in, 900)
 
-
-class TestTokenPayload(unittest.TestCase):
-    """Test TokenPayload dataclass."""
+    # TokenPayload dataclass
 
     def test_token_payload_creation(self):
         """Test creating a token payload."""
-        user_id = str(uuid4())
-        org_id = str(uuid4())
-        token_id = str(uuid4())
-        now = datetime.utcnow()
-        exp = now + timedelta(minutes=15)
+        user_id = str(_UUID_POOL[0])
+        org_id = str(_UUID_POOL[1])
+        token_id = str(_UUID_POOL[2])
+        now = _NOW
+        exp = _NOW_PLUS_15M
 
         payload = TokenPayload(
             sub=user_id,
@@ -751,13 +866,11 @@ class TestTokenPayload(unittest.TestCase):
             jti=token_id,
         )
 
-        self.assertEqual(payload.sub, user_id)
-        self.assertEqual(payload.org_id, org_id)
-        self.assertEqual(payload.role, "admin")
-        self.assertEqual(len(payload.permissions), 3)
-        self.assertEqual(payload.exp, exp)
-        self.assertEqual(payload.iat, now)
-        self.assertEqual(payload.jti, token_id)
+        self.assertEqual(
+            (payload.sub, payload.org_id, payload.role, len(payload.permissions),
+             payload.exp, payload.iat, payload.jti),
+            (user_id, org_id, "admin", 3, exp, now, token_id),
+        )
 
     def test_token_payload_different_roles(self):
         """Test token payloads for different roles."""
@@ -765,26 +878,26 @@ class TestTokenPayload(unittest.TestCase):
 
         for role in roles:
             payload = TokenPayload(
-                sub=str(uuid4()),
-                org_id=str(uuid4()),
+                sub=str(_UUID_POOL[0]),
+                org_id=str(_UUID_POOL[1]),
                 role=role,
                 permissions=[],
-                exp=datetime.utcnow() + timedelta(minutes=15),
-                iat=datetime.utcnow(),
-                jti=str(uuid4()),
+                exp=_NOW_PLUS_15M,
+                iat=_NOW,
+                jti=str(_UUID_POOL[2]),
             )
             self.assertEqual(payload.role, role)
 
     def test_token_payload_permissions_list(self):
         """Test that permissions are stored as a list."""
         payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
+            sub=str(_UUID_POOL[0]),
+            org_id=str(_UUID_POOL[1]),
             role="member",
             permissions=["tasks:read", "tasks:create"],
-            exp=datetime.utcnow() + timedelta(minutes=15),
-            iat=datetime.utcnow(),
-            jti=str(uuid4()),
+            exp=_NOW_PLUS_15M,
+            iat=_NOW,
+            jti=str(_UUID_POOL[2]),
         )
 
         self.assertIsInstance(payload.permissions, list)
@@ -793,22 +906,21 @@ class TestTokenPayload(unittest.TestCase):
 
     def test_token_payload_expiration(self):
         """Test token payload expiration calculation."""
-        now = datetime.utcnow()
-        exp = now + timedelta(minutes=15)
+        now = _NOW
+        exp = _NOW_PLUS_15M
 
         payload = TokenPayload(
-            sub=str(uuid4()),
-            org_id=str(uuid4()),
+            sub=str(_UUID_POOL[0]),
+            org_id=str(_UUID_POOL[1]),
             role="viewer",
             permissions=["tasks:read"],
             exp=exp,
             iat=now,
-            jti=str(uuid4()),
+            jti=str(_UUID_POOL[2]),
         )
 
-        # Token should expire in approximately 15 minutes
-        time_diff = (payload.exp - payload.iat).total_seconds()
-        self.assertAlmostEqual(time_diff, 900, delta=1)
+        # Token should expire in 15 minutes
+        self.assertEqual(payload.expires_in_seconds, 900)
 
 
 if __name__ == "__main__":
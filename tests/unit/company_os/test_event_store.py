@@ -5,6 +5,8 @@ Tests the event sourcing implementation with optimistic concurrency.
 """
 
 import pytest
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -14,7 +16,8 @@ from company_os.core.events.store import (
     NewEvent,
     OptimisticConcurrencyError,
     EventStore,
-    EventPublisher
+    EventPublisher,
+    init_connection
 )
 
 
@@ -30,6 +33,123 @@ class AsyncContextManagerMock:
         pass
 
 
+class AsyncIteratorMock:
+    """Mock asyncpg cursor: async-iterates over canned rows."""
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+# Column order of the event store's SELECTs; Event.from_row reads by position
+EVENT_COLUMNS = (
+    "id", "stream_id", "stream_version", "event_type",
+    "event_data", "metadata", "created_at"
+)
+
+
+class FakeRecord(tuple):
+    """
+    asyncpg.Record stand-in: a tuple in EVENT_COLUMNS order, extra columns
+    after, that can also be indexed by column name.
+    """
+    def __new__(cls, **columns):
+        names = (*EVENT_COLUMNS, *(name for name in columns if name not in EVENT_COLUMNS))
+        record = super().__new__(cls, (columns.get(name) for name in names))
+        record._index = {name: i for i, name in enumerate(names)}
+        return record
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._index[key]
+        return super().__getitem__(key)
+
+
+def _as_records(rows):
+    """Turn canned dict rows into FakeRecords, as asyncpg would return them."""
+    if isinstance(rows, dict):
+        return FakeRecord(**rows)
+    if isinstance(rows, list):
+        return [FakeRecord(**row) if isinstance(row, dict) else row for row in rows]
+    return rows
+
+
+class FakeConn:
+    """
+    Hand-rolled asyncpg connection returning canned results.
+
+    Much cheaper than AsyncMock. Each call is recorded as
+    (method, args, kwargs); a canned iterator yields one result per call,
+    and calling a method with nothing canned fails the test.
+    """
+    def __init__(self, **canned):
+        self.canned = canned
+        self.calls = []
+
+    def _result(self, method, args, kwargs=None):
+        self.calls.append((method, args, kwargs or {}))
+        if method not in self.canned:
+            raise AssertionError(f"unexpected {method}() call")
+        result = self.canned[method]
+        return next(result) if isinstance(result, Iterator) else result
+
+    async def fetch(self, *args):
+        return _as_records(self._result("fetch", args))
+
+    async def fetchrow(self, *args):
+        return _as_records(self._result("fetchrow", args))
+
+    async def fetchval(self, *args):
+        return self._result("fetchval", args)
+
+    async def execute(self, *args):
+        return self._result("execute", args)
+
+    async def copy_records_to_table(self, *args, **kwargs):
+        # Drain the records iterable as asyncpg would
+        kwargs["records"] = list(kwargs["records"])
+        return self._result("copy_records_to_table", args, kwargs)
+
+    def cursor(self, *args, **kwargs):
+        return AsyncIteratorMock(_as_records(self._result("cursor", args, kwargs)))
+
+    def transaction(self):
+        self.calls.append(("transaction", (), {}))
+        return AsyncContextManagerMock(None)
+
+    def count(self, method):
+        """Number of calls made to method."""
+        return sum(1 for call in self.calls if call[0] == method)
+
+    def last_call(self, method):
+        """(args, kwargs) of the latest call to method, like call_args."""
+        for name, args, kwargs in reversed(self.calls):
+            if name == method:
+                return args, kwargs
+        raise AssertionError(f"{method}() was not called")
+
+
+class FakePool:
+    """Hand-rolled asyncpg pool handing out a single FakeConn."""
+    def __init__(self):
+        self.conn = None
+
+    def acquire(self):
+        return AsyncContextManagerMock(self.conn)
+
+    def connect(self, **canned):
+        """Install and return a FakeConn with the given canned results."""
+        self.conn = FakeConn(**canned)
+        return self.conn
+
+
 class TestEvent:
     """Tests for Event dataclass."""
 
@@ -53,15 +173,15 @@ class TestEvent:
 
     def test_event_from_row(self):
         """Test creating Event from database row."""
-        mock_row = {
-            "id": 1,
-            "stream_id": "task-456",
-            "stream_version": 2,
-            "event_type": "TaskUpdated",
-            "event_data": {"title": "Updated"},
-            "metadata": {},
-            "created_at": datetime.now(timezone.utc)
-        }
+        mock_row = FakeRecord(
+            id=1,
+            stream_id="task-456",
+            stream_version=2,
+            event_type="TaskUpdated",
+            event_data={"title": "Updated"},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
 
         event = Event.from_row(mock_row)
 
@@ -70,23 +190,78 @@ class TestEvent:
         assert event.stream_version == 2
         assert event.event_type == "TaskUpdated"
 
+    def test_event_from_row_positional(self):
+        """Test records are read by position, ignoring trailing columns."""
+        created_at = datetime.now(timezone.utc)
+        # Record-like row: event columns in order, then current_version
+        row = (7, "task-1", 3, "TaskUpdated", '{"title": "X"}', {}, created_at, 2)
+
+        event = Event.from_row(row)
+
+        assert event == Event(
+            id=7,
+            stream_id="task-1",
+            stream_version=3,
+            event_type="TaskUpdated",
+            event_data={"title": "X"},
+            metadata={},
+            created_at=created_at
+        )
+
+    def test_event_from_row_interns_event_type(self):
+        """Test repeated event types from rows share one str object."""
+        rows = [
+            FakeRecord(
+                id=i,
+                stream_id="task-1",
+                stream_version=i,
+                # Built at runtime, so each row holds a distinct str
+                event_type="".join(["Task", "Updated"]),
+                event_data={},
+                metadata={},
+                created_at=datetime.now(timezone.utc)
+            )
+            for i in range(2)
+        ]
+        assert rows[0]["event_type"] is not rows[1]["event_type"]
+
+        first, second = (Event.from_row(row) for row in rows)
+
+        assert first.event_type is second.event_type
+
     def test_event_from_row_with_json_string(self):
         """Test from_row handles JSON string data."""
-        mock_row = {
-            "id": 1,
-            "stream_id": "task-789",
-            "stream_version": 0,
-            "event_type": "TaskCreated",
-            "event_data": '{"title": "JSON String"}',
-            "metadata": '{"source": "test"}',
-            "created_at": datetime.now(timezone.utc)
-        }
+        mock_row = FakeRecord(
+            id=1,
+            stream_id="task-789",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data='{"title": "JSON String"}',
+            metadata='{"source": "test"}',
+            created_at=datetime.now(timezone.utc)
+        )
 
         event = Event.from_row(mock_row)
 
         assert event.event_data == {"title": "JSON String"}
         assert event.metadata == {"source": "test"}
 
+    def test_event_is_frozen_and_slotted(self):
+        """Test Event rejects mutation and carries no instance __dict__."""
+        event = Event(
+            id=1,
+            stream_id="task-123",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data={},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            event.stream_version = 1
+        assert not hasattr(event, "__dict__")
+
 
 class TestNewEvent:
     """Tests for NewEvent dataclass."""
@@ -139,39 +314,58 @@ class TestOptimisticConcurrencyError:
             raise error
 
 
+class TestJsonbCodec:
+    """Tests for the binary jsonb codec registered on pool connections."""
+
+    @pytest.mark.asyncio
+    async def test_init_connection_registers_binary_codec(self):
+        """Test that the init hook installs a binary jsonb codec."""
+        conn = MagicMock()
+        conn.set_type_codec = AsyncMock()
+
+        await init_connection(conn)
+
+        conn.set_type_codec.assert_awaited_once()
+        args, kwargs = conn.set_type_codec.call_args
+        assert args == ("jsonb",)
+        assert kwargs["format"] == "binary"
+        assert kwargs["schema"] == "pg_catalog"
+
+        encode, decode = kwargs["encoder"], kwargs["decoder"]
+        assert encode({"a": 1}) == b'\x01{"a":1}'
+        assert decode(b'\x01{"a":1}') == {"a": 1}
+        # Pre-serialized text from json.dumps() callers passes through
+        assert encode('{"a": 1}') == b'\x01{"a": 1}'
+
+
 class TestEventStore:
     """Tests for EventStore class."""
 
     @pytest.fixture
-    def mock_pool(self):
-        """Create mock asyncpg pool."""
-        pool = MagicMock()
-        return pool
+    def fake_pool(self):
+        """Create fake asyncpg pool."""
+        return FakePool()
 
     @pytest.fixture
-    def event_store(self, mock_pool):
-        """Create EventStore with mock pool."""
-        return EventStore(mock_pool)
+    def event_store(self, fake_pool):
+        """Create EventStore with fake pool."""
+        return EventStore(fake_pool)
 
     @pytest.mark.asyncio
-    async def test_append_single_event(self, event_store, mock_pool):
+    async def test_append_single_event(self, event_store, fake_pool):
         """Test appending a single event."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=-1)  # Empty stream
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": 1,
-            "stream_id": "task-123",
-            "stream_version": 0,
-            "event_type": "TaskCreated",
-            "event_data": {"title": "Test"},
-            "metadata": {},
-            "created_at": datetime.now(timezone.utc)
-        })
-
-        # Setup proper async context managers
-        # transaction() returns a context manager, not a coroutine
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
+        conn = fake_pool.connect(fetch=[
+            {
+                "current_version": -1,
+                "id": 1,
+                "stream_id": "task-123",
+                "stream_version": 0,
+                "event_type": "TaskCreated",
+                "event_data": {"title": "Test"},
+                "metadata": {},
+                "created_at": datetime.now(timezone.utc)
+            }
+        ])
 
         new_event = NewEvent(
             event_type="TaskCreated",
@@ -187,6 +381,10 @@ class TestEventStore:
         assert events[0].event_type == "TaskCreated"
         assert events[0].stream_version == 0
 
+        # Lock, version check and insert happen server-side in one call
+        assert [call[0] for call in conn.calls] == ["fetch"]
+        assert "append_events" in conn.last_call("fetch")[0][0]
+
     @pytest.mark.asyncio
     async def test_append_empty_events(self, event_store):
         """Test appending empty event list returns empty."""
@@ -198,24 +396,20 @@ class TestEventStore:
         assert events == []
 
     @pytest.mark.asyncio
-    async def test_append_with_version_check(self, event_store, mock_pool):
+    async def test_append_with_version_check(self, event_store, fake_pool):
         """Test append with expected version."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=5)  # Current version is 5
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": 10,
-            "stream_id": "task-123",
-            "stream_version": 6,
-            "event_type": "TaskUpdated",
-            "event_data": {"status": "done"},
-            "metadata": {},
-            "created_at": datetime.now(timezone.utc)
-        })
-
-        # Setup proper async context managers
-        # transaction() returns a context manager, not a coroutine
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
+        conn = fake_pool.connect(fetch=[
+            {
+                "current_version": 5,
+                "id": 10,
+                "stream_id": "task-123",
+                "stream_version": 6,
+                "event_type": "TaskUpdated",
+                "event_data": {"status": "done"},
+                "metadata": {},
+                "created_at": datetime.now(timezone.utc)
+            }
+        ])
 
         new_event = NewEvent(
             event_type="TaskUpdated",
@@ -230,17 +424,16 @@ class TestEventStore:
 
         assert len(events) == 1
         assert events[0].stream_version == 6
+        # Expected version is checked server-side in the same statement
+        assert conn.last_call("fetch")[0][2] == 5
 
     @pytest.mark.asyncio
-    async def test_append_version_conflict(self, event_store, mock_pool):
+    async def test_append_version_conflict(self, event_store, fake_pool):
         """Test append raises error on version conflict."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=7)  # Current version is 7
-
-        # Setup proper async context managers
-        # transaction() returns a context manager, not a coroutine
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
+        # Version check failed: nothing inserted, only the current version
+        fake_pool.connect(fetch=[
+            {"current_version": 7, "id": None}
+        ])
 
         new_event = NewEvent(
             event_type="TaskUpdated",
@@ -258,10 +451,31 @@ class TestEventStore:
         assert exc_info.value.actual == 7
 
     @pytest.mark.asyncio
-    async def test_read_stream(self, event_store, mock_pool):
+    async def test_bulk_append_unsafe_uses_copy(self, event_store, fake_pool):
+        """Test bulk_append_unsafe streams records through COPY."""
+        org_id = uuid4()
+        conn = fake_pool.connect(copy_records_to_table="COPY 3")
+
+        count = await event_store.bulk_append_unsafe(
+            [
+                ("task-1", 0, NewEvent("TaskCreated", {"title": "A"})),
+                ("task-1", 1, NewEvent("TaskUpdated", {"title": "B"})),
+                ("task-2", 0, NewEvent("TaskCreated", {"title": "C"}))
+            ],
+            org_id=org_id
+        )
+
+        assert count == 3
+        args, kwargs = conn.last_call("copy_records_to_table")
+        assert args == ("events",)
+        assert kwargs["records"][1] == (
+            "task-1", 1, "TaskUpdated", '{"title":"B"}', "{}", org_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_stream(self, event_store, fake_pool):
         """Test reading events from a stream."""
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[
+        fake_pool.connect(fetch=[
             {
                 "id": 1,
                 "stream_id": "task-123",
@@ -282,8 +496,6 @@ class TestEventStore:
             }
         ])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
         events = await event_store.read_stream("task-123")
 
         assert len(events) == 2
@@ -291,76 +503,72 @@ class TestEventStore:
         assert events[1].stream_version == 1
 
     @pytest.mark.asyncio
-    async def test_read_stream_with_from_version(self, event_store, mock_pool):
+    async def test_read_stream_with_from_version(self, event_store, fake_pool):
         """Test reading stream starting from specific version."""
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[])
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        conn = fake_pool.connect(fetch=[])
 
         await event_store.read_stream("task-123", from_version=5)
 
         # Verify the query included from_version
-        call_args = mock_conn.fetch.call_args
+        call_args = conn.last_call("fetch")
         assert 5 in call_args[0]  # from_version should be in params
 
     @pytest.mark.asyncio
-    async def test_get_stream_version(self, event_store, mock_pool):
+    async def test_get_stream_version(self, event_store, fake_pool):
         """Test getting current stream version."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=10)
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        conn = fake_pool.connect(fetchval=10)
 
         version = await event_store.get_stream_version("task-123")
 
         assert version == 10
+        # O(1) lookup in the denormalized table, not MAX() over events
+        assert "stream_versions" in conn.last_call("fetchval")[0][0]
 
     @pytest.mark.asyncio
-    async def test_get_stream_version_nonexistent(self, event_store, mock_pool):
+    async def test_get_stream_version_nonexistent(self, event_store, fake_pool):
         """Test getting version of non-existent stream returns -1."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=-1)
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        fake_pool.connect(fetchval=-1)
 
         version = await event_store.get_stream_version("nonexistent")
 
         assert version == -1
 
     @pytest.mark.asyncio
-    async def test_stream_exists_true(self, event_store, mock_pool):
-        """Test stream_exists returns True for existing stream."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=5)
+    async def test_get_stream_version_not_cached(self, event_store, fake_pool):
+        """Test every call re-reads stream_versions (other writers may append)."""
+        conn = fake_pool.connect(fetchval=10)
+
+        assert await event_store.get_stream_version("task-123") == 10
+        conn.canned["fetchval"] = 11
+        assert await event_store.get_stream_version("task-123") == 11
+
+        assert conn.count("fetchval") == 2
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+    @pytest.mark.asyncio
+    async def test_stream_exists_true(self, event_store, fake_pool):
+        """Test stream_exists returns True for existing stream."""
+        fake_pool.connect(fetchval=5)
 
         exists = await event_store.stream_exists("task-123")
 
         assert exists is True
 
     @pytest.mark.asyncio
-    async def test_stream_exists_false(self, event_store, mock_pool):
+    async def test_stream_exists_false(self, event_store, fake_pool):
         """Test stream_exists returns False for non-existent stream."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=-1)
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        fake_pool.connect(fetchval=-1)
 
         exists = await event_store.stream_exists("nonexistent")
 
         assert exists is False
 
     @pytest.mark.asyncio
-    async def test_append_multiple_events(self, event_store, mock_pool):
+    async def test_append_multiple_events(self, event_store, fake_pool):
         """Test appending multiple events at once."""
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=-1)  # Empty stream
-
-        # Return different events for each insert
-        mock_conn.fetchrow = AsyncMock(side_effect=[
+        # The batch INSERT returns every appended row at once
+        conn = fake_pool.connect(fetch=[
             {
+                "current_version": -1,
                 "id": 1,
                 "stream_id": "task-123",
                 "stream_version": 0,
@@ -370,6 +578,7 @@ class TestEventStore:
                 "created_at": datetime.now(timezone.utc)
             },
             {
+                "current_version": -1,
                 "id": 2,
                 "stream_id": "task-123",
                 "stream_version": 1,
@@ -379,6 +588,7 @@ class TestEventStore:
                 "created_at": datetime.now(timezone.utc)
             },
             {
+                "current_version": -1,
                 "id": 3,
                 "stream_id": "task-123",
                 "stream_version": 2,
@@ -389,9 +599,6 @@ class TestEventStore:
             }
         ])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
-
         new_events = [
             NewEvent(event_type="TaskCreated", event_data={"title": "Test"}),
             NewEvent(event_type="TaskUpdated", event_data={"title": "Updated"}),
@@ -408,26 +615,29 @@ class TestEventStore:
         assert events[1].stream_version == 1
         assert events[2].stream_version == 2
 
+        # One statement carrying every event, not one INSERT per event
+        assert conn.count("fetch") == 1
+        call_args = conn.last_call("fetch")[0]
+        assert call_args[3] == ["TaskCreated", "TaskUpdated", "TaskCompleted"]
+
     @pytest.mark.asyncio
-    async def test_append_with_org_id(self, event_store, mock_pool):
+    async def test_append_with_org_id(self, event_store, fake_pool):
         """Test appending events with org_id for multi-tenancy."""
         from uuid import uuid4
         org_id = uuid4()
 
-        mock_conn = AsyncMock()
-        mock_conn.fetchval = AsyncMock(return_value=-1)
-        mock_conn.fetchrow = AsyncMock(return_value={
-            "id": 1,
-            "stream_id": "task-123",
-            "stream_version": 0,
-            "event_type": "TaskCreated",
-            "event_data": {"title": "Test"},
-            "metadata": {},
-            "created_at": datetime.now(timezone.utc)
-        })
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock(None))
+        conn = fake_pool.connect(fetch=[
+            {
+                "current_version": -1,
+                "id": 1,
+                "stream_id": "task-123",
+                "stream_version": 0,
+                "event_type": "TaskCreated",
+                "event_data": {"title": "Test"},
+                "metadata": {},
+                "created_at": datetime.now(timezone.utc)
+            }
+        ])
 
         new_event = NewEvent(
             event_type="TaskCreated",
@@ -441,14 +651,13 @@ class TestEventStore:
         )
 
         # Verify org_id was passed to INSERT
-        call_args = mock_conn.fetchrow.call_args[0]
+        call_args = conn.last_call("fetch")[0]
         assert org_id in call_args
 
     @pytest.mark.asyncio
-    async def test_read_stream_with_to_version(self, event_store, mock_pool):
+    async def test_read_stream_with_to_version(self, event_store, fake_pool):
         """Test reading stream with both from and to version."""
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[
+        fake_pool.connect(fetch=[
             {
                 "id": 5,
                 "stream_id": "task-123",
@@ -469,8 +678,6 @@ class TestEventStore:
             }
         ])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
         events = await event_store.read_stream(
             "task-123",
             from_version=5,
@@ -482,30 +689,49 @@ class TestEventStore:
         assert events[1].stream_version == 6
 
     @pytest.mark.asyncio
-    async def test_read_stream_with_limit(self, event_store, mock_pool):
+    async def test_read_stream_with_limit(self, event_store, fake_pool):
         """Test reading stream respects limit parameter."""
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[
+        conn = fake_pool.connect(fetch=[
             {"id": i, "stream_id": "task-123", "stream_version": i,
              "event_type": "Event", "event_data": {}, "metadata": {},
              "created_at": datetime.now(timezone.utc)}
             for i in range(10)
         ])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
         events = await event_store.read_stream("task-123", limit=10)
 
         assert len(events) == 10
         # Verify limit was in query
-        call_args = mock_conn.fetch.call_args[0]
+        call_args = conn.last_call("fetch")[0]
         assert 10 in call_args
 
     @pytest.mark.asyncio
-    async def test_read_all_with_event_types_filter(self, event_store, mock_pool):
+    async def test_iter_stream_uses_cursor(self, event_store, fake_pool):
+        """Test iter_stream yields events from a server-side cursor."""
+        conn = fake_pool.connect(cursor=[
+            {"id": i, "stream_id": "task-123", "stream_version": i,
+             "event_type": "Event", "event_data": {}, "metadata": {},
+             "created_at": datetime.now(timezone.utc)}
+            for i in range(3)
+        ])
+
+        events = [
+            event async for event in event_store.iter_stream(
+                "task-123", from_version=0, prefetch=2
+            )
+        ]
+
+        assert [e.stream_version for e in events] == [0, 1, 2]
+        assert conn.count("transaction") == 1
+        call_args = conn.last_call("cursor")
+        assert "task-123" in call_args[0]
+        assert call_args[1]["prefetch"] == 2
+        assert conn.count("fetch") == 0
+
+    @pytest.mark.asyncio
+    async def test_read_all_with_event_types_filter(self, event_store, fake_pool):
         """Test read_all with event type filtering."""
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[
+        conn = fake_pool.connect(fetch=[
             {
                 "id": 1,
                 "stream_id": "task-123",
@@ -526,8 +752,6 @@ class TestEventStore:
             }
         ])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
-
         events = []
         async for event in event_store.read_all(
             from_position=0,
@@ -537,14 +761,15 @@ class TestEventStore:
 
         assert len(events) == 2
         assert all(e.event_type == "TaskCreated" for e in events)
+        # Short batch ends the scan without another round-trip
+        assert conn.count("fetch") == 1
+        assert conn.last_call("fetch")[0][2] == ["TaskCreated", "TaskUpdated"]
 
     @pytest.mark.asyncio
-    async def test_read_all_pagination(self, event_store, mock_pool):
+    async def test_read_all_pagination(self, event_store, fake_pool):
         """Test read_all handles pagination correctly."""
-        mock_conn = AsyncMock()
-
         # First batch returns 2 events, second batch returns empty
-        mock_conn.fetch = AsyncMock(side_effect=[
+        fake_pool.connect(fetch=iter([
             [
                 {"id": 1, "stream_id": "task-1", "stream_version": 0,
                  "event_type": "Event", "event_data": {}, "metadata": {},
@@ -554,9 +779,7 @@ class TestEventStore:
                  "created_at": datetime.now(timezone.utc)}
             ],
             []  # Empty result to stop iteration
-        ])
-
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        ]))
 
         events = []
         async for event in event_store.read_all(batch_size=2):
@@ -672,3 +895,86 @@ class TestEventPublisher:
 
         # Should not raise
         await publisher.publish(event)
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_publish_is_seen(self):
+        """Test the resolved handler cache is invalidated by subscribe."""
+        publisher = EventPublisher()
+        first_handler = AsyncMock()
+        late_handler = AsyncMock()
+        publisher.subscribe("TaskCreated", first_handler)
+
+        event = Event(
+            id=1,
+            stream_id="task-123",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data={},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        await publisher.publish(event)
+        publisher.subscribe_all(late_handler)
+        await publisher.publish(event)
+
+        assert first_handler.call_count == 2
+        late_handler.assert_called_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_all_handlers_before_raising(self):
+        """Test a failing handler doesn't stop the others, and its error surfaces."""
+        publisher = EventPublisher()
+        failing_handler = AsyncMock(side_effect=RuntimeError("boom"))
+        wildcard_handler = AsyncMock()
+
+        publisher.subscribe("TaskCreated", failing_handler)
+        publisher.subscribe_all(wildcard_handler)
+
+        event = Event(
+            id=1,
+            stream_id="task-123",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data={},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await publisher.publish(event)
+
+        wildcard_handler.assert_called_once_with(event)
+
+    @pytest.mark.asyncio
+    async def test_publish_many_keeps_order_per_handler(self):
+        """Test publish_many delivers each handler its events in order."""
+        publisher = EventPublisher()
+        created_handler = AsyncMock()
+        wildcard_handler = AsyncMock()
+
+        publisher.subscribe("TaskCreated", created_handler)
+        publisher.subscribe_all(wildcard_handler)
+
+        events = [
+            Event(
+                id=i,
+                stream_id="task-123",
+                stream_version=i,
+                event_type=event_type,
+                event_data={},
+                metadata={},
+                created_at=datetime.now(timezone.utc)
+            )
+            for i, event_type in enumerate(["TaskCreated", "TaskUpdated", "TaskCreated"])
+        ]
+
+        await publisher.publish_many(events)
+
+        assert [c.args[0] for c in created_handler.call_args_list] == [events[0], events[2]]
+        assert [c.args[0] for c in wildcard_handler.call_args_list] == events
+
+    @pytest.mark.asyncio
+    async def test_publish_many_without_subscribers(self):
+        """Test publish_many is a no-op when nobody listens."""
+        await EventPublisher().publish_many([])
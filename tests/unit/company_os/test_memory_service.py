@@ -8,7 +8,6 @@ import pytest
 import numpy as np
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
 
 from company_os.core.memory.service import (
     MemoryType,
@@ -18,17 +17,68 @@ from company_os.core.memory.service import (
     AgentContextBuilder
 )
 
+from ._ids import seeded_uuid4
 
-class AsyncContextManagerMock:
-    """Mock async context manager for connection pool and transactions."""
-    def __init__(self, return_value=None):
-        self.return_value = return_value
 
-    async def __aenter__(self):
-        return self.return_value
+# Deterministic UUID4s for opaque test identifiers
+_uuid = seeded_uuid4()
 
-    async def __aexit__(self, *args):
-        pass
+
+# Shared mock embedding, built once; no test writes into it
+_FAKE_EMBED = np.full(1536, 0.1, dtype=np.float32)
+_FAKE_EMBED_LIST = _FAKE_EMBED.tolist()
+_ZERO10 = np.zeros(10, dtype=np.float32)
+# Fixed timestamp for every row and Memory; no test asserts on it
+_NOW = datetime.now(timezone.utc)
+# Opaque id for tests that never assert on it
+_UUID = _uuid()
+
+
+# SemanticMemoryService searches used by AgentContextBuilder
+_SEARCH_METHODS = (
+    "search_similar_tasks",
+    "search_decisions",
+    "search_code_patterns",
+    "search_errors"
+)
+
+# memories row as returned by search; _make_row fills in the ids
+_ROW_TEMPLATE = {
+    "memory_type": "task",
+    "content": "Test",
+    "embedding": _FAKE_EMBED_LIST,
+    "quality_score": 0.8,
+    "usage_count": 5,
+    "metadata": {},
+    "created_at": _NOW,
+    "similarity": 0.9
+}
+
+
+def _make_row(id, org_id, **overrides):
+    """Build a search result row from _ROW_TEMPLATE."""
+    return {**_ROW_TEMPLATE, "id": id, "org_id": org_id, **overrides}
+
+
+def _memory(memory_type, content, metadata, similarity=0.0):
+    """Build a recalled Memory; none of the tests mutate these."""
+    return Memory(
+        id=_UUID,
+        org_id=_UUID,
+        memory_type=memory_type,
+        content=content,
+        embedding=_ZERO10,
+        quality_score=0.9,
+        usage_count=5,
+        metadata=metadata,
+        created_at=_NOW,
+        similarity=similarity
+    )
+
+
+def _wire_conn(pool, conn):
+    """Make `async with pool.acquire()` yield conn (MagicMock supports async with)."""
+    pool.acquire.return_value.__aenter__.return_value = conn
 
 
 class TestMemoryType:
@@ -60,15 +110,15 @@ class TestMemory:
     def test_memory_creation(self):
         """Test creating Memory instance."""
         memory = Memory(
-            id=uuid4(),
-            org_id=uuid4(),
+            id=_uuid(),
+            org_id=_uuid(),
             memory_type=MemoryType.TASK,
             content="Test memory content",
-            embedding=np.array([0.1, 0.2, 0.3]),
+            embedding=np.array([0.1, 0.2, 0.3], dtype=np.float32),
             quality_score=0.8,
             usage_count=5,
             metadata={"agent": "researcher"},
-            created_at=datetime.now(timezone.utc),
+            created_at=_NOW,
             similarity=0.95
         )
 
@@ -79,20 +129,39 @@ class TestMemory:
     def test_memory_default_similarity(self):
         """Test Memory default similarity is 0.0."""
         memory = Memory(
-            id=uuid4(),
-            org_id=uuid4(),
+            id=_uuid(),
+            org_id=_uuid(),
             memory_type=MemoryType.DECISION,
             content="Decision content",
-            embedding=np.zeros(10),
+            embedding=_ZERO10,
             quality_score=0.5,
             usage_count=0,
             metadata={},
-            created_at=datetime.now(timezone.utc)
+            created_at=_NOW
         )
 
         assert memory.similarity == 0.0
 
 
+@pytest.fixture(scope="module")
+def openai_single_response():
+    """OpenAI embeddings response with one vector."""
+    response = MagicMock()
+    response.data = [MagicMock(embedding=_FAKE_EMBED_LIST)]
+    return response
+
+
+@pytest.fixture(scope="module")
+def openai_batch_response():
+    """OpenAI embeddings response with two vectors."""
+    response = MagicMock()
+    response.data = [
+        MagicMock(embedding=_FAKE_EMBED_LIST),
+        MagicMock(embedding=[0.2] * 1536)
+    ]
+    return response
+
+
 class TestEmbeddingService:
     """Tests for EmbeddingService."""
 
@@ -118,8 +187,7 @@ class TestEmbeddingService:
         # Dimensions updated on client init
         assert service.dimensions == 1536  # Default before init
 
-    @pytest.mark.asyncio
-    async def test_embed_openai(self):
+    async def test_embed_openai(self, openai_single_response):
         """Test embedding generation with OpenAI."""
         service = EmbeddingService(
             provider="openai",
@@ -127,73 +195,87 @@ class TestEmbeddingService:
         )
 
         # Mock the OpenAI client
-        mock_response = MagicMock()
-        mock_response.data = [MagicMock(embedding=[0.1] * 1536)]
-
         mock_client = AsyncMock()
-        mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+        mock_client.embeddings.create = AsyncMock(return_value=openai_single_response)
         service._client = mock_client
 
         embedding = await service.embed("Test text")
 
         assert isinstance(embedding, np.ndarray)
+        assert embedding.dtype == np.float32
         assert len(embedding) == 1536
         mock_client.embeddings.create.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_embed_batch_openai(self):
+    async def test_embed_batch_openai(self, openai_batch_response):
         """Test batch embedding generation."""
         service = EmbeddingService(
             provider="openai",
             api_key="test-key"
         )
 
-        mock_response = MagicMock()
-        mock_response.data = [
-            MagicMock(embedding=[0.1] * 1536),
-            MagicMock(embedding=[0.2] * 1536)
-        ]
-
         mock_client = AsyncMock()
-        mock_client.embeddings.create = AsyncMock(return_value=mock_response)
+        mock_client.embeddings.create = AsyncMock(return_value=openai_batch_response)
         service._client = mock_client
 
         embeddings = await service.embed_batch(["Text 1", "Text 2"])
 
         assert len(embeddings) == 2
         assert all(isinstance(e, np.ndarray) for e in embeddings)
+        assert all(e.dtype == np.float32 for e in embeddings)
 
 
-class TestSemanticMemoryService:
-    """Tests for SemanticMemoryService."""
+@pytest.fixture(scope="module")
+def mock_pool():
+    """Create mock database pool, shared by the module."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def mock_embedder():
+    """Create mock embedding service, shared by the module."""
+    embedder = AsyncMock()
+    embedder.embed = AsyncMock(return_value=_FAKE_EMBED)
+    return embedder
+
 
-    @pytest.fixture
-    def mock_pool(self):
-        """Create mock database pool."""
-        return MagicMock()
+@pytest.fixture(scope="module")
+def _raw_memory_service(mock_pool, mock_embedder):
+    """SemanticMemoryService built once per module; see memory_service."""
+    return SemanticMemoryService(mock_pool, mock_embedder)
 
-    @pytest.fixture
-    def mock_embedder(self):
-        """Create mock embedding service."""
-        embedder = AsyncMock(spec=EmbeddingService)
-        embedder.embed = AsyncMock(return_value=np.array([0.1] * 1536))
-        return embedder
 
-    @pytest.fixture
-    def memory_service(self, mock_pool, mock_embedder):
-        """Create SemanticMemoryService with mocks."""
-        return SemanticMemoryService(mock_pool, mock_embedder)
+@pytest.fixture
+def memory_service(_raw_memory_service, mock_pool, mock_embedder):
+    """
+    Shared SemanticMemoryService with the previous test's state cleared.
+
+    Resets call history, side effects and the pool's acquire wiring; embed
+    keeps its canned return value.
+    """
+    mock_pool.reset_mock(return_value=True, side_effect=True)
+    mock_embedder.reset_mock(side_effect=True)
+    return _raw_memory_service
+
+
+def test_mocked_interfaces_exist():
+    """Check once that the unspecced mocks stand in for real methods."""
+    assert callable(EmbeddingService.embed)
+    for method in _SEARCH_METHODS:
+        assert callable(getattr(SemanticMemoryService, method))
+
+
+class TestSemanticMemoryService:
+    """Tests for SemanticMemoryService."""
 
-    @pytest.mark.asyncio
     async def test_store_memory(self, memory_service, mock_pool, mock_embedder):
         """Test storing a new memory."""
-        memory_id = uuid4()
-        org_id = uuid4()
+        memory_id = _uuid()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetchval = AsyncMock(return_value=memory_id)
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         result = await memory_service.store(
             org_id=org_id,
@@ -206,31 +288,24 @@ class TestSemanticMemoryService:
         assert result == memory_id
         mock_embedder.embed.assert_called_once_with("Test task content")
 
-    @pytest.mark.asyncio
     async def test_search_memories(self, memory_service, mock_pool, mock_embedder):
         """Test searching memories."""
-        org_id = uuid4()
-        memory_id = uuid4()
-        now = datetime.now(timezone.utc)
+        org_id = _uuid()
+        memory_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[
-            {
-                "id": memory_id,
-                "org_id": org_id,
-                "memory_type": "task",
-                "content": "Similar task",
-                "embedding": [0.1] * 1536,
-                "quality_score": 0.8,
-                "usage_count": 3,
-                "metadata": {"agent": "researcher"},
-                "created_at": now,
-                "similarity": 0.92
-            }
+            _make_row(
+                memory_id, org_id,
+                content="Similar task",
+                usage_count=3,
+                metadata={"agent": "researcher"},
+                similarity=0.92
+            )
         ])
         mock_conn.execute = AsyncMock()  # For usage count update
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         results = await memory_service.search(
             org_id=org_id,
@@ -243,16 +318,15 @@ class TestSemanticMemoryService:
         assert results[0].content == "Similar task"
         assert results[0].similarity == 0.92
 
-    @pytest.mark.asyncio
     async def test_search_with_filters(self, memory_service, mock_pool, mock_embedder):
         """Test search with metadata filters."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         await memory_service.search(
             org_id=org_id,
@@ -263,15 +337,14 @@ class TestSemanticMemoryService:
         # Verify search was executed
         mock_conn.fetch.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_search_empty_results(self, memory_service, mock_pool, mock_embedder):
         """Test search returns empty list when no matches."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         results = await memory_service.search(
             org_id=org_id,
@@ -281,16 +354,15 @@ class TestSemanticMemoryService:
 
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_search_similar_tasks(self, memory_service, mock_pool, mock_embedder):
         """Test search_similar_tasks convenience method."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         await memory_service.search_similar_tasks(
             org_id=org_id,
@@ -301,15 +373,14 @@ class TestSemanticMemoryService:
 
         mock_embedder.embed.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_quality(self, memory_service, mock_pool):
         """Test updating memory quality score."""
-        memory_id = uuid4()
+        memory_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         await memory_service.update_quality(
             memory_id=memory_id,
@@ -319,18 +390,17 @@ class TestSemanticMemoryService:
 
         mock_conn.execute.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_consolidate_memories(self, memory_service, mock_pool):
         """Test memory consolidation."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[
-            {"id1": uuid4(), "id2": uuid4(), "q1": 0.8, "q2": 0.6}
+            {"id1": _uuid(), "id2": _uuid(), "q1": 0.8, "q2": 0.6}
         ])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         merged = await memory_service.consolidate(
             org_id=org_id,
@@ -340,15 +410,14 @@ class TestSemanticMemoryService:
 
         assert merged == 1
 
-    @pytest.mark.asyncio
     async def test_prune_old_memories(self, memory_service, mock_pool):
         """Test pruning old memories."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.execute = AsyncMock(return_value="DELETE 5")
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         deleted = await memory_service.prune_old(
             org_id=org_id,
@@ -359,29 +428,35 @@ class TestSemanticMemoryService:
         assert deleted == 5
 
 
+@pytest.fixture(scope="module")
+def mock_memory_service():
+    """Create mock memory service, shared by the module."""
+    service = AsyncMock()
+    service.configure_mock(
+        **{f"{method}.return_value": [] for method in _SEARCH_METHODS}
+    )
+    return service
+
+
+@pytest.fixture(scope="module")
+def context_builder(mock_memory_service):
+    """Create AgentContextBuilder with mock."""
+    return AgentContextBuilder(mock_memory_service)
+
+
 class TestAgentContextBuilder:
     """Tests for AgentContextBuilder."""
 
-    @pytest.fixture
-    def mock_memory_service(self):
-        """Create mock memory service."""
-        return AsyncMock(spec=SemanticMemoryService)
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_memory_service):
+        """Clear calls and make every search return nothing again."""
+        mock_memory_service.reset_mock(side_effect=True)
+        for method in _SEARCH_METHODS:
+            getattr(mock_memory_service, method).return_value = []
 
-    @pytest.fixture
-    def context_builder(self, mock_memory_service):
-        """Create AgentContextBuilder with mock."""
-        return AgentContextBuilder(mock_memory_service)
-
-    @pytest.mark.asyncio
     async def test_build_context_basic(self, context_builder, mock_memory_service):
         """Test building basic context."""
-        org_id = uuid4()
-
-        # Mock returns empty for all searches
-        mock_memory_service.search_similar_tasks = AsyncMock(return_value=[])
-        mock_memory_service.search_decisions = AsyncMock(return_value=[])
-        mock_memory_service.search_code_patterns = AsyncMock(return_value=[])
-        mock_memory_service.search_errors = AsyncMock(return_value=[])
+        org_id = _uuid()
 
         context = await context_builder.build_context(
             org_id=org_id,
@@ -392,165 +467,80 @@ class TestAgentContextBuilder:
 
         assert "You are a researcher." in context
 
-    @pytest.mark.asyncio
-    async def test_build_context_with_similar_tasks(self, context_builder, mock_memory_service):
-        """Test context includes similar tasks."""
-        org_id = uuid4()
-
-        similar_task = Memory(
-            id=uuid4(),
-            org_id=org_id,
-            memory_type=MemoryType.TASK,
-            content="Previous research on attention mechanisms",
-            embedding=np.zeros(10),
-            quality_score=0.9,
-            usage_count=5,
-            metadata={"approach": "systematic review"},
-            created_at=datetime.now(timezone.utc),
-            similarity=0.88
-        )
-
-        mock_memory_service.search_similar_tasks = AsyncMock(return_value=[similar_task])
-        mock_memory_service.search_decisions = AsyncMock(return_value=[])
-        mock_memory_service.search_code_patterns = AsyncMock(return_value=[])
-        mock_memory_service.search_errors = AsyncMock(return_value=[])
-
-        context = await context_builder.build_context(
-            org_id=org_id,
-            agent_type="researcher",
-            task_description="Research transformers",
-            base_persona="You are a researcher."
-        )
-
-        assert "Similar Successful Tasks" in context
-        assert "88%" in context  # Similarity percentage
-
-    @pytest.mark.asyncio
-    async def test_build_context_with_decisions(self, context_builder, mock_memory_service):
-        """Test context includes relevant decisions."""
-        org_id = uuid4()
-
-        decision = Memory(
-            id=uuid4(),
-            org_id=org_id,
-            memory_type=MemoryType.DECISION,
-            content="Use PostgreSQL for database",
-            embedding=np.zeros(10),
-            quality_score=1.0,
-            usage_count=10,
-            metadata={"decision": "PostgreSQL", "rationale": "ACID compliance"},
-            created_at=datetime.now(timezone.utc),
-            similarity=0.75
-        )
-
-        mock_memory_service.search_similar_tasks = AsyncMock(return_value=[])
-        mock_memory_service.search_decisions = AsyncMock(return_value=[decision])
-        mock_memory_service.search_code_patterns = AsyncMock(return_value=[])
-        mock_memory_service.search_errors = AsyncMock(return_value=[])
-
-        context = await context_builder.build_context(
-            org_id=org_id,
-            agent_type="architect",
-            task_description="Design database schema",
-            base_persona="You are an architect."
-        )
-
-        assert "Relevant Past Decisions" in context
-        assert "PostgreSQL" in context
-
-    @pytest.mark.asyncio
-    async def test_build_context_implementer_gets_code_patterns(
-        self, context_builder, mock_memory_service
+    @pytest.mark.parametrize(
+        "memory,search_method,agent_type,section,expected",
+        [
+            pytest.param(
+                _memory(
+                    MemoryType.TASK,
+                    "Previous research on attention mechanisms",
+                    {"approach": "systematic review"},
+                    similarity=0.88
+                ),
+                "search_similar_tasks", "researcher",
+                "Similar Successful Tasks", "88%",  # Similarity percentage
+                id="similar_tasks"
+            ),
+            pytest.param(
+                _memory(
+                    MemoryType.DECISION,
+                    "Use PostgreSQL for database",
+                    {"decision": "PostgreSQL", "rationale": "ACID compliance"},
+                    similarity=0.75
+                ),
+                "search_decisions", "architect",
+                "Relevant Past Decisions", "PostgreSQL",
+                id="decisions"
+            ),
+            pytest.param(
+                _memory(
+                    MemoryType.CODE_PATTERN,
+                    "async def handler(request):\n    pass",
+                    {"pattern_name": "API Handler", "language": "python"},
+                    similarity=0.82
+                ),
+                "search_code_patterns", "implementer",
+                "Relevant Code Patterns", "API Handler",
+                id="implementer_gets_code_patterns"
+            ),
+            pytest.param(
+                _memory(
+                    MemoryType.ERROR,
+                    "Connection timeout on database",
+                    {"error_type": "TimeoutError", "prevention": "Add connection pooling"},
+                    similarity=0.70
+                ),
+                "search_errors", "implementer",
+                "Known Issues to Avoid", "TimeoutError",
+                id="errors_to_avoid"
+            ),
+        ]
+    )
+    async def test_build_context_includes_memories(
+        self, context_builder, mock_memory_service, memory, search_method,
+        agent_type, section, expected
     ):
-        """Test implementer agent gets code patterns."""
-        org_id = uuid4()
-
-        pattern = Memory(
-            id=uuid4(),
-            org_id=org_id,
-            memory_type=MemoryType.CODE_PATTERN,
-            content="async def handler(request):\n    pass",
-            embedding=np.zeros(10),
-            quality_score=0.95,
-            usage_count=20,
-            metadata={"pattern_name": "API Handler", "language": "python"},
-            created_at=datetime.now(timezone.utc),
-            similarity=0.82
-        )
-
-        mock_memory_service.search_similar_tasks = AsyncMock(return_value=[])
-        mock_memory_service.search_decisions = AsyncMock(return_value=[])
-        mock_memory_service.search_code_patterns = AsyncMock(return_value=[pattern])
-        mock_memory_service.search_errors = AsyncMock(return_value=[])
+        """Test each kind of recalled memory gets its own context section."""
+        # Other searches keep the fixture's empty result
+        getattr(mock_memory_service, search_method).return_value = [memory]
 
         context = await context_builder.build_context(
-            org_id=org_id,
-            agent_type="implementer",
-            task_description="Create API endpoint",
-            base_persona="You are an implementer."
+            org_id=_UUID,
+            agent_type=agent_type,
+            task_description="Work on the task",
+            base_persona="You are an agent."
         )
 
-        assert "Relevant Code Patterns" in context
-        assert "API Handler" in context
-
-    @pytest.mark.asyncio
-    async def test_build_context_with_errors_to_avoid(self, context_builder, mock_memory_service):
-        """Test context includes errors to avoid."""
-        org_id = uuid4()
-
-        error = Memory(
-            id=uuid4(),
-            org_id=org_id,
-            memory_type=MemoryType.ERROR,
-            content="Connection timeout on database",
-            embedding=np.zeros(10),
-            quality_score=1.0,
-            usage_count=3,
-            metadata={"error_type": "TimeoutError", "prevention": "Add connection pooling"},
-            created_at=datetime.now(timezone.utc),
-            similarity=0.70
-        )
-
-        mock_memory_service.search_similar_tasks = AsyncMock(return_value=[])
-        mock_memory_service.search_decisions = AsyncMock(return_value=[])
-        mock_memory_service.search_code_patterns = AsyncMock(return_value=[])
-        mock_memory_service.search_errors = AsyncMock(return_value=[error])
-
-        context = await context_builder.build_context(
-            org_id=org_id,
-            agent_type="implementer",
-            task_description="Setup database connection",
-            base_persona="You are an implementer."
-        )
-
-        assert "Known Issues to Avoid" in context
-        assert "TimeoutError" in context
+        assert section in context
+        assert expected in context
 
 
 class TestMemoryEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @pytest.fixture
-    def mock_pool(self):
-        """Create mock database pool."""
-        return MagicMock()
-
-    @pytest.fixture
-    def mock_embedder(self):
-        """Create mock embedding service."""
-        embedder = AsyncMock(spec=EmbeddingService)
-        embedder.embed = AsyncMock(return_value=np.array([0.1] * 1536))
-        return embedder
-
-    @pytest.fixture
-    def memory_service(self, mock_pool, mock_embedder):
-        """Create SemanticMemoryService with mocks."""
-        return SemanticMemoryService(mock_pool, mock_embedder)
-
-    @pytest.mark.asyncio
     async def test_search_with_invalid_filter_key(self, memory_service, mock_pool, mock_embedder):
         """Test search rejects invalid filter keys (SQL injection prevention)."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         with pytest.raises(ValueError) as exc_info:
             await memory_service.search(
@@ -561,16 +551,15 @@ class TestMemoryEdgeCases:
 
         assert "Invalid filter key" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_search_with_special_chars_in_filter_value(self, memory_service, mock_pool, mock_embedder):
         """Test search handles special characters in filter values safely."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         # Should not raise - special chars in values are safe
         await memory_service.search(
@@ -582,16 +571,15 @@ class TestMemoryEdgeCases:
         # Verify query was executed (parameterized, so safe)
         mock_conn.fetch.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_store_with_empty_content(self, memory_service, mock_pool, mock_embedder):
         """Test storing memory with empty content."""
-        org_id = uuid4()
-        memory_id = uuid4()
+        org_id = _uuid()
+        memory_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetchval = AsyncMock(return_value=memory_id)
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         result = await memory_service.store(
             org_id=org_id,
@@ -603,16 +591,15 @@ class TestMemoryEdgeCases:
         assert result == memory_id
         mock_embedder.embed.assert_called_once_with("")
 
-    @pytest.mark.asyncio
     async def test_search_with_multiple_memory_types(self, memory_service, mock_pool, mock_embedder):
         """Test search with multiple memory types filter."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         await memory_service.search(
             org_id=org_id,
@@ -623,21 +610,20 @@ class TestMemoryEdgeCases:
 
         # Verify query was executed
         mock_conn.fetch.assert_called_once()
-        call_args = mock_conn.fetch.call_args[0]
+        _, *params = mock_conn.fetch.call_args.args
         # Should include type filter parameters
-        assert "task" in call_args
-        assert "decision" in call_args
-        assert "error" in call_args
+        assert "task" in params
+        assert "decision" in params
+        assert "error" in params
 
-    @pytest.mark.asyncio
     async def test_update_quality_without_feedback(self, memory_service, mock_pool):
         """Test updating quality without feedback."""
-        memory_id = uuid4()
+        memory_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         await memory_service.update_quality(
             memory_id=memory_id,
@@ -646,19 +632,18 @@ class TestMemoryEdgeCases:
         )
 
         mock_conn.execute.assert_called_once()
-        call_args = mock_conn.execute.call_args[0]
+        sql = mock_conn.execute.call_args.args[0]
         # Should not include feedback in update
-        assert "feedback" not in call_args[0] or call_args[0].count("$") == 2
+        assert "feedback" not in sql or sql.count("$") == 2
 
-    @pytest.mark.asyncio
     async def test_consolidate_with_no_duplicates(self, memory_service, mock_pool):
         """Test consolidation when no similar memories exist."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[])  # No clusters found
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         merged = await memory_service.consolidate(
             org_id=org_id,
@@ -668,12 +653,11 @@ class TestMemoryEdgeCases:
 
         assert merged == 0
 
-    @pytest.mark.asyncio
     async def test_consolidate_keeps_higher_quality(self, memory_service, mock_pool):
         """Test consolidation keeps memory with higher quality score."""
-        org_id = uuid4()
-        high_quality_id = uuid4()
-        low_quality_id = uuid4()
+        org_id = _uuid()
+        high_quality_id = _uuid()
+        low_quality_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.fetch = AsyncMock(return_value=[
@@ -687,7 +671,7 @@ class TestMemoryEdgeCases:
         ])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         merged = await memory_service.consolidate(
             org_id=org_id,
@@ -697,14 +681,13 @@ class TestMemoryEdgeCases:
 
         assert merged == 1
         # Verify the lower quality one was deleted
-        delete_call = mock_conn.execute.call_args[0]
-        assert "DELETE" in delete_call[0]
-        assert low_quality_id in delete_call
+        sql, *params = mock_conn.execute.call_args.args
+        assert "DELETE" in sql
+        assert low_quality_id in params
 
-    @pytest.mark.asyncio
     async def test_prune_old_with_invalid_max_age(self, memory_service, mock_pool):
         """Test prune_old rejects invalid max_age_days parameter."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         with pytest.raises(ValueError) as exc_info:
             await memory_service.prune_old(
@@ -715,10 +698,9 @@ class TestMemoryEdgeCases:
 
         assert "non-negative integer" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_prune_old_with_invalid_quality_threshold(self, memory_service, mock_pool):
         """Test prune_old rejects invalid quality_threshold parameter."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         with pytest.raises(ValueError) as exc_info:
             await memory_service.prune_old(
@@ -730,15 +712,14 @@ class TestMemoryEdgeCases:
 
         assert "between 0 and 1" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_prune_old_keeps_high_quality(self, memory_service, mock_pool):
         """Test prune keeps high quality memories when flag is set."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.execute = AsyncMock(return_value="DELETE 3")
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         deleted = await memory_service.prune_old(
             org_id=org_id,
@@ -750,18 +731,17 @@ class TestMemoryEdgeCases:
 
         assert deleted == 3
         # Verify quality filter was included
-        call_args = mock_conn.execute.call_args[0]
-        assert "quality_score" in call_args[0]
+        sql = mock_conn.execute.call_args.args[0]
+        assert "quality_score" in sql
 
-    @pytest.mark.asyncio
     async def test_prune_old_without_quality_filter(self, memory_service, mock_pool):
         """Test prune deletes all old memories when keep_high_quality=False."""
-        org_id = uuid4()
+        org_id = _uuid()
 
         mock_conn = AsyncMock()
         mock_conn.execute = AsyncMock(return_value="DELETE 10")
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         deleted = await memory_service.prune_old(
             org_id=org_id,
@@ -772,31 +752,16 @@ class TestMemoryEdgeCases:
 
         assert deleted == 10
 
-    @pytest.mark.asyncio
     async def test_search_increments_usage_count(self, memory_service, mock_pool, mock_embedder):
         """Test search increments usage_count for returned memories."""
-        org_id = uuid4()
-        memory_id = uuid4()
-        now = datetime.now(timezone.utc)
+        org_id = _uuid()
+        memory_id = _uuid()
 
         mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[
-            {
-                "id": memory_id,
-                "org_id": org_id,
-                "memory_type": "task",
-                "content": "Test",
-                "embedding": [0.1] * 1536,
-                "quality_score": 0.8,
-                "usage_count": 5,
-                "metadata": {},
-                "created_at": now,
-                "similarity": 0.9
-            }
-        ])
+        mock_conn.fetch = AsyncMock(return_value=[_make_row(memory_id, org_id)])
         mock_conn.execute = AsyncMock()
 
-        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+        _wire_conn(mock_pool, mock_conn)
 
         results = await memory_service.search(
             org_id=org_id,
@@ -805,6 +770,6 @@ class TestMemoryEdgeCases:
 
         assert len(results) == 1
         # Verify usage count was updated
-        update_call = mock_conn.execute.call_args[0]
-        assert "usage_count" in update_call[0]
-        assert memory_id in update_call
+        sql, *params = mock_conn.execute.call_args.args
+        assert "usage_count" in sql
+        assert memory_id in params
@@ -4,8 +4,8 @@ Unit Tests for Event Projections.
 Tests the projection system for transforming event streams into read models.
 """
 
+import asyncio
 import pytest
-import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, call
 from uuid import uuid4, UUID
@@ -153,8 +153,56 @@ class TestTaskProjection:
 
         assert call_args[4] == ""  # Empty description
         assert call_args[6] == "medium"  # Default priority
-        assert call_args[10] == []  # Empty tags
-        assert call_args[11] == "{}"  # Empty metadata as JSON
+        assert call_args[11] == []  # Empty tags
+        assert call_args[12] == {}  # Empty metadata passed to the jsonb codec
+
+    @pytest.mark.asyncio
+    async def test_handle_task_created_null_metadata(self, task_projection, mock_pool, sample_org_id, sample_user_id):
+        """Test TaskCreated with metadata None inserts an empty object, as rebuild does."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        event = self.create_event(
+            "TaskCreated",
+            {
+                "id": str(uuid4()),
+                "org_id": sample_org_id,
+                "title": "Test Task",
+                "created_by": sample_user_id,
+                "metadata": None
+            }
+        )
+
+        await task_projection.apply(event)
+
+        call_args = mock_conn.execute.call_args[0]
+        assert call_args[12] == {}
+
+    @pytest.mark.asyncio
+    async def test_handle_task_created_with_uuid_input(self, task_projection, mock_pool):
+        """Test TaskCreated accepts UUID objects as well as strings."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        task_id, org_id, user_id, project_id = uuid4(), uuid4(), uuid4(), uuid4()
+        event = self.create_event(
+            "TaskCreated",
+            {
+                "id": task_id,
+                "org_id": org_id,
+                "title": "UUID Task",
+                "project_id": project_id,
+                "created_by": user_id
+            }
+        )
+
+        await task_projection.apply(event)
+
+        call_args = mock_conn.execute.call_args[0]
+        assert call_args[1] is task_id
+        assert call_args[2] is org_id
+        assert call_args[7] is project_id
+        assert call_args[8] is user_id
 
     @pytest.mark.asyncio
     async def test_handle_task_updated(self, task_projection, mock_pool):
@@ -218,6 +266,24 @@ class TestTaskProjection:
         assert "updated_at = $2" in call_args[0]
         assert call_args[1] == "Just Title Update"
 
+    @pytest.mark.asyncio
+    async def test_handle_task_updated_reuses_statement_per_shape(self, task_projection, mock_pool):
+        """Test TaskUpdated events with the same fields send the same SQL text."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        for title in ("First", "Second"):
+            await task_projection.apply(
+                self.create_event("TaskUpdated", {"id": str(uuid4()), "title": title})
+            )
+        await task_projection.apply(
+            self.create_event("TaskUpdated", {"id": str(uuid4()), "priority": "low"})
+        )
+
+        first, second, other = (c[0][0] for c in mock_conn.execute.call_args_list)
+        assert first is second
+        assert other != first
+
     @pytest.mark.asyncio
     async def test_handle_task_updated_no_fields(self, task_projection, mock_pool):
         """Test handling TaskUpdated with no updateable fields does nothing."""
@@ -342,11 +408,10 @@ class TestTaskProjection:
 
         assert "UPDATE tasks_read_model" in call_args[0]
         assert "status = 'completed'" in call_args[0]
-        assert "metadata = metadata || $2" in call_args[0]
+        assert "metadata = COALESCE(metadata, '{}'::jsonb) || $2" in call_args[0]
 
         # Check metadata includes completion result
-        metadata_json = call_args[2]
-        metadata = json.loads(metadata_json)
+        metadata = call_args[2]
         assert metadata["completion_result"]["success"] is True
         assert metadata["completion_result"]["output"] == "Task completed successfully"
 
@@ -371,9 +436,7 @@ class TestTaskProjection:
         call_args = mock_conn.execute.call_args[0]
 
         # Check metadata includes empty result
-        metadata_json = call_args[2]
-        metadata = json.loads(metadata_json)
-        assert metadata["completion_result"] == {}
+        assert call_args[2] == {"completion_result": {}}
 
     @pytest.mark.asyncio
     async def test_handle_task_deleted(self, task_projection, mock_pool):
@@ -399,6 +462,14 @@ class TestTaskProjection:
         assert "WHERE id = $1" in call_args[0]
         assert call_args[1] == UUID(task_id)
 
+    def test_handlers_bound_at_init(self, task_projection):
+        """Test every handled event type resolves to a bound handler up front."""
+        assert task_projection._handlers.keys() == TaskProjection.EVENT_HANDLERS.keys()
+        for event_type, handler_name in TaskProjection.EVENT_HANDLERS.items():
+            handler = task_projection._handlers[event_type]
+            assert handler.__self__ is task_projection
+            assert handler.__name__ == handler_name
+
     @pytest.mark.asyncio
     async def test_apply_unknown_event_type(self, task_projection, mock_pool):
         """Test applying unknown event type does nothing."""
@@ -415,10 +486,84 @@ class TestTaskProjection:
         # Should not execute anything
         mock_conn.execute.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_apply_batch_groups_same_type_runs(self, task_projection, mock_pool, sample_org_id, sample_user_id):
+        """Test apply_batch sends each same-type run as one executemany."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        task_ids = [str(uuid4()) for _ in range(3)]
+        events = [
+            self.create_event(
+                "TaskCreated",
+                {
+                    "id": task_id,
+                    "org_id": sample_org_id,
+                    "title": "Batch Task",
+                    "created_by": sample_user_id
+                }
+            )
+            for task_id in task_ids
+        ] + [
+            self.create_event("TaskStatusChanged", {"id": task_id, "status": "in_progress"})
+            for task_id in task_ids
+        ]
+
+        await task_projection.apply_batch(events)
+
+        # One connection, one round trip per run
+        mock_pool.acquire.assert_called_once()
+        assert mock_conn.executemany.call_count == 2
+        mock_conn.execute.assert_not_called()
+
+        insert_call, status_call = mock_conn.executemany.call_args_list
+        assert "INSERT INTO tasks_read_model" in insert_call[0][0]
+        assert [args[0] for args in insert_call[0][1]] == [UUID(t) for t in task_ids]
+        assert "SET status = $1" in status_call[0][0]
+        assert [args[2] for args in status_call[0][1]] == [UUID(t) for t in task_ids]
+
+    @pytest.mark.asyncio
+    async def test_apply_batch_preserves_order_across_runs(self, task_projection, mock_pool):
+        """Test apply_batch keeps interleaved runs in event order."""
+        mock_conn = AsyncMock()
+        manager = MagicMock()
+        manager.attach_mock(mock_conn.execute, "execute")
+        manager.attach_mock(mock_conn.executemany, "executemany")
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        task_id = str(uuid4())
+        events = [
+            self.create_event("TaskStatusChanged", {"id": task_id, "status": "in_progress"}),
+            self.create_event("TaskUpdated", {"id": task_id, "title": "Renamed"}),
+            self.create_event("UnknownEvent", {"id": task_id}),
+            self.create_event("TaskDeleted", {"id": task_id}),
+        ]
+
+        await task_projection.apply_batch(events)
+
+        # TaskUpdated has a per-event SET list so it goes through execute;
+        # the unknown event is skipped
+        assert [c[0] for c in manager.mock_calls] == ["executemany", "execute", "executemany"]
+        assert "SET status = $1" in manager.mock_calls[0][1][0]
+        assert "title = $1" in manager.mock_calls[1][1][0]
+        assert "DELETE FROM tasks_read_model" in manager.mock_calls[2][1][0]
+
+    @pytest.mark.asyncio
+    async def test_apply_batch_empty(self, task_projection, mock_pool):
+        """Test apply_batch with no events writes nothing."""
+        mock_conn = AsyncMock()
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        await task_projection.apply_batch([])
+
+        mock_conn.execute.assert_not_called()
+        mock_conn.executemany.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_rebuild_projection(self, task_projection, mock_pool):
         """Test rebuilding projection from event stream."""
         mock_conn = AsyncMock()
+        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock())
         mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
 
         # Mock event store with sample events
@@ -460,13 +605,155 @@ class TestTaskProjection:
         truncate_call = mock_conn.execute.call_args_list[0]
         assert "TRUNCATE TABLE tasks_read_model" in truncate_call[0][0]
 
-        # Verify events were replayed (INSERT + UPDATE)
-        assert mock_conn.execute.call_count == 3  # TRUNCATE + 2 events
+        # Verify events were folded into one COPY instead of per-event writes
+        assert mock_conn.execute.call_count == 1  # TRUNCATE only
+        mock_conn.copy_records_to_table.assert_called_once()
+        copy_call = mock_conn.copy_records_to_table.call_args
+        assert copy_call[0][0] == "tasks_read_model"
+        columns = copy_call[1]["columns"]
+        (record,) = copy_call[1]["records"]
+        row = dict(zip(columns, record, strict=True))
+        assert row["id"] == UUID(task_id)
+        assert row["title"] == "Test Task"
+        assert row["status"] == "in_progress"
+        assert row["metadata"] == {}
+
+        # One connection and one transaction for the whole replay
+        assert mock_pool.acquire.call_count == 1
+        mock_conn.transaction.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_folds_task_lifecycle(self, task_projection, mock_pool, sample_org_id, sample_user_id):
+        """Test rebuild folds updates, completion and deletion before copying."""
+        mock_conn = AsyncMock()
+        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock())
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        kept_id = str(uuid4())
+        deleted_id = str(uuid4())
+        events = [
+            self.create_event(
+                "TaskCreated",
+                {
+                    "id": task_id,
+                    "org_id": sample_org_id,
+                    "title": "Task",
+                    "created_by": sample_user_id,
+                    "metadata": {"source": "test"}
+                }
+            )
+            for task_id in (kept_id, deleted_id)
+        ] + [
+            self.create_event("TaskUpdated", {"id": kept_id, "priority": "high"}),
+            self.create_event("TaskAssigned", {"id": kept_id, "agent_type": "implementer"}),
+            self.create_event("TaskCompleted", {"id": kept_id, "result": {"ok": True}}),
+            self.create_event("TaskDeleted", {"id": deleted_id}),
+        ]
+
+        async def async_event_iterator():
+            for event in events:
+                yield event
+
+        mock_event_store = AsyncMock(spec=EventStore)
+        mock_event_store.read_all = MagicMock(return_value=async_event_iterator())
+
+        await task_projection.rebuild(mock_event_store)
+
+        copy_call = mock_conn.copy_records_to_table.call_args
+        (record,) = copy_call[1]["records"]
+        row = dict(zip(copy_call[1]["columns"], record, strict=True))
+        assert row["id"] == UUID(kept_id)
+        assert row["priority"] == "high"
+        assert row["assigned_agent"] == "implementer"
+        assert row["status"] == "completed"
+        assert row["metadata"] == {
+            "source": "test",
+            "completion_result": {"ok": True}
+        }
+
+    @pytest.mark.asyncio
+    async def test_rebuild_falls_back_on_unknown_task(self, task_projection, mock_pool, sample_org_id, sample_user_id):
+        """Test rebuild copies folded tasks then replays per event on an unknown id."""
+        mock_conn = AsyncMock()
+        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock())
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        task_id = str(uuid4())
+        events = [
+            self.create_event(
+                "TaskCreated",
+                {
+                    "id": task_id,
+                    "org_id": sample_org_id,
+                    "title": "Test Task",
+                    "created_by": sample_user_id
+                }
+            ),
+            self.create_event("TaskStatusChanged", {"id": str(uuid4()), "status": "in_progress"}),
+            self.create_event("TaskDeleted", {"id": task_id}),
+        ]
+
+        async def async_event_iterator():
+            for event in events:
+                yield event
+
+        mock_event_store = AsyncMock(spec=EventStore)
+        mock_event_store.read_all = MagicMock(return_value=async_event_iterator())
+
+        await task_projection.rebuild(mock_event_store)
+
+        # The task created before the unknown id is copied once
+        mock_conn.copy_records_to_table.assert_called_once()
+        (record,) = mock_conn.copy_records_to_table.call_args[1]["records"]
+        assert record[0] == UUID(task_id)
+
+        # TRUNCATE, then the remaining two events one at a time
+        assert mock_conn.execute.call_count == 3
+        assert "SET status = $1" in mock_conn.execute.call_args_list[1][0][0]
+        assert "DELETE FROM tasks_read_model" in mock_conn.execute.call_args_list[2][0][0]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_task_created_null_metadata(self, task_projection, mock_pool, sample_org_id, sample_user_id):
+        """Test rebuild folds a TaskCreated event whose metadata is None."""
+        mock_conn = AsyncMock()
+        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock())
+        mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
+
+        task_id = str(uuid4())
+        events = [
+            self.create_event(
+                "TaskCreated",
+                {
+                    "id": task_id,
+                    "org_id": sample_org_id,
+                    "title": "Test Task",
+                    "created_by": sample_user_id,
+                    "metadata": None
+                }
+            ),
+            self.create_event("TaskCompleted", {"id": task_id}),
+        ]
+
+        async def async_event_iterator():
+            for event in events:
+                yield event
+
+        mock_event_store = AsyncMock(spec=EventStore)
+        mock_event_store.read_all = MagicMock(return_value=async_event_iterator())
+
+        await task_projection.rebuild(mock_event_store)
+
+        copy_call = mock_conn.copy_records_to_table.call_args
+        (record,) = copy_call[1]["records"]
+        row = dict(zip(copy_call[1]["columns"], record, strict=True))
+        assert row["status"] == "completed"
+        assert row["metadata"] == {"completion_result": {}}
 
     @pytest.mark.asyncio
     async def test_rebuild_empty_event_stream(self, task_projection, mock_pool):
         """Test rebuilding with no events."""
         mock_conn = AsyncMock()
+        mock_conn.transaction = MagicMock(return_value=AsyncContextManagerMock())
         mock_pool.acquire.return_value = AsyncContextManagerMock(mock_conn)
 
         # Mock event store with no events
@@ -482,6 +769,7 @@ class TestTaskProjection:
 
         # Verify only TRUNCATE was called
         assert mock_conn.execute.call_count == 1
+        mock_conn.copy_records_to_table.assert_not_called()
         truncate_call = mock_conn.execute.call_args_list[0]
         assert "TRUNCATE TABLE tasks_read_model" in truncate_call[0][0]
 
@@ -549,6 +837,64 @@ class TestProjectionManager:
         mock_projection1.apply.assert_called_once_with(event)
         mock_projection2.apply.assert_called_once_with(event)
 
+    @pytest.mark.asyncio
+    async def test_apply_event_runs_projections_concurrently(self, projection_manager):
+        """Test projections are applied concurrently rather than in sequence."""
+        # Neither projection can return until both have started; run in
+        # sequence, the first would wait on the barrier forever
+        barrier = asyncio.Barrier(2)
+
+        async def apply_at_barrier(event):
+            await barrier.wait()
+
+        for _ in range(2):
+            projection = AsyncMock(spec=Projection)
+            projection.apply.side_effect = apply_at_barrier
+            projection_manager.register(projection)
+
+        event = Event(
+            id=1,
+            stream_id="task-123",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data={"id": str(uuid4())},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        await asyncio.wait_for(projection_manager.apply_event(event), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_apply_event_failure_waits_for_other_projections(self, projection_manager):
+        """Test a failing projection does not cut short the others."""
+        finished = []
+
+        async def slow_apply(event):
+            await asyncio.sleep(0.01)
+            finished.append(event)
+
+        failing = AsyncMock(spec=Projection)
+        failing.apply.side_effect = RuntimeError("projection failed")
+        slow = AsyncMock(spec=Projection)
+        slow.apply.side_effect = slow_apply
+        projection_manager.register(failing)
+        projection_manager.register(slow)
+
+        event = Event(
+            id=1,
+            stream_id="task-123",
+            stream_version=0,
+            event_type="TaskCreated",
+            event_data={},
+            metadata={},
+            created_at=datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(RuntimeError, match="projection failed"):
+            await projection_manager.apply_event(event)
+
+        assert finished == [event]
+
     @pytest.mark.asyncio
     async def test_apply_event_no_projections(self, projection_manager):
         """Test applying event with no registered projections."""
@@ -565,6 +911,34 @@ class TestProjectionManager:
         # Should not raise
         await projection_manager.apply_event(event)
 
+    @pytest.mark.asyncio
+    async def test_apply_events_to_projections(self, projection_manager):
+        """Test applying a batch of events to all registered projections."""
+        mock_projection1 = AsyncMock(spec=Projection)
+        mock_projection2 = AsyncMock(spec=Projection)
+
+        projection_manager.register(mock_projection1)
+        projection_manager.register(mock_projection2)
+
+        events = [
+            Event(
+                id=i,
+                stream_id="task-123",
+                stream_version=i,
+                event_type="TaskCreated",
+                event_data={"id": str(uuid4())},
+                metadata={},
+                created_at=datetime.now(timezone.utc)
+            )
+            for i in range(3)
+        ]
+
+        await projection_manager.apply_events(events)
+
+        mock_projection1.apply_batch.assert_called_once_with(events)
+        mock_projection2.apply_batch.assert_called_once_with(events)
+        mock_projection1.apply.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_rebuild_all_projections(self, projection_manager, mock_event_store):
         """Test rebuilding all registered projections."""